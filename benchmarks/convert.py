@@ -0,0 +1,243 @@
+"""Micro-benchmark converting upstream rows to response models.
+
+Times the converters the tools use on rows shaped like oinker's results,
+against validating the same values through the model constructor, and
+against the serialization FastMCP then applies to the whole list. Runs in
+process without the fake API.
+
+Usage::
+
+    python -m benchmarks.convert --rows 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from oinker.dns import DNSRecordResponse
+from oinker.domains import DomainInfo as OinkerDomainInfo
+from pydantic import BaseModel, TypeAdapter
+
+from benchmarks import harness
+from porkbun_mcp.models import DNSRecord, DomainInfo, PartialDNSRecord, TLDPricing
+from porkbun_mcp.pricing_index import PriceEntry
+from porkbun_mcp.tools.dns import _project, _to_dns_record
+from porkbun_mcp.tools.domains import _to_domain_info
+from porkbun_mcp.tools.pricing import _to_tld_pricing
+
+
+@dataclass(frozen=True)
+class Conversion:
+    """One converter and the validating construction it is compared with.
+
+    Attributes:
+        name: Conversion name.
+        adapter: Validates and serializes a list of the response model.
+        rows: Builds ``n`` upstream rows.
+        convert: Converts a list of rows as the tools do.
+        validated: Converts a list of rows through model validation.
+    """
+
+    name: str
+    adapter: TypeAdapter[Any]
+    rows: Callable[[int], list[Any]]
+    convert: Callable[[list[Any]], Sequence[BaseModel]]
+    validated: Callable[[list[Any]], Sequence[BaseModel]]
+
+
+def _records(n: int) -> list[DNSRecordResponse]:
+    return [
+        DNSRecordResponse(
+            id=str(100_000 + i),
+            name=f"host{i}.example.com",
+            record_type="A",
+            content=f"192.0.2.{i % 256}",
+            ttl=600,
+            priority=0,
+            notes="",
+        )
+        for i in range(n)
+    ]
+
+
+def _domains(n: int) -> list[OinkerDomainInfo]:
+    created = datetime(2020, 1, 1, tzinfo=UTC)
+    return [
+        OinkerDomainInfo(
+            domain=f"domain{i}.com",
+            status="ACTIVE",
+            tld="com",
+            create_date=created,
+            expire_date=created,
+            security_lock=True,
+            whois_privacy=True,
+            auto_renew=bool(i % 2),
+            not_local=False,
+            labels=(),
+        )
+        for i in range(n)
+    ]
+
+
+def _prices(n: int) -> list[PriceEntry]:
+    return [PriceEntry.create(f"tld{i}", "9.73", "10.73", "9.73") for i in range(n)]
+
+
+def _validated_records(rows: list[Any]) -> list[BaseModel]:
+    return [
+        DNSRecord(
+            id=r.id,
+            type=r.record_type,
+            name=r.name,
+            content=r.content,
+            ttl=r.ttl,
+            priority=r.priority,
+            notes=r.notes,
+        )
+        for r in rows
+    ]
+
+
+def _validated_domains(rows: list[Any]) -> list[BaseModel]:
+    return [
+        DomainInfo(
+            domain=d.domain,
+            status=d.status,
+            tld=d.tld,
+            create_date=d.create_date.isoformat() if d.create_date else None,
+            expire_date=d.expire_date.isoformat() if d.expire_date else None,
+            security_lock=d.security_lock,
+            whois_privacy=d.whois_privacy,
+            auto_renew=d.auto_renew,
+        )
+        for d in rows
+    ]
+
+
+CONVERSIONS = {
+    c.name: c
+    for c in (
+        Conversion(
+            "dns_record",
+            TypeAdapter(list[DNSRecord]),
+            _records,
+            lambda rows: [_to_dns_record(r) for r in rows],
+            _validated_records,
+        ),
+        Conversion(
+            "dns_record_fields",
+            TypeAdapter(list[PartialDNSRecord]),
+            _records,
+            lambda rows: _project(rows, ["name", "content"]),
+            lambda rows: [
+                PartialDNSRecord(**{f: getattr(r, f) for f in ("name", "content")}) for r in rows
+            ],
+        ),
+        Conversion(
+            "domain_info",
+            TypeAdapter(list[DomainInfo]),
+            _domains,
+            lambda rows: [_to_domain_info(d) for d in rows],
+            _validated_domains,
+        ),
+        Conversion(
+            "tld_pricing",
+            TypeAdapter(list[TLDPricing]),
+            _prices,
+            lambda rows: [_to_tld_pricing(e) for e in rows],
+            lambda rows: [
+                TLDPricing(
+                    tld=e.tld, registration=e.registration, renewal=e.renewal, transfer=e.transfer
+                )
+                for e in rows
+            ],
+        ),
+    )
+}
+
+
+def _best(fn: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def measure(conversion: Conversion, rows: int, repeat: int) -> dict[str, Any]:
+    """Time one conversion; every time is the best of ``repeat`` runs, in seconds."""
+    data = conversion.rows(rows)
+    converted = conversion.convert(data)
+    if [m.model_dump_json() for m in converted] != [
+        m.model_dump_json() for m in conversion.validated(data)
+    ]:
+        raise AssertionError(f"{conversion.name}: converted and validated output differ")
+    adapter = conversion.adapter
+    result = {
+        "conversion": conversion.name,
+        "rows": rows,
+        "validated_seconds": _best(lambda: conversion.validated(data), repeat),
+        "converted_seconds": _best(lambda: conversion.convert(data), repeat),
+        # What FastMCP does with the returned list, for scale.
+        "serialize_seconds": _best(lambda: adapter.dump_python(converted, mode="json"), repeat),
+    }
+    result["speedup"] = result["validated_seconds"] / result["converted_seconds"]
+    return result
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Measure every conversion and return the report."""
+    results = []
+    for name in args.conversions.split(","):
+        result = measure(CONVERSIONS[name], args.rows, args.repeat)
+        results.append(result)
+        print(
+            f"{name:<18} validated {result['validated_seconds'] * 1000:>7.2f}ms  "
+            f"converted {result['converted_seconds'] * 1000:>7.2f}ms  "
+            f"x{result['speedup']:.1f}  "
+            f"serialize {result['serialize_seconds'] * 1000:>7.2f}ms",
+            file=sys.stderr,
+        )
+    return {
+        "version": harness.version(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {"rows": args.rows, "repeat": args.repeat},
+        "results": results,
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--conversions",
+        default=",".join(CONVERSIONS),
+        help=f"Comma-separated conversions (default: all of {', '.join(CONVERSIONS)})",
+    )
+    parser.add_argument("--rows", type=int, default=10_000, help="Rows per conversion")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per timing; best is kept")
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+    unknown = set(args.conversions.split(",")) - set(CONVERSIONS)
+    if unknown:
+        parser.error(f"unknown conversions: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    args = _parse_args(argv)
+    text = json.dumps(run(args), indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Local fake of the Porkbun API that benchmarks point the server at.
+
+Only the endpoints the benchmark scenarios use are implemented. Every
+response is delayed by a configurable latency, a fraction of requests can be
+made to fail, and a server-side rate limit answers 429 like Porkbun does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+DOMAIN_PAGE_SIZE = 1000
+_RECORD_TYPES = ("A", "AAAA", "CNAME", "MX", "TXT")
+
+
+@dataclass
+class FakeConfig:
+    """Behaviour of the fake API.
+
+    Attributes:
+        domains: Domains in the fake account.
+        records: DNS records per domain.
+        acme_records: Extra ``_acme-challenge`` TXT records per domain, as left
+            behind by ACME clients; they share one name.
+        tlds: TLDs returned by the pricing endpoint.
+        latency: Seconds every request is delayed.
+        jitter: Extra random delay of up to this many seconds.
+        error_rate: Fraction of requests that fail with HTTP 500.
+        rate_limit: Requests per second before answering 429 (0 disables it).
+        seed: Seed for generated data, jitter and injected errors.
+    """
+
+    domains: int = 10
+    records: int = 200
+    acme_records: int = 0
+    tlds: int = 500
+    latency: float = 0.02
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit: float = 0.0
+    seed: int = 0
+
+
+def domain_name(i: int) -> str:
+    """Name of the i-th fake domain."""
+    return f"bench{i}.example"
+
+
+class FakePorkbun:
+    """In-memory Porkbun account served as an ASGI app.
+
+    Attributes:
+        config: Fake API behaviour.
+        zones: Records by domain, then by record ID.
+        requests: Requests received, by endpoint.
+        errors: Injected failures, by endpoint.
+        throttled: Requests answered with 429.
+        app: The ASGI application.
+    """
+
+    def __init__(self, config: FakeConfig | None = None) -> None:
+        self.config = config or FakeConfig()
+        self._random = random.Random(self.config.seed)
+        self._ids = itertools.count(100_000_000)
+        self.zones = {
+            domain_name(i): self._zone(domain_name(i)) for i in range(self.config.domains)
+        }
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.throttled = 0
+        self._window = (0, 0)
+        self._routes = [
+            (re.compile(pattern), handler)
+            for pattern, handler in (
+                (r"ping", self._ping),
+                (r"dns/retrieve/(?P<domain>[^/]+)(?:/(?P<id>[^/]+))?", self._retrieve),
+                (
+                    r"dns/retrieveByNameType/(?P<domain>[^/]+)/(?P<type>[^/]+)(?:/(?P<sub>[^/]+))?",
+                    self._retrieve_by_name_type,
+                ),
+                (r"dns/create/(?P<domain>[^/]+)", self._create),
+                (r"dns/edit/(?P<domain>[^/]+)/(?P<id>[^/]+)", self._edit),
+                (r"dns/delete/(?P<domain>[^/]+)/(?P<id>[^/]+)", self._delete),
+                (r"domain/listAll", self._list_domains),
+                (r"domain/getNs/(?P<domain>[^/]+)", self._nameservers),
+                (r"pricing/get", self._pricing),
+            )
+        ]
+        self.app = Starlette(
+            routes=[
+                Route("/_stats", self._stats, methods=["GET"]),
+                Route("/{path:path}", self._dispatch, methods=["POST"]),
+            ]
+        )
+
+    async def _stats(self, request: Request) -> JSONResponse:
+        return JSONResponse(
+            {
+                "requests": dict(self.requests),
+                "errors": dict(self.errors),
+                "throttled": self.throttled,
+            }
+        )
+
+    def _zone(self, domain: str) -> dict[str, dict[str, str]]:
+        zone = {}
+        for j in range(self.config.records):
+            record_type = _RECORD_TYPES[j % len(_RECORD_TYPES)]
+            record = self._record(domain, f"host{j}", record_type, self._content(record_type, j))
+            zone[record["id"]] = record
+        for _ in range(self.config.acme_records):
+            token = self._random.randbytes(32).hex()[:43]
+            record = self._record(domain, "_acme-challenge", "TXT", token, "120")
+            zone[record["id"]] = record
+        return zone
+
+    def _record(
+        self, domain: str, name: str, record_type: str, content: str, ttl: str = "600"
+    ) -> dict[str, str]:
+        return {
+            "id": str(next(self._ids)),
+            "name": f"{name}.{domain}" if name else domain,
+            "type": record_type,
+            "content": content,
+            "ttl": ttl,
+            "prio": "10" if record_type == "MX" else "0",
+            "notes": "",
+        }
+
+    @staticmethod
+    def _content(record_type: str, j: int) -> str:
+        match record_type:
+            case "A":
+                return f"192.0.2.{j % 256}"
+            case "AAAA":
+                return f"2001:db8::{j:x}"
+            case "CNAME" | "MX":
+                return f"target{j}.example.net"
+            case _:
+                return f"v=spf1 include:_spf{j}.example.net ~all"
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> None:
+        """Serve the fake API until the process is stopped."""
+        import uvicorn
+
+        uvicorn.run(self.app, host=host, port=port, log_level="warning")
+
+    async def _dispatch(self, request: Request) -> JSONResponse:
+        path = request.path_params["path"].removeprefix("api/json/v3/").strip("/")
+        for pattern, handler in self._routes:  # noqa: B007 - used after the loop
+            match = pattern.fullmatch(path)
+            if match:
+                break
+        else:
+            return JSONResponse({"status": "ERROR", "message": "Invalid endpoint"}, 404)
+        endpoint = pattern.pattern.split("/(")[0]
+        self.requests[endpoint] += 1
+
+        delay = self.config.latency + self._random.uniform(0, self.config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self._throttle():
+            self.throttled += 1
+            return JSONResponse(
+                {"status": "ERROR", "message": "Rate limit exceeded"},
+                429,
+                headers={"Retry-After": "1"},
+            )
+        if self._random.random() < self.config.error_rate:
+            self.errors[endpoint] += 1
+            return JSONResponse({"status": "ERROR", "message": "Internal server error"}, 500)
+
+        body = await request.json() if await request.body() else {}
+        params = {k: v for k, v in match.groupdict().items() if v is not None}
+        domain = params.get("domain")
+        if domain is not None and domain not in self.zones:
+            return JSONResponse({"status": "ERROR", "message": "Domain not found"})
+        return JSONResponse({"status": "SUCCESS", **handler(body, **params)})
+
+    def _throttle(self) -> bool:
+        if not self.config.rate_limit:
+            return False
+        second = int(time.monotonic())
+        start, count = self._window
+        if start != second:
+            start, count = second, 0
+        self._window = (start, count + 1)
+        return count >= self.config.rate_limit
+
+    def _ping(self, body: dict[str, Any]) -> dict[str, Any]:
+        return {"yourIp": "127.0.0.1"}
+
+    def _retrieve(self, body: dict[str, Any], domain: str, id: str | None = None) -> dict[str, Any]:
+        zone = self.zones[domain]
+        if id is None:
+            return {"records": list(zone.values())}
+        return {"records": [zone[id]] if id in zone else []}
+
+    def _retrieve_by_name_type(
+        self, body: dict[str, Any], domain: str, type: str, sub: str | None = None
+    ) -> dict[str, Any]:
+        name = f"{sub}.{domain}" if sub else domain
+        zone = self.zones[domain].values()
+        return {"records": [r for r in zone if r["name"] == name and r["type"] == type]}
+
+    def _create(self, body: dict[str, Any], domain: str) -> dict[str, Any]:
+        record = self._record(
+            domain,
+            body.get("name", ""),
+            body["type"],
+            body["content"],
+            str(body.get("ttl", 600)),
+        )
+        self.zones[domain][record["id"]] = record
+        return {"id": int(record["id"])}
+
+    def _edit(self, body: dict[str, Any], domain: str, id: str) -> dict[str, Any]:
+        record = self.zones[domain][id]
+        name = body.get("name", "")
+        record.update(
+            name=f"{name}.{domain}" if name else domain,
+            type=body["type"],
+            content=body["content"],
+            ttl=str(body.get("ttl", record["ttl"])),
+        )
+        return {}
+
+    def _delete(self, body: dict[str, Any], domain: str, id: str) -> dict[str, Any]:
+        self.zones[domain].pop(id, None)
+        return {}
+
+    def _list_domains(self, body: dict[str, Any]) -> dict[str, Any]:
+        start = int(body.get("start", 0))
+        names = list(self.zones)[start : start + DOMAIN_PAGE_SIZE]
+        return {
+            "domains": [
+                {
+                    "domain": name,
+                    "status": "ACTIVE",
+                    "tld": name.rsplit(".", 1)[-1],
+                    "createDate": "2020-01-01 00:00:00",
+                    "expireDate": "2030-01-01 00:00:00",
+                    "securityLock": "1",
+                    "whoisPrivacy": "1",
+                    "autoRenew": 1,
+                    "notLocal": 0,
+                }
+                for name in names
+            ]
+        }
+
+    def _nameservers(self, body: dict[str, Any], domain: str) -> dict[str, Any]:
+        return {"ns": ["curitiba.ns.porkbun.com", "fortaleza.ns.porkbun.com"]}
+
+    def _pricing(self, body: dict[str, Any]) -> dict[str, Any]:
+        prices = {}
+        for i in range(self.config.tlds):
+            price = f"{5 + i % 50}.{i % 100:02d}"
+            prices[f"tld{i}"] = {"registration": price, "renewal": price, "transfer": price}
+        return {"pricing": prices}
@@ -0,0 +1,196 @@
+"""Processes and helpers shared by the benchmark and load-test drivers."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import tempfile
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.fake_porkbun import FakeConfig, FakePorkbun
+
+
+def free_port() -> int:
+    """Return a TCP port on localhost that is currently free."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    """Block until something accepts connections on a localhost port."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+        else:
+            return
+
+
+def rss_bytes(pid: int, field: str = "VmRSS") -> int | None:
+    """Resident set size of a process (Linux only).
+
+    Args:
+        pid: Process ID.
+        field: ``VmRSS`` for the current size, ``VmHWM`` for the peak so far.
+    """
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1]) * 1024
+    return None
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    index = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def version() -> str:
+    """Installed porkbun-mcp version, or ``"unknown"`` when run from a checkout."""
+    try:
+        return metadata.version("porkbun-mcp")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def add_fake_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that configure the fake API and the server under test."""
+    defaults = FakeConfig()
+    group = parser.add_argument_group("fake API")
+    group.add_argument("--domains", type=int, default=defaults.domains)
+    group.add_argument("--records", type=int, default=defaults.records, help="Records per zone")
+    group.add_argument(
+        "--acme-records",
+        type=int,
+        default=defaults.acme_records,
+        help="Extra _acme-challenge TXT records per zone",
+    )
+    group.add_argument("--tlds", type=int, default=defaults.tlds)
+    group.add_argument("--latency", type=float, default=defaults.latency, help="Seconds")
+    group.add_argument("--jitter", type=float, default=defaults.jitter, help="Seconds")
+    group.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    group.add_argument(
+        "--rate-limit",
+        type=float,
+        default=defaults.rate_limit,
+        help="Fake API requests per second before 429 (0: unlimited)",
+    )
+    group.add_argument("--seed", type=int, default=defaults.seed)
+    group = parser.add_argument_group("server")
+    group.add_argument(
+        "--client-rate-limits",
+        action="store_true",
+        help="Keep the server's own rate limits instead of disabling them",
+    )
+    group.add_argument(
+        "--zone-cache-ttl", type=float, default=None, help="Override PORKBUN_ZONE_CACHE_TTL"
+    )
+
+
+def fake_config(args: argparse.Namespace) -> FakeConfig:
+    """Fake API behaviour from the options added by ``add_fake_arguments``."""
+    return FakeConfig(
+        domains=args.domains,
+        records=args.records,
+        acme_records=args.acme_records,
+        tlds=args.tlds,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+
+
+def configure_env(args: argparse.Namespace, fake_url: str, state: Path) -> None:
+    """Point the server at the fake API; subprocesses inherit the environment."""
+    os.environ.update(
+        PORKBUN_API_KEY="pk1_benchmark",
+        PORKBUN_SECRET_KEY="sk1_benchmark",
+        PORKBUN_API_BASE_URL=f"{fake_url}/api/json/v3",
+        PORKBUN_PRICING_CACHE_PATH=str(state / "pricing.json"),
+        PORKBUN_JOURNAL_DIR=str(state / "journal"),
+    )
+    if not args.client_rate_limits:
+        for name in ("GENERAL", "CHECK", "WRITE"):
+            os.environ[f"PORKBUN_RATE_LIMIT_{name}"] = "0"
+    if args.zone_cache_ttl is not None:
+        os.environ["PORKBUN_ZONE_CACHE_TTL"] = str(args.zone_cache_ttl)
+
+
+@asynccontextmanager
+async def serve(target: Callable[..., None], *args: Any) -> AsyncIterator[tuple[int, int]]:
+    """Run ``target(*args, port)`` in a fresh process until the block exits.
+
+    Yields:
+        The port the process listens on and its PID.
+    """
+    port = free_port()
+    process = multiprocessing.get_context("spawn").Process(
+        target=target, args=(*args, port), daemon=True
+    )
+    process.start()
+    try:
+        await asyncio.to_thread(wait_for_port, port)
+        assert process.pid is not None
+        yield port, process.pid
+    finally:
+        process.terminate()
+        process.join()
+
+
+def serve_fake(config: FakeConfig, port: int) -> None:
+    """Process target serving the fake Porkbun API."""
+    FakePorkbun(config).serve(port)
+
+
+def serve_mcp(port: int) -> None:
+    """Process target serving porkbun-mcp over streamable HTTP, as deployed."""
+    from porkbun_mcp.server import create_server
+
+    create_server(get_muddy=True).run(
+        transport="streamable-http",
+        host="127.0.0.1",
+        port=port,
+        show_banner=False,
+        log_level="warning",
+    )
+
+
+@asynccontextmanager
+async def fake_api(args: argparse.Namespace) -> AsyncIterator[str]:
+    """Run the fake API and configure the environment for servers started inside the block.
+
+    Yields:
+        Base URL of the fake API.
+    """
+    async with serve(serve_fake, fake_config(args)) as (port, _):
+        fake_url = f"http://127.0.0.1:{port}"
+        with tempfile.TemporaryDirectory(prefix="porkbun-bench-") as state:
+            configure_env(args, fake_url, Path(state))
+            yield fake_url
+
+
+async def upstream_requests(fake: httpx.AsyncClient) -> int:
+    """Requests the fake API has received so far, asked with a client based at its URL."""
+    stats = (await fake.get("/_stats")).json()
+    return sum(stats["requests"].values())
@@ -0,0 +1,362 @@
+"""Load-test one streamable-HTTP server with many concurrent MCP sessions.
+
+The server is built with ``create_server`` and served over streamable HTTP in
+its own process, exactly as ``porkbun-mcp --transport streamable-http`` runs,
+against the fake Porkbun API. The load ramps through steps of concurrent
+sessions; each session replays a weighted mix of tool calls back to back.
+
+Every step records throughput, latency percentiles, the server's event-loop
+lag and queueing delay, and the run reports the step where throughput stops
+growing: the saturation point.
+
+Usage::
+
+    python -m benchmarks.load --sessions 1,4,16,64 --duration 10
+    python -m benchmarks.load --mix dns_list=60,dns_search=20,dns_create=20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from contextlib import AsyncExitStack
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastmcp import Client
+
+from benchmarks import harness
+from benchmarks.fake_porkbun import FakeConfig
+from benchmarks.run import SCENARIOS
+
+# 80% reads, 20% writes.
+DEFAULT_MIX = "dns_list=40,dns_get_by_name_type=30,dns_search=10,dns_create=20"
+
+_METRIC_LINE = re.compile(r"^(?P<name>[a-z_]+)(?:\{[^}]*\})? (?P<value>\S+)$")
+
+
+class LagProbe:
+    """Measures how late the event loop wakes up a task that sleeps at a fixed interval.
+
+    Lag is time the loop spent running other callbacks, so it directly delays
+    every request the server is handling.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+
+    async def run(self) -> None:
+        """Sample until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start - self.interval))
+
+    def drain(self) -> dict[str, float | int]:
+        """Summarise and discard the samples taken since the last call."""
+        samples, self.samples = sorted(self.samples), []
+        if not samples:
+            return {"samples": 0}
+        return {
+            "samples": len(samples),
+            "mean": sum(samples) / len(samples),
+            "p99": harness.percentile(samples, 99),
+            "max": samples[-1],
+        }
+
+
+def _serve_probed(interval: float, port: int) -> None:
+    """Process target: the deployed server plus an event-loop lag probe."""
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+
+    from porkbun_mcp.server import create_server
+
+    server = create_server(get_muddy=True)
+    probe = LagProbe(interval)
+
+    @server.custom_route("/_load/lag", methods=["GET"])
+    async def lag(request: Request) -> JSONResponse:
+        return JSONResponse(probe.drain())
+
+    async def main() -> None:
+        task = asyncio.create_task(probe.run())
+        try:
+            await server.run_http_async(
+                transport="streamable-http",
+                host="127.0.0.1",
+                port=port,
+                show_banner=False,
+                log_level="warning",
+            )
+        finally:
+            task.cancel()
+
+    asyncio.run(main())
+
+
+async def _scrape(server: httpx.AsyncClient) -> dict[str, float]:
+    """Sum the server's tool-duration and rate-limit-wait histograms over all labels."""
+    totals: dict[str, float] = defaultdict(float)
+    for line in (await server.get("/metrics")).text.splitlines():
+        match = _METRIC_LINE.match(line)
+        if match and match["name"].endswith(("_sum", "_count")):
+            totals[match["name"]] += float(match["value"])
+    return totals
+
+
+def _delta_mean(before: dict[str, float], after: dict[str, float], metric: str) -> float | None:
+    count = after[f"{metric}_count"] - before[f"{metric}_count"]
+    if not count:
+        return None
+    return (after[f"{metric}_sum"] - before[f"{metric}_sum"]) / count
+
+
+def _summary(latencies: list[float]) -> dict[str, float]:
+    ordered = sorted(latencies)
+    if not ordered:
+        return {}
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p50": harness.percentile(ordered, 50),
+        "p99": harness.percentile(ordered, 99),
+        "max": ordered[-1],
+    }
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """Parse ``scenario=weight,...`` into weights by scenario.
+
+    Raises:
+        ValueError: For an unknown scenario or a weight that is not a positive number.
+    """
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"unknown scenario {name!r}")
+        mix[name] = float(weight or 1)
+        if mix[name] <= 0:
+            raise ValueError(f"weight of {name!r} must be positive")
+    return mix
+
+
+async def _step(
+    url: str,
+    server: httpx.AsyncClient,
+    fake: httpx.AsyncClient,
+    sessions: int,
+    args: argparse.Namespace,
+    config: FakeConfig,
+    rng: random.Random,
+) -> dict[str, Any]:
+    """Run one load step with ``sessions`` concurrent sessions for ``args.duration`` seconds."""
+    names = list(args.mix)
+    weights = list(args.mix.values())
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    counter = iter(range(sys.maxsize))
+
+    async with AsyncExitStack() as stack:
+        start = time.perf_counter()
+        clients = [
+            await stack.enter_async_context(Client(url, timeout=120)) for _ in range(sessions)
+        ]
+        connect = time.perf_counter() - start
+
+        async def session(client: Client) -> None:
+            while time.perf_counter() < deadline:
+                scenario = SCENARIOS[rng.choices(names, weights)[0]]
+                call_start = time.perf_counter()
+                result = await client.call_tool(
+                    scenario.tool, scenario.args(next(counter), config), raise_on_error=False
+                )
+                latencies[scenario.name].append(time.perf_counter() - call_start)
+                errors[scenario.name] += result.is_error
+
+        metrics_before = await _scrape(server)
+        upstream_before = await harness.upstream_requests(fake)
+        await server.get("/_load/lag")
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(session(c) for c in clients))
+        wall = time.perf_counter() - start
+        lag = (await server.get("/_load/lag")).json()
+        metrics_after = await _scrape(server)
+        upstream = await harness.upstream_requests(fake) - upstream_before
+
+    everything = [x for values in latencies.values() for x in values]
+    calls = len(everything)
+    latency = _summary(everything)
+    tool_time = _delta_mean(metrics_before, metrics_after, "porkbun_mcp_tool_duration_seconds")
+    return {
+        "sessions": sessions,
+        "connect_seconds": connect,
+        "duration": wall,
+        "calls": calls,
+        "errors": sum(errors.values()),
+        "throughput": calls / wall,
+        "latency": latency,
+        "tools": {
+            name: {"calls": len(values), "errors": errors[name], **_summary(values)}
+            for name, values in sorted(latencies.items())
+        },
+        "event_loop_lag": lag,
+        "server_tool_seconds_mean": tool_time,
+        # Time a call spends outside the tool body: transport, session
+        # handling and waiting for the event loop.
+        "queue_delay_mean": None if tool_time is None else latency["mean"] - tool_time,
+        "rate_limit_wait_mean": _delta_mean(
+            metrics_before, metrics_after, "porkbun_mcp_rate_limit_wait_seconds"
+        ),
+        "upstream_requests": upstream,
+    }
+
+
+def saturation(
+    steps: list[dict[str, Any]], min_gain: float, max_error_rate: float
+) -> dict[str, Any] | None:
+    """Find the last step before more sessions stopped paying off.
+
+    A step saturates the server when its throughput grew by less than
+    ``min_gain`` over the previous step, or when more than ``max_error_rate``
+    of its calls failed.
+
+    Returns:
+        The sessions and throughput of the last step before saturation and
+        why the next one saturated, or None if no step did.
+    """
+    previous = None
+    for step in steps:
+        failed = step["errors"] / step["calls"] > max_error_rate if step["calls"] else True
+        stalled = previous is not None and (
+            step["throughput"] < previous["throughput"] * (1 + min_gain)
+        )
+        if failed or stalled:
+            last = previous or step
+            return {
+                "sessions": last["sessions"],
+                "throughput": last["throughput"],
+                "reason": "errors" if failed else "throughput",
+                "at_sessions": step["sessions"],
+            }
+        previous = step
+    return None
+
+
+def _print_step(step: dict[str, Any]) -> None:
+    latency = step["latency"]
+    lag = step["event_loop_lag"]
+    queue = step["queue_delay_mean"]
+    print(
+        f"sessions {step['sessions']:>4}  {step['throughput']:>8.1f}/s  "
+        f"p50 {latency.get('p50', 0) * 1000:>8.2f}ms  p99 {latency.get('p99', 0) * 1000:>8.2f}ms  "
+        f"lag p99 {lag.get('p99', 0) * 1000:>7.2f}ms  "
+        f"queue {(queue or 0) * 1000:>8.2f}ms  errors {step['errors']:>4}",
+        file=sys.stderr,
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Ramp the load through every step and return the report."""
+    config = harness.fake_config(args)
+    rng = random.Random(args.seed)
+    steps = []
+    async with (
+        harness.fake_api(args) as fake_url,
+        httpx.AsyncClient(base_url=fake_url) as fake,
+        harness.serve(_serve_probed, args.lag_interval) as (port, pid),
+        httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as server,
+    ):
+        url = f"http://127.0.0.1:{port}/mcp"
+        async with Client(url, timeout=120) as client:
+            for i, name in enumerate(args.mix):
+                scenario = SCENARIOS[name]
+                args_i = scenario.args(i, config)
+                await client.call_tool(scenario.tool, args_i, raise_on_error=False)
+        for sessions in args.sessions:
+            step = await _step(url, server, fake, sessions, args, config, rng)
+            step["server_rss_bytes"] = harness.rss_bytes(pid)
+            steps.append(step)
+            _print_step(step)
+
+    return {
+        "version": harness.version(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {
+            "fake_api": vars(config),
+            "mix": args.mix,
+            "sessions": args.sessions,
+            "duration": args.duration,
+            "client_rate_limits": args.client_rate_limits,
+            "zone_cache_ttl": args.zone_cache_ttl,
+        },
+        "saturation": saturation(steps, args.min_gain, args.max_error_rate),
+        "steps": steps,
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sessions",
+        default="1,2,4,8,16,32",
+        help="Comma-separated concurrent sessions per step (default: 1,2,4,8,16,32)",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per step")
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f"Weighted scenarios, scenario=weight,... (default: {DEFAULT_MIX})",
+    )
+    parser.add_argument(
+        "--min-gain",
+        type=float,
+        default=0.1,
+        help="Throughput growth below which a step counts as saturated (default: 0.1)",
+    )
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=0.01,
+        help="Fraction of failed calls at which a step counts as saturated (default: 0.01)",
+    )
+    parser.add_argument(
+        "--lag-interval", type=float, default=0.01, help="Seconds between event-loop lag samples"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    harness.add_fake_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        args.mix = parse_mix(args.mix)
+        args.sessions = [int(n) for n in args.sessions.split(",")]
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    args = _parse_args(argv)
+    text = json.dumps(asyncio.run(run(args)), indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
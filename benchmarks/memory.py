@@ -0,0 +1,129 @@
+"""Peak memory of DNS tools on one large zone.
+
+Each scenario starts a fresh server process, serving streamable HTTP as
+deployed, calls one tool against a single large zone served by the fake
+Porkbun API, and reports the server's peak resident set size. Scenarios do
+not inflate each other's numbers, and the client is not counted. Compare
+runs across commits to see how a change affects memory. Linux only, as peak
+RSS is read from ``/proc``.
+
+Usage::
+
+    python -m benchmarks.memory --records 30000 --acme-records 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from fastmcp import Client
+
+from benchmarks import harness
+from benchmarks.fake_porkbun import domain_name
+
+DOMAIN = domain_name(0)
+
+# Scenario -> (tool, arguments, follow the page cursor once).
+SCENARIOS: dict[str, tuple[str, dict[str, Any], bool]] = {
+    # Loads the zone into the cache and search index but returns one record.
+    "cached_zone": ("dns_get_by_name_type", {"domain": DOMAIN, "record_type": "A"}, False),
+    "dns_list": ("dns_list", {"domain": DOMAIN}, False),
+    "dns_list_paged": ("dns_list", {"domain": DOMAIN, "page_size": 100}, True),
+    "dns_list_acme": (
+        "dns_list",
+        {"domain": DOMAIN, "name": "_acme-challenge.*", "fields": ["content"]},
+        False,
+    ),
+    "dns_search": ("dns_search", {"content": "192.0.2.1", "domains": [DOMAIN]}, False),
+}
+
+
+async def _measure(name: str, calls: int) -> dict[str, Any]:
+    tool, arguments, follow = SCENARIOS[name]
+    async with (
+        harness.serve(harness.serve_mcp) as (port, pid),
+        Client(f"http://127.0.0.1:{port}/mcp", timeout=300) as client,
+    ):
+        await client.call_tool_mcp("ping", {})
+        baseline = harness.rss_bytes(pid, "VmHWM")
+        for _ in range(calls):
+            result = await client.call_tool_mcp(tool, arguments)
+            if result.is_error:
+                raise RuntimeError(f"{tool} failed: {result.content}")
+            if follow:
+                # Union return types are wrapped in {"result": ...}.
+                page = (result.structured_content or {})["result"]
+                await client.call_tool_mcp(tool, {**arguments, "cursor": page["next_cursor"]})
+        peak = harness.rss_bytes(pid, "VmHWM")
+    return {
+        "scenario": name,
+        "tool": tool,
+        "calls": calls,
+        "baseline_rss_bytes": baseline,
+        "peak_rss_bytes": peak,
+        "peak_increase_bytes": None if peak is None or baseline is None else peak - baseline,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Measure every scenario and return the report."""
+    config = harness.fake_config(args)
+    results = []
+    async with harness.fake_api(args):
+        for name in args.scenarios.split(","):
+            result = await _measure(name, args.calls)
+            results.append(result)
+            if result["peak_rss_bytes"] is None:
+                print(f"{name:<16} peak RSS unavailable on this platform", file=sys.stderr)
+                continue
+            print(
+                f"{name:<16} peak {result['peak_rss_bytes'] / 2**20:>8.1f} MiB  "
+                f"increase {result['peak_increase_bytes'] / 2**20:>8.1f} MiB",
+                file=sys.stderr,
+            )
+    return {
+        "version": harness.version(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {"fake_api": vars(config), "calls": args.calls},
+        "results": results,
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated scenarios (default: all of {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--calls", type=int, default=3, help="Calls per scenario")
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    harness.add_fake_arguments(parser)
+    parser.set_defaults(domains=1, records=30_000, acme_records=20_000, latency=0.0)
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios.split(",")) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    args = _parse_args(argv)
+    text = json.dumps(asyncio.run(run(args)), indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""Benchmark porkbun-mcp tools against a local fake Porkbun API.
+
+The fake API runs in its own process. Each scenario calls one tool repeatedly
+through the real server, either in-process (``FastMCPTransport``) or over
+streamable HTTP against a server subprocess, and reports throughput, latency
+percentiles, memory and the Porkbun requests the calls caused.
+
+Usage::
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --transport http --scenarios dns_list,dns_search --latency 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks import harness
+from benchmarks.fake_porkbun import FakeConfig, domain_name
+
+type Args = Callable[[int, FakeConfig], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmarked tool call.
+
+    Attributes:
+        name: Scenario name used on the command line and in results.
+        tool: Tool that is called.
+        args: Builds the arguments of the i-th call.
+    """
+
+    name: str
+    tool: str
+    args: Args
+
+
+def _domain(i: int, config: FakeConfig) -> str:
+    return domain_name(i % config.domains)
+
+
+SCENARIOS = {
+    s.name: s
+    for s in (
+        Scenario("ping", "ping", lambda i, c: {}),
+        Scenario("dns_list", "dns_list", lambda i, c: {"domain": _domain(i, c)}),
+        Scenario(
+            "dns_list_filtered",
+            "dns_list",
+            lambda i, c: {"domain": _domain(i, c), "record_type": "A", "name_regex": "^host1"},
+        ),
+        Scenario(
+            "dns_get_by_name_type",
+            "dns_get_by_name_type",
+            # Generated zones have an A record on every fifth host.
+            lambda i, c: {
+                "domain": _domain(i, c),
+                "record_type": "A",
+                "subdomain": f"host{5 * (i % max(c.records // 5, 1))}",
+            },
+        ),
+        Scenario(
+            "dns_list_many",
+            "dns_list_many",
+            lambda i, c: {"domains": [domain_name(d) for d in range(c.domains)]},
+        ),
+        Scenario("dns_search", "dns_search", lambda i, c: {"content": f"192.0.2.{i % 256}"}),
+        Scenario("domains_list", "domains_list", lambda i, c: {}),
+        Scenario("pricing_get", "pricing_get", lambda i, c: {"tlds": ["tld1", "tld2", "tld3"]}),
+        Scenario(
+            "dns_create",
+            "dns_create",
+            lambda i, c: {
+                "domain": _domain(i, c),
+                "record_type": "TXT",
+                "name": f"bench-{i}",
+                "content": f"bench {time.monotonic_ns()}",
+            },
+        ),
+    )
+}
+
+
+async def _call_many(
+    client: Any, scenario: Scenario, config: FakeConfig, calls: int, concurrency: int
+) -> tuple[list[float], int, float]:
+    """Make ``calls`` calls with up to ``concurrency`` in flight.
+
+    Returns:
+        Per-call latencies in seconds, failed calls and total wall time.
+    """
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(calls))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            result = await client.call_tool(
+                scenario.tool, scenario.args(i, config), raise_on_error=False
+            )
+            latencies.append(time.perf_counter() - start)
+            errors += result.is_error
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, calls))))
+    return latencies, errors, time.perf_counter() - start
+
+
+async def _memory(
+    client: Any, scenario: Scenario, config: FakeConfig, calls: int
+) -> dict[str, int]:
+    """Traced allocations of in-process calls; a separate pass as tracing slows calls down."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for i in range(calls):
+            await client.call_tool(scenario.tool, scenario.args(i, config), raise_on_error=False)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_bytes": peak - before, "retained_bytes": current - before}
+
+
+async def _run_transport(
+    transport: str,
+    scenarios: list[Scenario],
+    args: argparse.Namespace,
+    config: FakeConfig,
+    fake: httpx.AsyncClient,
+) -> list[dict[str, Any]]:
+    from fastmcp import Client
+    from fastmcp.client.transports import FastMCPTransport
+
+    from porkbun_mcp.server import create_server
+
+    async with AsyncExitStack() as stack:
+        pid = None
+        if transport == "memory":
+            target: Any = FastMCPTransport(create_server(get_muddy=True))
+        else:
+            port, pid = await stack.enter_async_context(harness.serve(harness.serve_mcp))
+            target = f"http://127.0.0.1:{port}/mcp"
+        client = await stack.enter_async_context(Client(target, timeout=120))
+
+        results = []
+        for scenario in scenarios:
+            for i in range(args.warmup):
+                await client.call_tool(
+                    scenario.tool, scenario.args(i, config), raise_on_error=False
+                )
+            upstream_before = await harness.upstream_requests(fake)
+            latencies, errors, wall = await _call_many(
+                client, scenario, config, args.calls, args.concurrency
+            )
+            upstream = await harness.upstream_requests(fake) - upstream_before
+            latencies.sort()
+            result: dict[str, Any] = {
+                "transport": transport,
+                "scenario": scenario.name,
+                "tool": scenario.tool,
+                "calls": len(latencies),
+                "errors": errors,
+                "concurrency": args.concurrency,
+                "duration": wall,
+                "throughput": len(latencies) / wall if wall else None,
+                "latency": {
+                    "mean": sum(latencies) / len(latencies),
+                    "p50": harness.percentile(latencies, 50),
+                    "p99": harness.percentile(latencies, 99),
+                    "max": latencies[-1],
+                },
+                "upstream_requests": upstream,
+            }
+            if pid is None:
+                calls = min(args.calls, args.memory_calls)
+                result["memory"] = await _memory(client, scenario, config, calls)
+            else:
+                result["memory"] = {"server_rss_bytes": harness.rss_bytes(pid)}
+            results.append(result)
+            _print_result(result)
+    return results
+
+
+def _print_result(result: dict[str, Any]) -> None:
+    latency = result["latency"]
+    print(
+        f"{result['transport']:<7} {result['scenario']:<22} "
+        f"{result['throughput']:>9.1f}/s  p50 {latency['p50'] * 1000:>8.2f}ms  "
+        f"p99 {latency['p99'] * 1000:>8.2f}ms  errors {result['errors']:>4}  "
+        f"upstream {result['upstream_requests']:>5}",
+        file=sys.stderr,
+    )
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--transport", choices=["memory", "http", "both"], default="both", help="MCP transport"
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated scenarios (default: all of {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--calls", type=int, default=200, help="Calls per scenario")
+    parser.add_argument("--concurrency", type=int, default=10, help="Calls in flight")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed calls per scenario")
+    parser.add_argument(
+        "--memory-calls", type=int, default=20, help="Calls in the traced memory pass"
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    harness.add_fake_arguments(parser)
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios.split(",")) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    return args
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmarks and return the report."""
+    config = harness.fake_config(args)
+    scenarios = [SCENARIOS[name] for name in args.scenarios.split(",")]
+    transports = ["memory", "http"] if args.transport == "both" else [args.transport]
+
+    results = []
+    async with harness.fake_api(args) as fake_url, httpx.AsyncClient(base_url=fake_url) as fake:
+        for transport in transports:
+            results += await _run_transport(transport, scenarios, args, config, fake)
+
+    return {
+        "version": harness.version(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {
+            "fake_api": dataclasses.asdict(config),
+            "calls": args.calls,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "client_rate_limits": args.client_rate_limits,
+            "zone_cache_ttl": args.zone_cache_ttl,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    args = _parse_args(argv)
+    text = json.dumps(asyncio.run(run(args)), indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Cold-start time of a stdio session.
+
+Each run spawns a fresh ``porkbun-mcp`` process over stdio, as an MCP client
+does for every session, and times the MCP handshake and the first
+``list_tools`` response. No Porkbun request is made, so no fake API is
+needed. The warm-up session fills the tool schema cache, so timed sessions
+reuse it unless ``--cold-schemas`` removes it before each one. ``--tools``
+starts the server with only those tool groups. With
+``--budget``, exits non-zero when the median time to the first
+``list_tools`` response exceeds it, so regressions fail CI.
+
+Usage::
+
+    python -m benchmarks.startup --runs 10 --budget 2.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+from benchmarks import harness
+
+SERVER = "from porkbun_mcp import main; main()"
+
+
+async def _measure(state: Path, tools: str | None, cold: bool) -> tuple[float, float, int]:
+    """Time one session: spawn to initialized, then the first list_tools.
+
+    Returns:
+        Seconds to initialized, seconds to the list_tools response, and the
+        size of the listed tools in bytes of JSON.
+    """
+    schemas = state / "schemas.json"
+    if cold:
+        schemas.unlink(missing_ok=True)
+    transport = StdioTransport(
+        sys.executable,
+        ["-c", SERVER, *(["--tools", tools] if tools is not None else [])],
+        env={
+            **os.environ,
+            "PORKBUN_API_KEY": "pk1_benchmark",
+            "PORKBUN_SECRET_KEY": "sk1_benchmark",
+            "PORKBUN_PRICING_CACHE_PATH": str(state / "pricing.json"),
+            "PORKBUN_JOURNAL_DIR": str(state / "journal"),
+            "PORKBUN_SCHEMA_CACHE_PATH": str(schemas),
+        },
+        keep_alive=False,
+        log_file=state / "server.log",
+    )
+    start = time.perf_counter()
+    async with Client(transport, timeout=60) as client:
+        initialized = time.perf_counter()
+        listing = await client.list_tools()
+        listed = time.perf_counter()
+    if not listing:
+        raise RuntimeError("server listed no tools")
+    size = len(json.dumps([t.model_dump(mode="json", exclude_none=True) for t in listing]))
+    return initialized - start, listed - start, size
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "median": statistics.median(ordered),
+        "p90": harness.percentile(ordered, 90),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Time every run and return the report."""
+    initialize: list[float] = []
+    list_tools: list[float] = []
+    size = 0
+    with tempfile.TemporaryDirectory(prefix="porkbun-bench-") as state:
+        for _ in range(args.warmup):
+            await _measure(Path(state), args.tools, args.cold_schemas)
+        for _ in range(args.runs):
+            initialized, listed, size = await _measure(Path(state), args.tools, args.cold_schemas)
+            initialize.append(initialized)
+            list_tools.append(listed)
+    summaries = {
+        "initialize_seconds": _summary(initialize),
+        "list_tools_seconds": _summary(list_tools),
+    }
+    for name, summary in summaries.items():
+        print(
+            f"{name:<20} median {summary['median'] * 1000:>7.1f}ms  "
+            f"p90 {summary['p90'] * 1000:>7.1f}ms  "
+            f"min {summary['min'] * 1000:>7.1f}ms",
+            file=sys.stderr,
+        )
+    print(f"{'list_tools_bytes':<20} {size}", file=sys.stderr)
+    return {
+        "version": harness.version(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {
+            "runs": args.runs,
+            "warmup": args.warmup,
+            "tools": args.tools,
+            "cold_schemas": args.cold_schemas,
+            "budget": args.budget,
+        },
+        "results": {**summaries, "list_tools_bytes": size},
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Timed sessions")
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Untimed sessions first, to warm the OS file cache"
+    )
+    parser.add_argument("--tools", help="Tool groups to serve, as for porkbun-mcp --tools")
+    parser.add_argument(
+        "--cold-schemas",
+        action="store_true",
+        help="Remove the tool schema cache before each session",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Fail when the median seconds to the first list_tools response exceed this",
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    args = _parse_args(argv)
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+    median = report["results"]["list_tools_seconds"]["median"]
+    if args.budget is not None and median > args.budget:
+        sys.exit(f"median time to list_tools {median:.3f}s exceeds the {args.budget:.3f}s budget")
+
+
+if __name__ == "__main__":
+    main()
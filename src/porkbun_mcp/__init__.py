@@ -7,6 +7,8 @@ import argparse
 
 def main() -> None:
     """Run the Porkbun MCP server."""
+    from porkbun_mcp.tools import TOOL_GROUPS, select_tool_groups
+
     parser = argparse.ArgumentParser(
         description="Porkbun DNS MCP Server",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -15,11 +17,13 @@ Environment Variables:
   PORKBUN_API_KEY       Porkbun API key (required)
   PORKBUN_SECRET_KEY    Porkbun secret key (required)
   PORKBUN_GET_MUDDY     Enable write operations (default: false)
+  PORKBUN_TOOLS         Tool groups to register (default: all)
 
 Examples:
-  porkbun-mcp                    # Read-only mode (default)
-  porkbun-mcp --get-muddy        # Enable write operations
-  porkbun-mcp --transport sse    # SSE transport
+  porkbun-mcp                      # Read-only mode (default)
+  porkbun-mcp --get-muddy          # Enable write operations
+  porkbun-mcp --transport sse      # SSE transport
+  porkbun-mcp --tools dns,pricing  # Only DNS and pricing tools
 """,
     )
     parser.add_argument(
@@ -34,11 +38,22 @@ Examples:
         default=None,
         help="Enable write operations (create/edit/delete). Default is read-only.",
     )
+    parser.add_argument(
+        "--tools",
+        default=None,
+        metavar="GROUPS",
+        help=f"Comma-separated tool groups to register: {', '.join(TOOL_GROUPS)}. Default is all.",
+    )
     args = parser.parse_args()
+    if args.tools is not None:
+        try:
+            select_tool_groups(args.tools)
+        except ValueError as e:
+            parser.error(str(e))
 
     from porkbun_mcp.server import create_server
 
-    server = create_server(get_muddy=args.get_muddy)
+    server = create_server(get_muddy=args.get_muddy, tools=args.tools)
     server.run(transport=args.transport)
 
 
@@ -0,0 +1,205 @@
+"""Concurrent execution of batched DNS changes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from porkbun_mcp.errors import handle_oinker_error
+from porkbun_mcp.models import DNSBulkResult, DNSOperationResult, OperationStatus
+
+if TYPE_CHECKING:
+    from porkbun_mcp.cache import ZoneCache
+    from porkbun_mcp.journal import JournalState
+    from porkbun_mcp.upstream import Upstream
+
+Action = Literal["create", "edit", "delete"]
+
+_DONE_STATUS: dict[Action, OperationStatus] = {
+    "create": "created",
+    "edit": "updated",
+    "delete": "deleted",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedChange:
+    """A validated DNS change ready to send to Porkbun.
+
+    Attributes:
+        index: Position of the change in the caller's request.
+        action: Change to make.
+        domain: Domain name.
+        record_id: Record to edit or delete.
+        record: oinker record to create or write, already validated.
+    """
+
+    index: int
+    action: Action
+    domain: str
+    record_id: str | None = None
+    record: Any = None
+
+
+def _done(change: PlannedChange, record_id: str | None) -> DNSOperationResult:
+    return DNSOperationResult(
+        index=change.index,
+        action=change.action,
+        domain=change.domain,
+        status=_DONE_STATUS[change.action],
+        record_id=record_id,
+    )
+
+
+async def _apply_one(upstream: Upstream, change: PlannedChange) -> DNSOperationResult:
+    match change.action:
+        case "create":
+            record_id = await upstream.call("dns.create", change.domain, change.record)
+        case "edit":
+            await upstream.call("dns.edit", change.domain, change.record_id, change.record)
+            record_id = change.record_id
+        case "delete":
+            await upstream.call("dns.delete", change.domain, change.record_id)
+            record_id = change.record_id
+    return _done(change, record_id)
+
+
+def skipped(change: PlannedChange) -> DNSOperationResult:
+    """Result for a change that was not attempted."""
+    return DNSOperationResult(
+        index=change.index,
+        action=change.action,
+        domain=change.domain,
+        status="skipped",
+        record_id=change.record_id,
+    )
+
+
+async def apply_changes(
+    upstream: Upstream,
+    cache: ZoneCache,
+    changes: Sequence[PlannedChange],
+    concurrency: int = 4,
+    stop_on_error: bool = False,
+    on_start: Callable[[int], Awaitable[None]] | None = None,
+    on_result: Callable[[DNSOperationResult], Awaitable[None]] | None = None,
+) -> list[DNSOperationResult]:
+    """Apply DNS changes with bounded concurrency.
+
+    Requests share the upstream rate limiter. Changes that have not started
+    when another fails are skipped if ``stop_on_error`` is set; changes already
+    in flight still finish.
+
+    Args:
+        upstream: Shared upstream call path.
+        cache: Zone cache to invalidate for every touched domain.
+        changes: Validated changes.
+        concurrency: Maximum changes in flight at once.
+        stop_on_error: Skip remaining changes after the first failure.
+        on_start: Awaited with a change's index just before it is sent; if it
+            raises, the change fails without being sent.
+        on_result: Awaited with each result as it completes.
+
+    Returns:
+        One result per change, in the order given.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    failed = False
+
+    async def run(change: PlannedChange) -> DNSOperationResult:
+        nonlocal failed
+        async with semaphore:
+            if failed and stop_on_error:
+                result = skipped(change)
+            else:
+                try:
+                    if on_start is not None:
+                        await on_start(change.index)
+                    result = await _apply_one(upstream, change)
+                except Exception as e:
+                    failed = True
+                    error = handle_oinker_error(e, f"{change.action} DNS record")
+                    result = DNSOperationResult(
+                        index=change.index,
+                        action=change.action,
+                        domain=change.domain,
+                        status="failed",
+                        record_id=change.record_id,
+                        error=str(error),
+                    )
+                finally:
+                    cache.invalidate(change.domain)
+        if on_result is not None:
+            await on_result(result)
+        return result
+
+    return list(await asyncio.gather(*(run(c) for c in changes)))
+
+
+async def settle_interrupted(
+    upstream: Upstream,
+    changes: Sequence[PlannedChange],
+    state: JournalState,
+) -> dict[int, DNSOperationResult]:
+    """Work out which changes of an interrupted batch already took effect.
+
+    Successful results from the journal are kept as they are. A create or
+    delete that was started but has no successful result may still have
+    reached Porkbun, so it is looked up in the live zone: a create counts as
+    done if a record with the same name, type and content exists, a delete if
+    the record is gone. Edits are simply sent again.
+
+    Args:
+        upstream: Shared upstream call path.
+        changes: Validated changes of the batch.
+        state: Replayed journal of the earlier run.
+
+    Returns:
+        Results of the changes that must not be sent again, by index.
+    """
+    settled = {i: r for i, r in state.results.items() if r.status not in ("failed", "skipped")}
+    in_doubt = [
+        c
+        for c in changes
+        if c.index in state.started and c.index not in settled and c.action != "edit"
+    ]
+    zones: dict[str, list[Any]] = {}
+    for change in in_doubt:
+        domain = change.domain.lower()
+        if domain not in zones:
+            try:
+                zones[domain] = await upstream.call("dns.list", change.domain)
+            except Exception as e:
+                raise handle_oinker_error(e, f"list DNS records for {change.domain}") from e
+        records = zones[domain]
+        if change.action == "delete":
+            if all(r.id != change.record_id for r in records):
+                settled[change.index] = _done(change, change.record_id)
+            continue
+        want = change.record
+        key = (
+            f"{want.name}.{domain}".lower() if want.name else domain,
+            want.record_type.upper(),
+            want.content,
+        )
+        match = next(
+            (r for r in records if (r.name.lower(), r.record_type.upper(), r.content) == key),
+            None,
+        )
+        if match is not None:
+            settled[change.index] = _done(change, match.id)
+    return settled
+
+
+def summarize(results: list[DNSOperationResult]) -> DNSBulkResult:
+    """Count outcomes for a list of operation results."""
+    failed = sum(r.status == "failed" for r in results)
+    skipped = sum(r.status == "skipped" for r in results)
+    return DNSBulkResult(
+        succeeded=len(results) - failed - skipped,
+        failed=failed,
+        skipped=skipped,
+        results=results,
+    )
@@ -0,0 +1,204 @@
+"""Read-through DNS zone cache shared by the DNS tools."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+ZoneListener = Callable[[str, list[Any] | None], None]
+
+# Rough per-record overhead (object header, slots, ints) added to string lengths
+# when estimating how many bytes a cached zone occupies.
+_RECORD_OVERHEAD = 200
+
+
+@dataclass
+class CacheStats:
+    """Counters describing zone cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _ZoneEntry:
+    records: list[Any]
+    size: int
+    expires_at: float
+
+
+def estimate_zone_size(records: Iterable[Any]) -> int:
+    """Estimate the memory footprint of a zone in bytes.
+
+    Args:
+        records: oinker DNS records for a single domain.
+
+    Returns:
+        Approximate size in bytes, used for the cache byte budget.
+    """
+    return sum(
+        _RECORD_OVERHEAD + len(r.id) + len(r.name) + len(r.content) + len(r.notes or "")
+        for r in records
+    )
+
+
+class ZoneCache:
+    """Per-domain cache of DNS zones fetched with ``piglet.dns.list``.
+
+    A cached zone serves ``dns_list``, ``dns_get`` and ``dns_get_by_name_type``
+    without further upstream calls until it expires or a write invalidates it.
+    Least recently used zones are evicted once the byte budget is exceeded,
+    and expired zones are dropped whenever zones are looked up or stored.
+    Listeners are told whenever a zone is stored (with its records) or dropped
+    (with None), so derived indexes can follow the cache.
+
+    Attributes:
+        ttl: Seconds a fetched zone stays fresh. Zero disables caching.
+        max_bytes: Byte budget across all cached zones.
+        stats: Hit, miss, eviction and invalidation counters.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0.0,
+        max_bytes: int = 16 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._clock = clock
+        self._zones: OrderedDict[str, _ZoneEntry] = OrderedDict()
+        # Write counters, kept only while a fetch of the zone is in flight.
+        self._generations: dict[str, int] = {}
+        self._fetching: dict[str, int] = {}
+        self._bytes = 0
+        self._listeners: list[ZoneListener] = []
+
+    def add_listener(self, listener: ZoneListener) -> None:
+        """Call ``listener(domain, records)`` on every zone store, and with None on drops."""
+        self._listeners.append(listener)
+
+    def _notify(self, domain: str, records: list[Any] | None) -> None:
+        for listener in self._listeners:
+            listener(domain, records)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether zones are cached at all."""
+        return self.ttl > 0 and self.max_bytes > 0
+
+    @property
+    def size(self) -> int:
+        """Estimated bytes currently held by cached zones."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    def peek(self, domain: str) -> list[Any] | None:
+        """Return the cached zone for a domain if it is fresh, without counting a hit."""
+        key = domain.lower()
+        entry = self._zones.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._drop(key)
+            return None
+        return entry.records
+
+    async def get_zone(
+        self,
+        domain: str,
+        fetch: Callable[[str], Awaitable[Iterable[Any]]],
+    ) -> list[Any]:
+        """Return all records for a domain, fetching them on a miss.
+
+        Args:
+            domain: Domain name.
+            fetch: Coroutine function that lists the zone upstream.
+
+        Returns:
+            The zone's records.
+        """
+        key = domain.lower()
+        records = self.peek(key)
+        if records is not None:
+            self._zones.move_to_end(key)
+            self.stats.hits += 1
+            return records
+
+        if not self.enabled:
+            return list(await fetch(domain))
+
+        self.stats.misses += 1
+        self._fetching[key] = self._fetching.get(key, 0) + 1
+        try:
+            records = list(await fetch(domain))
+        finally:
+            self._fetching[key] -= 1
+            # A write that landed while we were fetching makes this result stale.
+            stale = self._generations.get(key, 0) > 0
+            if not self._fetching[key]:
+                del self._fetching[key]
+                self._generations.pop(key, None)
+        if not stale:
+            self._store(key, records)
+        return records
+
+    def invalidate(self, domain: str) -> None:
+        """Drop a domain's cached zone after a write.
+
+        Args:
+            domain: Domain name whose records changed.
+        """
+        key = domain.lower()
+        if key in self._fetching:
+            self._generations[key] = self._generations.get(key, 0) + 1
+        if self._drop(key):
+            self.stats.invalidations += 1
+        else:
+            self._notify(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached zone."""
+        for domain in list(self._zones):
+            self.invalidate(domain)
+
+    def _drop(self, key: str) -> bool:
+        """Remove a cached zone and tell listeners; returns whether one was cached."""
+        entry = self._zones.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        self._notify(key, None)
+        return True
+
+    def _drop_expired(self) -> None:
+        now = self._clock()
+        for key in [k for k, e in self._zones.items() if e.expires_at <= now]:
+            self._drop(key)
+
+    def _store(self, key: str, records: list[Any]) -> None:
+        self._drop_expired()
+        size = estimate_zone_size(records)
+        old = self._zones.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        if size > self.max_bytes:
+            self._notify(key, None)
+            return
+
+        self._zones[key] = _ZoneEntry(records, size, self._clock() + self.ttl)
+        self._bytes += size
+        self._notify(key, records)
+        while self._bytes > self.max_bytes:
+            evicted_key, evicted = self._zones.popitem(last=False)
+            self._bytes -= evicted.size
+            self.stats.evictions += 1
+            self._notify(evicted_key, None)
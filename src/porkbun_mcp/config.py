@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from porkbun_mcp.pricing_index import default_snapshot_path
+
 
 class PorkbunMCPSettings(BaseSettings):
     """Configuration for the Porkbun MCP server.
@@ -12,6 +16,30 @@ class PorkbunMCPSettings(BaseSettings):
     Attributes:
         api_key: Porkbun API key (pk1_...).
         secret_key: Porkbun secret API key (sk1_...).
+        api_base_url: Porkbun API base URL override (None for api.porkbun.com).
+        tools: Comma-separated tool groups to register; empty registers every group.
+        zone_cache_ttl: Seconds a fetched DNS zone is reused (0, the default, disables
+            caching). Changes made outside this server can take this long to be seen.
+        zone_cache_max_bytes: Memory budget for cached DNS zones.
+        pricing_cache_path: On-disk snapshot of TLD pricing shared between processes.
+        pricing_refresh_interval: Seconds before TLD pricing is fetched again.
+        schema_cache_path: On-disk cache of tool and prompt schemas shared between processes
+            (None disables).
+        rate_limit_general: Requests per second for read API calls.
+        rate_limit_check: Requests per second for domain availability checks.
+        rate_limit_write: Requests per second for create/edit/delete API calls.
+        rate_limit_max_wait: Seconds a call may queue for the rate limiter.
+        retry_max_attempts: Attempts per idempotent API call, including the first.
+        retry_base_delay: Seconds before the first retry; doubles on each retry.
+        retry_jitter: Fraction of each retry delay that is randomised.
+        retry_deadline: Seconds a Porkbun call may take, retries included.
+        page_snapshot_ttl: Seconds a paginated result stays available to its cursors.
+        jobs_max_finished: Finished background jobs kept for status and result lookups.
+        journal_dir: Directory of write-ahead journals for batched DNS changes (None disables).
+        trace_file: JSON lines file that tool call traces are appended to (None disables).
+        profile_dir: Directory for per-call cProfile files (None disables profiling).
+        profile_tools: Comma-separated tools to profile; empty profiles every tool.
+        profile_sample_rate: Fraction of matching tool calls that are profiled.
     """
 
     model_config = SettingsConfigDict(
@@ -22,7 +50,117 @@ class PorkbunMCPSettings(BaseSettings):
 
     api_key: str = Field(default="", description="Porkbun API key")
     secret_key: str = Field(default="", description="Porkbun secret key")
+    api_base_url: str | None = Field(
+        default=None,
+        description="Porkbun API base URL override, e.g. a local fake API for benchmarks.",
+    )
     get_muddy: bool = Field(
         default=False,
         description="Enable write operations (create/edit/delete). Default is read-only.",
     )
+    tools: str = Field(
+        default="",
+        description="Comma-separated tool groups to register, e.g. 'dns,pricing' (empty: all).",
+    )
+    zone_cache_ttl: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "Seconds a fetched DNS zone is reused by read tools (0, the default, disables "
+            "caching). "
+            "Changes made outside this server can be this stale."
+        ),
+    )
+    zone_cache_max_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=0,
+        description="Approximate memory budget in bytes for cached DNS zones.",
+    )
+    pricing_cache_path: Path = Field(
+        default_factory=default_snapshot_path,
+        description="On-disk TLD pricing snapshot shared between server processes.",
+    )
+    pricing_refresh_interval: float = Field(
+        default=86400.0,
+        ge=0,
+        description="Seconds before TLD pricing is fetched from Porkbun again.",
+    )
+    schema_cache_path: Path | None = Field(
+        default=None,
+        description="On-disk cache of generated tool and prompt schemas, reused at startup; "
+        "unset generates them in every process.",
+    )
+    rate_limit_general: float = Field(
+        default=5.0,
+        ge=0,
+        description="Requests per second for read API calls (0 disables limiting).",
+    )
+    rate_limit_check: float = Field(
+        default=0.1,
+        ge=0,
+        description="Requests per second for domain availability checks (0 disables limiting).",
+    )
+    rate_limit_write: float = Field(
+        default=2.0,
+        ge=0,
+        description="Requests per second for create/edit/delete API calls (0 disables limiting).",
+    )
+    rate_limit_max_wait: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds a call may wait for the rate limiter before failing.",
+    )
+    retry_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts per read or idempotent API call, including the first.",
+    )
+    retry_base_delay: float = Field(
+        default=0.5,
+        ge=0,
+        description="Seconds before the first retry; doubles on each later retry.",
+    )
+    retry_jitter: float = Field(
+        default=0.5,
+        ge=0,
+        le=1,
+        description="Fraction of each retry delay that is randomised (1 = full jitter).",
+    )
+    retry_deadline: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds a Porkbun call may take, retries included; a slower call fails.",
+    )
+    page_snapshot_ttl: float = Field(
+        default=300.0,
+        gt=0,
+        description="Seconds a paginated result is kept for fetching its later pages.",
+    )
+    jobs_max_finished: int = Field(
+        default=100,
+        ge=1,
+        description="Finished background jobs kept for job_status and job_result.",
+    )
+    journal_dir: Path | None = Field(
+        default=None,
+        description="Directory of write-ahead journals that make dns_bulk_apply resumable; "
+        "unset disables journaling and resume.",
+    )
+    trace_file: Path | None = Field(
+        default=None,
+        description="Append a trace of every tool call to this JSON lines file.",
+    )
+    profile_dir: Path | None = Field(
+        default=None,
+        description="Write a cProfile file per profiled tool call to this directory.",
+    )
+    profile_tools: str = Field(
+        default="",
+        description="Comma-separated tool names to profile (empty profiles every tool).",
+    )
+    profile_sample_rate: float = Field(
+        default=1.0,
+        ge=0,
+        le=1,
+        description="Fraction of matching tool calls that are profiled.",
+    )
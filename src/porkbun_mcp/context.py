@@ -8,16 +8,44 @@ from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
 if TYPE_CHECKING:
-    from oinker import AsyncPiglet
-
+    from porkbun_mcp.cache import ZoneCache
+    from porkbun_mcp.jobs import JobManager
+    from porkbun_mcp.pagination import SnapshotStore
+    from porkbun_mcp.pricing_index import PricingIndex
     from porkbun_mcp.server import AppContext
+    from porkbun_mcp.upstream import Upstream
 
 
-def get_piglet(ctx: Context[object, AppContext]) -> AsyncPiglet:
-    """Get AsyncPiglet from context."""
+def get_app_context(ctx: Context[object, AppContext]) -> AppContext:
+    """Get the lifespan AppContext, or raise ToolError if unavailable."""
     if ctx.request_context is None or ctx.request_context.lifespan_context is None:
         raise ToolError("Server context not available")
-    return ctx.request_context.lifespan_context.piglet
+    return ctx.request_context.lifespan_context
+
+
+def get_upstream(ctx: Context[object, AppContext]) -> Upstream:
+    """Get the shared Upstream used for every Porkbun API call."""
+    return get_app_context(ctx).upstream
+
+
+def get_zone_cache(ctx: Context[object, AppContext]) -> ZoneCache:
+    """Get the shared DNS zone cache from context."""
+    return get_app_context(ctx).zone_cache
+
+
+def get_snapshot_store(ctx: Context[object, AppContext]) -> SnapshotStore:
+    """Get the snapshot store backing paginated results."""
+    return get_app_context(ctx).snapshots
+
+
+def get_jobs(ctx: Context[object, AppContext]) -> JobManager:
+    """Get the background job manager from context."""
+    return get_app_context(ctx).jobs
+
+
+def get_pricing_index(ctx: Context[object, AppContext]) -> PricingIndex:
+    """Get the shared TLD pricing index from context."""
+    return get_app_context(ctx).pricing
 
 
 def get_read_only(ctx: Context[object, AppContext]) -> bool:
@@ -1,16 +1,55 @@
-"""Error mapping from oinker to MCP ToolErrors."""
+"""Error mapping from oinker to MCP ToolErrors.
+
+oinker is imported where it is needed, so that startup does not load it
+before the first Porkbun request (see ``LazyPiglet``).
+"""
 
 from __future__ import annotations
 
 from fastmcp.exceptions import ToolError
-from oinker import (
-    APIError,
-    AuthenticationError,
-    AuthorizationError,
-    NotFoundError,
-    RateLimitError,
-    ValidationError,
-)
+
+
+def error_category(e: BaseException) -> str:
+    """Classify an error for metrics, using the same cases as ``handle_oinker_error``.
+
+    A ToolError raised from an oinker error takes the category of its cause;
+    one raised by a tool itself (invalid input, read-only mode) is "rejected".
+
+    Args:
+        e: Exception raised by an AsyncPiglet call or a tool.
+
+    Returns:
+        One of "authentication", "authorization", "not_found", "rate_limited",
+        "validation", "api", "rejected" or "other".
+    """
+    from oinker import (
+        APIError,
+        AuthenticationError,
+        AuthorizationError,
+        NotFoundError,
+        RateLimitError,
+        ValidationError,
+    )
+
+    match e:
+        case ToolError() if e.__cause__ is not None:
+            return error_category(e.__cause__)
+        case ToolError():
+            return "rejected"
+        case AuthenticationError():
+            return "authentication"
+        case AuthorizationError():
+            return "authorization"
+        case NotFoundError():
+            return "not_found"
+        case RateLimitError():
+            return "rate_limited"
+        case ValidationError():
+            return "validation"
+        case APIError():
+            return "api"
+        case _:
+            return "other"
 
 
 def handle_oinker_error(e: Exception, operation: str) -> ToolError:
@@ -23,6 +62,15 @@ def handle_oinker_error(e: Exception, operation: str) -> ToolError:
     Returns:
         A ToolError with an appropriate message.
     """
+    from oinker import (
+        APIError,
+        AuthenticationError,
+        AuthorizationError,
+        NotFoundError,
+        RateLimitError,
+        ValidationError,
+    )
+
     match e:
         case AuthenticationError():
             return ToolError(
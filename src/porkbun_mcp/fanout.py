@@ -0,0 +1,115 @@
+"""Concurrent per-domain reads across many domains."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from porkbun_mcp.pagination import SnapshotStore
+    from porkbun_mcp.upstream import Upstream
+
+AllDomains = Literal["all"]
+
+# Porkbun's listAll endpoint returns domains in chunks of this size.
+DOMAIN_PAGE_SIZE = 1000
+
+
+async def domain_pages(upstream: Upstream, prefetch: int = 2) -> AsyncGenerator[list[Any]]:
+    """Yield every page of the account's domains, in order.
+
+    Once a full page arrives, up to ``prefetch`` following pages are requested
+    before it is handed to the caller, so converting one page overlaps with
+    fetching the next. A short page is the last one; requests already sent
+    past it are cancelled.
+
+    Args:
+        upstream: Shared upstream call path.
+        prefetch: Pages to keep in flight ahead of the caller.
+    """
+    pending: deque[asyncio.Future[Any]] = deque()
+    start = 0
+
+    def request() -> None:
+        nonlocal start
+        pending.append(asyncio.ensure_future(upstream.call("domains.list", start=start)))
+        start += DOMAIN_PAGE_SIZE
+
+    request()
+    try:
+        while pending:
+            page = list(await pending.popleft())
+            if len(page) < DOMAIN_PAGE_SIZE:
+                if page:
+                    yield page
+                return
+            while len(pending) < prefetch:
+                request()
+            yield page
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def resolve_domains(
+    upstream: Upstream,
+    domains: Sequence[str] | AllDomains,
+    snapshots: SnapshotStore | None = None,
+) -> list[str]:
+    """Expand ``"all"`` to every domain in the account and drop duplicates.
+
+    Args:
+        upstream: Shared upstream call path.
+        domains: Domain names, or ``"all"``.
+        snapshots: Store that keeps the account's domain names between calls
+            for its snapshot TTL. Without one, ``"all"`` lists them every time.
+
+    Returns:
+        Domain names in the order given (or as listed by Porkbun).
+    """
+    if domains != "all":
+        return list(dict.fromkeys(d.lower() for d in domains))
+
+    async def load() -> list[str]:
+        return [d.domain async for page in domain_pages(upstream) for d in page]
+
+    if snapshots is None:
+        return await load()
+    return list(await snapshots.shared("domain_names", load))
+
+
+async def fan_out[T](
+    domains: Sequence[str],
+    fetch: Callable[[str], Awaitable[T]],
+    concurrency: int = 4,
+    on_done: Callable[[], None] | None = None,
+) -> list[T | Exception]:
+    """Run ``fetch`` for every domain with at most ``concurrency`` in flight.
+
+    A failure for one domain does not cancel the others; its exception is
+    returned in that domain's slot instead.
+
+    Args:
+        domains: Domain names.
+        fetch: Coroutine function taking a domain name.
+        concurrency: Maximum fetches in flight at once.
+        on_done: Called after each domain finishes, successfully or not.
+
+    Returns:
+        One result or exception per domain, in the order given.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(domain: str) -> T | Exception:
+        async with semaphore:
+            try:
+                return await fetch(domain)
+            except Exception as e:
+                return e
+            finally:
+                if on_done is not None:
+                    on_done()
+
+    return list(await asyncio.gather(*(run(d) for d in domains)))
@@ -0,0 +1,149 @@
+"""Background jobs for tool calls that can outlast a client's timeout."""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+JobState = Literal["running", "succeeded", "failed", "cancelled"]
+
+
+@dataclass
+class Progress:
+    """Progress counters a unit of work updates as it goes.
+
+    Attributes:
+        done: Items finished so far.
+        total: Items expected in all, if known.
+    """
+
+    done: int = 0
+    total: int | None = None
+
+    def advance(self, n: int = 1) -> None:
+        """Count ``n`` more finished items."""
+        self.done += n
+
+
+Work = Callable[[Progress], Awaitable[Any]]
+
+
+@dataclass
+class Job:
+    """A unit of work running in the background.
+
+    Attributes:
+        id: Job ID returned to the client.
+        kind: Name of the tool that submitted the job.
+        state: Current state.
+        progress: Progress counters updated by the work.
+        created_at: Submission time (epoch seconds).
+        finished_at: Completion time, once finished.
+        result: Return value of the work, once succeeded.
+        error: Error message, once failed.
+    """
+
+    id: str
+    kind: str
+    state: JobState = "running"
+    progress: Progress = field(default_factory=Progress)
+    created_at: float = 0.0
+    finished_at: float | None = None
+    result: Any = None
+    error: str | None = None
+    task: asyncio.Task[Any] | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has stopped running."""
+        return self.state != "running"
+
+
+class JobManager:
+    """Runs submitted work as asyncio tasks and keeps finished jobs for a while.
+
+    Jobs share the server's Upstream, so their Porkbun calls go through the
+    same rate limiter as foreground tool calls. Running jobs are always kept;
+    once more than ``max_finished`` jobs have finished, the least recently
+    looked-at finished job is dropped.
+
+    Attributes:
+        max_finished: Finished jobs kept for status and result lookups.
+    """
+
+    def __init__(self, max_finished: int = 100, clock: Callable[[], float] = time.time) -> None:
+        self.max_finished = max_finished
+        self._clock = clock
+        self._running: dict[str, Job] = {}
+        self._finished: OrderedDict[str, Job] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._running) + len(self._finished)
+
+    def submit(
+        self,
+        kind: str,
+        work: Work,
+        format_error: Callable[[Exception], str] = str,
+    ) -> Job:
+        """Start ``work`` in the background and return its job.
+
+        Args:
+            kind: Name of the submitting tool.
+            work: Coroutine function taking the job's Progress.
+            format_error: Turns an exception raised by the work into a message.
+        """
+        job = Job(id=secrets.token_urlsafe(9), kind=kind, created_at=self._clock())
+        self._running[job.id] = job
+        job.task = asyncio.create_task(self._run(job, work, format_error))
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Look a job up by ID, or None if it is unknown or was evicted."""
+        job = self._running.get(job_id)
+        if job is None and (job := self._finished.get(job_id)) is not None:
+            self._finished.move_to_end(job_id)
+        return job
+
+    async def cancel(self, job_id: str) -> Job | None:
+        """Cancel a running job and wait for it to stop; finished jobs are left as they are."""
+        job = self.get(job_id)
+        if job is not None and job.task is not None:
+            task = job.task
+            task.cancel()
+            await asyncio.wait([task])
+            if not job.finished:
+                # Cancelled before it started, so _run never saw the cancellation.
+                job.state = "cancelled"
+                self._finish(job)
+        return job
+
+    async def shutdown(self) -> None:
+        """Cancel every running job and wait for them to stop."""
+        for job_id in list(self._running):
+            await self.cancel(job_id)
+
+    async def _run(self, job: Job, work: Work, format_error: Callable[[Exception], str]) -> None:
+        try:
+            job.result = await work(job.progress)
+            job.state = "succeeded"
+        except asyncio.CancelledError:
+            job.state = "cancelled"
+        except Exception as e:
+            job.state = "failed"
+            job.error = format_error(e)
+        finally:
+            self._finish(job)
+
+    def _finish(self, job: Job) -> None:
+        job.finished_at = self._clock()
+        job.task = None
+        self._running.pop(job.id, None)
+        self._finished[job.id] = job
+        while len(self._finished) > self.max_finished:
+            self._finished.popitem(last=False)
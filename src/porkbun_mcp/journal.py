@@ -0,0 +1,159 @@
+"""Write-ahead journal that makes batched DNS changes resumable."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from porkbun_mcp.models import DNSOperationResult
+
+logger = logging.getLogger(__name__)
+
+
+def batch_id(operations: Iterable[Mapping[str, Any]]) -> str:
+    """Derive a stable ID from a batch's operations, so the same request maps to one journal."""
+    data = json.dumps(list(operations), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+@dataclass
+class JournalState:
+    """What an earlier run of a batch got through.
+
+    Attributes:
+        operations: The batch's operations, as planned by the earlier run.
+        started: Indexes of operations that were sent (or about to be sent).
+        results: Last recorded result per operation index.
+    """
+
+    operations: list[dict[str, Any]] = field(default_factory=list)
+    started: set[int] = field(default_factory=set)
+    results: dict[int, DNSOperationResult] = field(default_factory=dict)
+
+
+class BatchJournal:
+    """Append-only JSONL journal for one batch of DNS changes.
+
+    The journal opens with the batch's operations. Every operation is then
+    logged as ``started`` before it is sent and ``done`` with its result
+    afterwards, each line flushed to disk. After a crash the journal tells
+    which operations finished, which never started and which were in flight
+    when the process died. The file is removed once every operation of the
+    batch has succeeded. Until then a batch with the same ID cannot begin
+    again, so an interrupted batch is only ever finished by resuming it.
+
+    One file handle is kept open while the batch runs. Writes and fsyncs run
+    in a worker thread, one at a time, so they do not block the event loop.
+
+    Attributes:
+        id: Batch ID (see ``batch_id``).
+        path: Journal file.
+    """
+
+    def __init__(self, directory: Path, batch_id: str) -> None:
+        self.id = batch_id
+        self.path = directory / f"{batch_id}.jsonl"
+        self._file: TextIO | None = None
+        self._lock = asyncio.Lock()
+
+    async def begin(self, operations: list[dict[str, Any]]) -> None:
+        """Start the journal for the batch.
+
+        Args:
+            operations: The batch's operations, in JSON form.
+
+        Raises:
+            FileExistsError: If the batch is running or was interrupted; it must
+                be resumed, since starting over would repeat finished operations.
+            OSError: If the journal cannot be written; nothing should be sent then.
+        """
+        async with self._lock:
+            await asyncio.to_thread(self._create, {"event": "planned", "operations": operations})
+        logger.info("Journaling batch %s to %s", self.id, self.path)
+
+    async def load(self) -> JournalState | None:
+        """Replay the journal, or return None if there is none for this batch."""
+        return await asyncio.to_thread(self._replay)
+
+    async def started(self, index: int) -> None:
+        """Record that an operation is about to be sent.
+
+        Raises:
+            OSError: If the entry cannot be written; the operation must not be sent.
+        """
+        await self._append({"event": "started", "index": index})
+
+    async def done(self, result: DNSOperationResult) -> None:
+        """Record an operation's result.
+
+        A write failure is only logged: the operation then looks in doubt on
+        resume, which is checked against the live zone before anything is redone.
+        """
+        try:
+            await self._append({"event": "done", "result": result.model_dump(mode="json")})
+        except OSError as e:
+            logger.warning("Could not write to batch journal %s: %s", self.path, e)
+
+    def close(self) -> None:
+        """Close the journal file, keeping it for a later resume."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def finish(self) -> None:
+        """Remove the journal of a batch that completed."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    async def _append(self, entry: dict[str, Any]) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._write, entry)
+
+    def _create(self, entry: dict[str, Any]) -> None:
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("x")
+        self._write(entry)
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        if self._file is None:
+            self._file = self.path.open("a")
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _replay(self) -> JournalState | None:
+        try:
+            lines = self.path.read_text().splitlines()
+        except FileNotFoundError:
+            return None
+        state = JournalState()
+        for line in lines:
+            try:
+                self._replay_entry(state, json.loads(line))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                # A line torn by a crash mid-write, or otherwise malformed; the
+                # operation it recorded stays in doubt.
+                continue
+        return state
+
+    @staticmethod
+    def _replay_entry(state: JournalState, entry: dict[str, Any]) -> None:
+        match entry.get("event"):
+            case "planned":
+                operations = entry["operations"]
+                if not isinstance(operations, list):
+                    raise TypeError("operations must be a list")
+                state.operations = operations
+            case "started":
+                state.started.add(int(entry["index"]))
+            case "done":
+                result = DNSOperationResult.model_validate(entry["result"])
+                state.results[result.index] = result
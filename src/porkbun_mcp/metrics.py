@@ -0,0 +1,212 @@
+"""In-process metrics rendered in the Prometheus text exposition format."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans cached reads (milliseconds) to slow bulk jobs and long queues.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+
+    def _key(self, values: Sequence[str]) -> tuple[str, ...]:
+        if len(values) != len(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {tuple(values)}")
+        return tuple(values)
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add ``amount`` to the count for the given label values."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Current count for the given label values."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        """Exposition lines for this metric."""
+        return super().render() + [
+            f"{self.name}{_format_labels(self.labels, k)} {_format_value(v)}"
+            for k, v in sorted(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    """Value per label set that can go up and down."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """Subtract ``amount`` from the value for the given label values."""
+        self.inc(*labels, amount=-amount)
+
+
+@dataclass
+class _Series:
+    counts: list[int]
+    sum: float = 0.0
+    count: int = 0
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], _Series] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation for the given label values."""
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(counts=[0] * len(self.buckets))
+        i = bisect_left(self.buckets, value)
+        if i < len(self.buckets):
+            series.counts[i] += 1
+        series.sum += value
+        series.count += 1
+
+    def count(self, *labels: str) -> int:
+        """Number of observations for the given label values."""
+        series = self._series.get(self._key(labels))
+        return series.count if series else 0
+
+    def render(self) -> list[str]:
+        """Exposition lines for this metric."""
+        lines = super().render()
+        names = (*self.labels, "le")
+        for key, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets, series.counts, strict=True):
+                cumulative += n
+                labels = _format_labels(names, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(names, (*key, "+Inf"))
+            lines.append(f"{self.name}_bucket{labels} {series.count}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series.sum)}")
+            lines.append(f"{self.name}_count{labels} {series.count}")
+        return lines
+
+
+@dataclass
+class Metrics:
+    """Metrics collected by the server, served at ``/metrics`` over HTTP.
+
+    Tool metrics are recorded by ``MetricsMiddleware``; upstream metrics by
+    ``Upstream`` for every request actually sent to Porkbun, so coalesced and
+    cached reads do not appear there. Errors are labelled with
+    ``error_category``.
+
+    Attributes:
+        tool_duration: Seconds per tool call, by tool.
+        tool_errors: Failed tool calls, by tool and error category.
+        tool_in_flight: Tool calls currently running, by tool.
+        upstream_duration: Seconds per Porkbun request, by AsyncPiglet method.
+        upstream_errors: Failed Porkbun requests, by method and error category.
+        upstream_in_flight: Porkbun requests currently running, by method.
+        rate_limit_wait: Seconds requests queued for the rate limiter, by endpoint class.
+    """
+
+    tool_duration: Histogram = field(
+        default_factory=lambda: Histogram(
+            "porkbun_mcp_tool_duration_seconds", "Tool call duration.", ["tool"]
+        )
+    )
+    tool_errors: Counter = field(
+        default_factory=lambda: Counter(
+            "porkbun_mcp_tool_errors_total", "Failed tool calls.", ["tool", "category"]
+        )
+    )
+    tool_in_flight: Gauge = field(
+        default_factory=lambda: Gauge(
+            "porkbun_mcp_tool_in_flight", "Tool calls currently running.", ["tool"]
+        )
+    )
+    upstream_duration: Histogram = field(
+        default_factory=lambda: Histogram(
+            "porkbun_mcp_upstream_request_duration_seconds",
+            "Porkbun API request duration.",
+            ["method"],
+        )
+    )
+    upstream_errors: Counter = field(
+        default_factory=lambda: Counter(
+            "porkbun_mcp_upstream_errors_total",
+            "Failed Porkbun API requests.",
+            ["method", "category"],
+        )
+    )
+    upstream_in_flight: Gauge = field(
+        default_factory=lambda: Gauge(
+            "porkbun_mcp_upstream_in_flight",
+            "Porkbun API requests currently running.",
+            ["method"],
+        )
+    )
+    rate_limit_wait: Histogram = field(
+        default_factory=lambda: Histogram(
+            "porkbun_mcp_rate_limit_wait_seconds",
+            "Time Porkbun API requests queued for the client-side rate limiter.",
+            ["endpoint_class"],
+        )
+    )
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in vars(self).values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,124 @@
+"""FastMCP middleware applied to every tool call."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware
+
+from porkbun_mcp.context import get_app_context
+from porkbun_mcp.errors import error_category
+from porkbun_mcp.retry import CallAttempts, current_attempts
+
+if TYPE_CHECKING:
+    import mcp.types as mt
+    from fastmcp.server.middleware import CallNext, MiddlewareContext
+    from fastmcp.tools.base import ToolResult
+
+    from porkbun_mcp.metrics import Metrics
+
+
+class AttemptsMiddleware(Middleware):
+    """Report how many Porkbun API attempts each tool call needed.
+
+    Successful results carry ``{"porkbun": {"attempts": n, "upstream_calls": m}}``
+    in their metadata. Errors after retries mention the attempt count.
+    """
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        """Count upstream attempts made while the tool runs."""
+        counter = CallAttempts()
+        token = current_attempts.set(counter)
+        try:
+            result = await call_next(context)
+        except ToolError as e:
+            if counter.retried:
+                raise ToolError(f"{e} (gave up after {counter.attempts} attempts)") from e
+            raise
+        finally:
+            current_attempts.reset(token)
+
+        result.meta = {
+            **(result.meta or {}),
+            "porkbun": {"attempts": counter.attempts, "upstream_calls": counter.calls},
+        }
+        return result
+
+
+class MetricsMiddleware(Middleware):
+    """Record latency, errors and concurrency of every tool call.
+
+    Attributes:
+        metrics: Metrics the calls are recorded in.
+    """
+
+    def __init__(self, metrics: Metrics) -> None:
+        self.metrics = metrics
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        """Time the tool call and count its failure, if any."""
+        tool = context.message.name
+        metrics = self.metrics
+        metrics.tool_in_flight.inc(tool)
+        start = time.perf_counter()
+        try:
+            return await call_next(context)
+        except Exception as e:
+            metrics.tool_errors.inc(tool, error_category(e))
+            raise
+        finally:
+            metrics.tool_duration.observe(time.perf_counter() - start, tool)
+            metrics.tool_in_flight.dec(tool)
+
+
+class TracingMiddleware(Middleware):
+    """Trace each tool call when the server's tracer is enabled.
+
+    The call becomes a root span, with a ``piglet.*`` span per Porkbun
+    request and ``convert`` spans for model conversion inside it.
+    """
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        """Wrap the tool call in a span."""
+        if context.fastmcp_context is None:
+            return await call_next(context)
+        tracer = get_app_context(context.fastmcp_context).tracer
+        if not tracer.enabled:
+            return await call_next(context)
+
+        tool = context.message.name
+        with tracer.start(f"tool {tool}", tool=tool):
+            return await call_next(context)
+
+
+class ProfilingMiddleware(Middleware):
+    """Profile tool calls chosen by the server's ToolProfiler, if one is configured."""
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        """Run the tool call under cProfile when it is selected."""
+        if context.fastmcp_context is None:
+            return await call_next(context)
+        tool = context.message.name
+        profiler = get_app_context(context.fastmcp_context).profiler
+        if profiler is None or not profiler.should_profile(tool):
+            return await call_next(context)
+        with profiler.profile(tool):
+            return await call_next(context)
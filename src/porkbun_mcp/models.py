@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, model_serializer
 
 
 class DNSRecord(BaseModel):
@@ -17,6 +19,55 @@ class DNSRecord(BaseModel):
     notes: str | None = Field(default=None, description="Optional notes")
 
 
+DNSRecordField = Literal["id", "type", "name", "content", "ttl", "priority", "notes"]
+
+
+class PartialDNSRecord(BaseModel):
+    """A DNS record reduced to the requested fields; unrequested fields are omitted."""
+
+    id: str | None = Field(default=None, description="Record ID")
+    type: str | None = Field(default=None, description="Record type (A, AAAA, MX, etc.)")
+    name: str | None = Field(default=None, description="Full record name (e.g., www.example.com)")
+    content: str | None = Field(default=None, description="Record content")
+    ttl: int | None = Field(default=None, description="Time to live in seconds")
+    priority: int | None = Field(default=None, description="Priority (MX, SRV only)")
+    notes: str | None = Field(default=None, description="Optional notes")
+
+    @model_serializer(mode="wrap")
+    def _only_requested(self, handler: SerializerFunctionWrapHandler) -> Any:
+        data = handler(self)
+        return {k: v for k, v in data.items() if k in self.model_fields_set}
+
+
+class Page[T](BaseModel):
+    """One page of a paginated result."""
+
+    items: list[T] = Field(description="Items on this page")
+    total: int = Field(description="Items across all pages")
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to get the next page; None on the last page"
+    )
+
+
+OutputFormat = Literal["objects", "table"]
+
+OperationStatus = Literal["created", "updated", "deleted", "failed", "skipped"]
+
+
+class Table(BaseModel):
+    """Items as arrays of values under a single header.
+
+    Columns whose value is null or the default in every item are left out.
+    """
+
+    columns: list[str] = Field(description="Column names, in the order of each row's values")
+    rows: list[list[str | int | bool | None]] = Field(description="One array of values per item")
+    total: int = Field(description="Items across all pages")
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to get the next page; None on the last page"
+    )
+
+
 class OperationResult(BaseModel):
     """Base class for operation results with status and message."""
 
@@ -128,3 +179,195 @@ class PingResult(BaseModel):
 
     status: str = Field(description="API status")
     your_ip: str = Field(description="Your public IP address")
+
+
+class ZoneCacheStats(BaseModel):
+    """DNS zone cache counters."""
+
+    enabled: bool = Field(description="Whether zone caching is enabled")
+    hits: int = Field(description="Reads served from a cached zone")
+    misses: int = Field(description="Reads that fetched the zone upstream")
+    evictions: int = Field(description="Zones evicted to stay within the byte budget")
+    invalidations: int = Field(description="Zones dropped after a write")
+    zones: int = Field(description="Zones currently cached")
+    bytes: int = Field(description="Estimated bytes held by cached zones")
+
+
+class CoalescingStats(BaseModel):
+    """Counters for identical concurrent read calls that shared one request."""
+
+    calls: int = Field(description="Read calls made to the Porkbun API")
+    coalesced: int = Field(description="Calls that joined an identical in-flight request")
+    in_flight: int = Field(description="Distinct requests currently in flight")
+
+
+class RateLimitStats(BaseModel):
+    """Client-side rate limiter counters for one endpoint class."""
+
+    endpoint_class: str = Field(description="Endpoint class (general, check, write)")
+    max_rate: float = Field(description="Configured requests per second")
+    rate: float = Field(description="Current requests per second after adapting to 429s")
+    waits: int = Field(description="Calls that waited for a token")
+    wait_seconds: float = Field(description="Total seconds spent waiting")
+    throttled: int = Field(description="Upstream 429 responses observed")
+
+
+class ServerStats(BaseModel):
+    """Runtime statistics for this server process."""
+
+    zone_cache: ZoneCacheStats = Field(description="DNS zone cache counters")
+    coalescing: CoalescingStats = Field(description="Request coalescing counters")
+    rate_limits: list[RateLimitStats] = Field(description="Rate limiter counters per bucket")
+
+
+class DNSOperation(BaseModel):
+    """A single DNS change for a batch of operations."""
+
+    action: Literal["create", "edit", "delete"] = Field(description="Change to make")
+    domain: str = Field(description="Domain name (e.g., 'example.com')")
+    record_type: str | None = Field(
+        default=None, description="DNS record type (required for create and edit)"
+    )
+    content: str | None = Field(
+        default=None, description="Record content (required for create and edit)"
+    )
+    name: str | None = Field(
+        default=None, description="Subdomain (None for root, '*' for wildcard)"
+    )
+    ttl: int = Field(default=600, ge=600, description="TTL in seconds (minimum 600)")
+    priority: int | None = Field(default=None, ge=0, description="Priority for MX/SRV records")
+    record_id: str | None = Field(
+        default=None, description="Record ID (required for edit and delete)"
+    )
+
+
+class DNSOperationResult(BaseModel):
+    """Outcome of one operation in a batch."""
+
+    index: int = Field(description="Position of the operation in the request")
+    action: str = Field(description="Requested change (create, edit, delete)")
+    domain: str = Field(description="Domain name")
+    status: OperationStatus = Field(description="Outcome; skipped operations were not attempted")
+    record_id: str | None = Field(default=None, description="Record ID affected")
+    error: str | None = Field(default=None, description="Error message if the operation failed")
+
+
+class DNSBulkResult(BaseModel):
+    """Result of applying a batch of DNS operations."""
+
+    succeeded: int = Field(description="Operations that succeeded")
+    failed: int = Field(description="Operations that failed")
+    skipped: int = Field(description="Operations not attempted after an earlier failure")
+    results: list[DNSOperationResult] = Field(description="One result per operation, in order")
+    batch_id: str | None = Field(
+        default=None,
+        description="Set if the batch is incomplete and journaled; call again with resume set "
+        "to this ID to finish it",
+    )
+    resumed: int = Field(default=0, description="Operations done by an earlier run, not repeated")
+
+
+class DNSDesiredRecord(BaseModel):
+    """A record that should exist after a zone sync."""
+
+    record_type: str = Field(description="DNS record type (A, AAAA, CNAME, MX, TXT, etc.)")
+    content: str = Field(description="Record content")
+    name: str | None = Field(
+        default=None, description="Subdomain (None for root, '*' for wildcard)"
+    )
+    ttl: int = Field(default=600, ge=600, description="TTL in seconds (minimum 600)")
+    priority: int | None = Field(default=None, ge=0, description="Priority for MX/SRV records")
+
+
+class DNSSyncResult(BaseModel):
+    """Plan, and outcome if applied, of reconciling a zone to a desired record set."""
+
+    domain: str = Field(description="Domain name")
+    dry_run: bool = Field(description="True if the plan was only computed, not applied")
+    unchanged: int = Field(description="Existing records that already match")
+    ignored: int = Field(description="Existing records left alone (apex NS records)")
+    operations: list[DNSOperation] = Field(
+        description="Changes needed, deletes first; can be passed to dns_bulk_apply"
+    )
+    applied: DNSBulkResult | None = Field(
+        default=None, description="Outcome of each operation when not a dry run"
+    )
+
+
+class DomainDNSRecords(BaseModel):
+    """DNS records of one domain in a multi-domain listing."""
+
+    domain: str = Field(description="Domain name")
+    records: list[DNSRecord] | None = Field(
+        default=None, description="DNS records (None if they could not be fetched)"
+    )
+    error: str | None = Field(default=None, description="Error message if the fetch failed")
+
+
+class DNSListManyResult(BaseModel):
+    """DNS records for many domains."""
+
+    succeeded: int = Field(description="Domains whose records were fetched")
+    failed: int = Field(description="Domains that could not be fetched")
+    domains: list[DomainDNSRecords] = Field(description="One entry per domain, in order")
+
+
+class DomainInventoryItem(BaseModel):
+    """Nameservers and URL forwards of one domain."""
+
+    domain: str = Field(description="Domain name")
+    nameservers: list[str] | None = Field(
+        default=None, description="Nameservers (None if they could not be fetched)"
+    )
+    url_forwards: list[URLForward] | None = Field(
+        default=None, description="URL forwarding rules (None if they could not be fetched)"
+    )
+    errors: list[str] = Field(default_factory=list, description="Errors fetching this domain")
+
+
+class DomainInventory(BaseModel):
+    """Nameservers and URL forwards for many domains."""
+
+    failed: int = Field(description="Domains with at least one error")
+    domains: list[DomainInventoryItem] = Field(description="One entry per domain, in order")
+
+
+class DNSSearchMatch(DNSRecord):
+    """A DNS record found by an account-wide search."""
+
+    domain: str = Field(description="Domain the record belongs to")
+
+
+class DNSSearchResult(BaseModel):
+    """Records matching an account-wide DNS search."""
+
+    domains_searched: int = Field(description="Domains whose records were searched")
+    total: int = Field(description="Matching records, before the limit")
+    records: list[DNSSearchMatch] = Field(description="Matching records")
+    errors: list[str] = Field(
+        default_factory=list, description="Domains that could not be searched"
+    )
+
+
+class JobInfo(BaseModel):
+    """Status of a background job."""
+
+    job_id: str = Field(description="Job ID for job_status, job_result and job_cancel")
+    kind: str = Field(description="Tool that started the job")
+    state: Literal["running", "succeeded", "failed", "cancelled"] = Field(
+        description="Current state"
+    )
+    done: int = Field(description="Items finished so far")
+    total: int | None = Field(default=None, description="Items expected in all, if known")
+    created_at: str = Field(description="When the job was submitted (ISO 8601)")
+    finished_at: str | None = Field(default=None, description="When the job finished (ISO 8601)")
+    error: str | None = Field(default=None, description="Error message if the job failed")
+
+
+class JobResult(BaseModel):
+    """Status of a background job and, once it succeeded, the tool's result."""
+
+    job: JobInfo = Field(description="Job status")
+    result: Any = Field(
+        default=None, description="What the tool would have returned (None until succeeded)"
+    )
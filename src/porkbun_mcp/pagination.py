@@ -0,0 +1,172 @@
+"""Cursor pagination over short-lived server-side result snapshots."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from fastmcp.exceptions import ToolError
+
+from porkbun_mcp.models import Page
+
+DEFAULT_PAGE_SIZE = 100
+
+
+@dataclass
+class _Snapshot:
+    scope: str
+    items: Sequence[Any]
+    expires_at: float
+
+
+def encode_cursor(snapshot_id: str, offset: int) -> str:
+    """Build the opaque cursor for a position in a snapshot."""
+    return base64.urlsafe_b64encode(f"{snapshot_id}:{offset}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Split a cursor into snapshot ID and offset.
+
+    Raises:
+        ToolError: If the cursor was not produced by ``encode_cursor``.
+    """
+    try:
+        snapshot_id, offset = base64.urlsafe_b64decode(cursor).decode().rsplit(":", 1)
+        position = int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ToolError("Invalid cursor") from None
+    if position < 0:
+        raise ToolError("Invalid cursor")
+    return snapshot_id, position
+
+
+class SnapshotStore:
+    """Full tool results kept briefly so later pages need no upstream calls.
+
+    The first page of a paginated call stores the complete result; the
+    returned cursor points into that snapshot, so every page comes from the
+    same data even if a write lands in between. Snapshots expire after
+    ``ttl`` seconds, and the oldest are dropped beyond ``max_snapshots``.
+
+    Attributes:
+        ttl: Seconds a snapshot stays available.
+        max_snapshots: Maximum snapshots kept at once.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_snapshots: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_snapshots = max_snapshots
+        self._clock = clock
+        self._snapshots: OrderedDict[str, _Snapshot] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def put(self, scope: str, items: Sequence[Any]) -> str:
+        """Store a result and return its snapshot ID.
+
+        Args:
+            scope: Name of the tool the result belongs to.
+            items: The complete result.
+        """
+        self._expire()
+        snapshot_id = secrets.token_urlsafe(9)
+        self._store(snapshot_id, scope, items)
+        return snapshot_id
+
+    async def shared(
+        self, scope: str, load: Callable[[], Awaitable[Sequence[Any]]]
+    ) -> Sequence[Any]:
+        """Return the result stored for a scope, loading it again once it expires.
+
+        For results that many calls reuse, such as the account's domain names.
+
+        Args:
+            scope: Name of the shared result.
+            load: Coroutine function producing the result.
+        """
+        self._expire()
+        # ":" never appears in IDs from put, so the key cannot collide with them.
+        key = f"shared:{scope}"
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            return snapshot.items
+        items = await load()
+        self._store(key, scope, items)
+        return items
+
+    def get(self, scope: str, snapshot_id: str) -> Sequence[Any]:
+        """Return a stored result.
+
+        Raises:
+            ToolError: If the snapshot expired or belongs to another tool.
+        """
+        self._expire()
+        snapshot = self._snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise ToolError("Cursor has expired; repeat the request without a cursor")
+        if snapshot.scope != scope:
+            raise ToolError(f"Cursor does not belong to {scope}")
+        return snapshot.items
+
+    async def page(
+        self,
+        scope: str,
+        cursor: str | None,
+        page_size: int | None,
+        load: Callable[[], Awaitable[Sequence[Any]]],
+        convert: Callable[[list[Any]], Sequence[Any]] | None = None,
+        model: type[Page[Any]] = Page,
+    ) -> Page[Any]:
+        """Return one page, loading and snapshotting the result on the first page.
+
+        Args:
+            scope: Name of the tool being paginated.
+            cursor: Cursor from the previous page, or None for the first page.
+            page_size: Items per page (defaults to ``DEFAULT_PAGE_SIZE``).
+            load: Coroutine function producing the complete result.
+            convert: Turns the items of one page into their response form, so
+                the snapshot can hold a more compact form of the result.
+            model: Page model to build, parametrized with the item type the
+                tool declares (e.g. ``Page[DomainInfo]``) so results serialize
+                against their declared schema.
+        """
+        size = page_size or DEFAULT_PAGE_SIZE
+        if cursor is None:
+            items = await load()
+            snapshot_id, offset = None, 0
+        else:
+            snapshot_id, offset = decode_cursor(cursor)
+            items = self.get(scope, snapshot_id)
+
+        end = offset + size
+        next_cursor = None
+        if end < len(items):
+            if snapshot_id is None:
+                snapshot_id = self.put(scope, items)
+            next_cursor = encode_cursor(snapshot_id, end)
+        page = list(items[offset:end])
+        converted = convert(page) if convert is not None else page
+        return model(items=list(converted), total=len(items), next_cursor=next_cursor)
+
+    def _store(self, snapshot_id: str, scope: str, items: Sequence[Any]) -> None:
+        self._snapshots[snapshot_id] = _Snapshot(scope, items, self._clock() + self.ttl)
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+
+    def _expire(self) -> None:
+        now = self._clock()
+        for snapshot_id, snapshot in list(self._snapshots.items()):
+            if snapshot.expires_at <= now:
+                del self._snapshots[snapshot_id]
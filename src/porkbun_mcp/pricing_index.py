@@ -0,0 +1,293 @@
+"""Cached, queryable TLD pricing index."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+PriceField = Literal["registration", "renewal", "transfer"]
+SortField = Literal["tld", "registration", "renewal", "transfer"]
+
+PRICE_FIELDS: tuple[PriceField, ...] = ("registration", "renewal", "transfer")
+SNAPSHOT_VERSION = 1
+
+
+def _parse_price(value: str) -> Decimal | None:
+    """Parse a Porkbun price string, returning None when it is not a number."""
+    try:
+        price = Decimal(value)
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    return price if price.is_finite() else None
+
+
+@dataclass(frozen=True, slots=True)
+class PriceEntry:
+    """Pricing for one TLD with both the upstream strings and parsed decimals."""
+
+    tld: str
+    registration: str
+    renewal: str
+    transfer: str
+    registration_price: Decimal | None
+    renewal_price: Decimal | None
+    transfer_price: Decimal | None
+
+    @classmethod
+    def create(cls, tld: str, registration: str, renewal: str, transfer: str) -> PriceEntry:
+        """Build an entry, parsing each price string to a Decimal."""
+        return cls(
+            tld=tld,
+            registration=registration,
+            renewal=renewal,
+            transfer=transfer,
+            registration_price=_parse_price(registration),
+            renewal_price=_parse_price(renewal),
+            transfer_price=_parse_price(transfer),
+        )
+
+    def price(self, field: PriceField) -> Decimal | None:
+        """Return the parsed price for a field."""
+        return getattr(self, f"{field}_price")
+
+
+async def _fetch_upstream() -> Mapping[str, Any]:
+    from oinker.pricing import get_pricing
+
+    return await get_pricing()
+
+
+async def _fetch_from(base_url: str) -> Mapping[str, Any]:
+    # get_pricing has no base URL option, so send the same unauthenticated
+    # request through oinker's HTTP client, which applies its usual error mapping.
+    from oinker._config import OinkerConfig
+    from oinker._http import HttpClient
+    from oinker.pricing import TLDPricing
+
+    async with HttpClient(OinkerConfig(base_url=base_url)) as http:
+        data = await http.post("/pricing/get", authenticated=False)
+    return {
+        tld: TLDPricing.from_api_response(tld, prices)
+        for tld, prices in data.get("pricing", {}).items()
+    }
+
+
+def pricing_fetcher(base_url: str | None = None) -> Callable[[], Awaitable[Mapping[str, Any]]]:
+    """Return the function that fetches TLD pricing.
+
+    oinker's ``get_pricing`` always fetches from api.porkbun.com, so an API
+    base URL override (e.g. a local fake API) sends the request itself.
+
+    Args:
+        base_url: API base URL, or None for Porkbun itself.
+    """
+    if base_url is None:
+        return _fetch_upstream
+    return partial(_fetch_from, base_url.rstrip("/"))
+
+
+def default_snapshot_path() -> Path:
+    """Return the default on-disk location of the pricing snapshot."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "porkbun-mcp" / "pricing.json"
+
+
+class PricingIndex:
+    """In-memory TLD pricing index backed by an on-disk snapshot.
+
+    Pricing is fetched from Porkbun at most once per ``refresh_interval``; the
+    snapshot lets every server process (one per stdio session) share a fetch.
+    Entries are pre-sorted by each price so range and top-N queries only touch
+    the rows they return.
+
+    Attributes:
+        snapshot_path: JSON snapshot location, or None to keep pricing in memory only.
+        refresh_interval: Seconds before pricing is fetched again.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path | None = None,
+        refresh_interval: float = 86400.0,
+        fetch: Callable[[], Awaitable[Mapping[str, Any]]] = _fetch_upstream,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.snapshot_path = snapshot_path
+        self.refresh_interval = refresh_interval
+        self._fetch = fetch
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._fetched_at: float | None = None
+        self._entries: list[PriceEntry] = []
+        self._by_tld: dict[str, PriceEntry] = {}
+        self._sorted: dict[SortField, list[PriceEntry]] = {}
+
+    @property
+    def fetched_at(self) -> float | None:
+        """Epoch seconds when the loaded pricing was fetched upstream."""
+        return self._fetched_at
+
+    def _is_fresh(self, fetched_at: float | None) -> bool:
+        return fetched_at is not None and self._clock() - fetched_at < self.refresh_interval
+
+    async def entries(self) -> list[PriceEntry]:
+        """Return all entries, loading or refreshing pricing if it is stale."""
+        if self._is_fresh(self._fetched_at):
+            return self._entries
+
+        async with self._lock:
+            if self._is_fresh(self._fetched_at):
+                return self._entries
+            if self.snapshot_path is not None and self._fetched_at is None:
+                await asyncio.to_thread(self._load_snapshot)
+                if self._is_fresh(self._fetched_at):
+                    return self._entries
+            try:
+                pricing = await self._fetch()
+            except Exception:
+                if not self._entries:
+                    raise
+                logger.warning("Pricing refresh failed; serving pricing from %s", self._fetched_at)
+                return self._entries
+
+            self._load(
+                (
+                    PriceEntry.create(tld, p.registration, p.renewal, p.transfer)
+                    for tld, p in pricing.items()
+                ),
+                self._clock(),
+            )
+            if self.snapshot_path is not None:
+                await asyncio.to_thread(self._save_snapshot)
+        return self._entries
+
+    async def query(
+        self,
+        tlds: Iterable[str] | None = None,
+        price_field: PriceField = "registration",
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        sort_by: SortField | None = None,
+        limit: int | None = None,
+    ) -> list[PriceEntry]:
+        """Filter and sort pricing entries.
+
+        Args:
+            tlds: Only include these TLDs (leading dots are ignored).
+            price_field: Price that ``min_price`` and ``max_price`` apply to.
+            min_price: Inclusive lower bound for ``price_field``.
+            max_price: Inclusive upper bound for ``price_field``.
+            sort_by: Sort by TLD name or ascending price. None keeps upstream order.
+            limit: Maximum number of entries to return.
+
+        Returns:
+            Matching entries.
+        """
+        await self.entries()
+        ranged = min_price is not None or max_price is not None
+
+        if tlds is not None:
+            wanted = dict.fromkeys(t.strip().lstrip(".").lower() for t in tlds)
+            candidates: list[PriceEntry] = [self._by_tld[t] for t in wanted if t in self._by_tld]
+            if sort_by is not None:
+                candidates = sorted(candidates, key=self._sort_key(sort_by))
+        elif sort_by is not None:
+            candidates = self._sorted[sort_by]
+            if ranged and sort_by == price_field:
+                candidates = self._price_slice(price_field, min_price, max_price)
+        else:
+            candidates = self._entries
+
+        matches: Iterable[PriceEntry] = candidates
+        if ranged:
+            matches = (
+                e for e in candidates if _in_range(e.price(price_field), min_price, max_price)
+            )
+        return list(islice(matches, limit))
+
+    def _price_slice(
+        self, field: PriceField, min_price: Decimal | None, max_price: Decimal | None
+    ) -> list[PriceEntry]:
+        entries = self._sorted[field]
+        key = self._sort_key(field)
+        lo, hi = 0, len(entries)
+        if min_price is not None:
+            lo = bisect_left(entries, (False, min_price), key=key)
+        if max_price is not None:
+            hi = bisect_right(entries, (False, max_price), key=key)
+        return entries[lo:hi]
+
+    @staticmethod
+    def _sort_key(field: SortField) -> Callable[[PriceEntry], Any]:
+        if field == "tld":
+            return lambda e: e.tld
+        # Entries without a parseable price sort last.
+        return lambda e: (e.price(field) is None, e.price(field) or Decimal(0))
+
+    def _load(self, entries: Iterable[PriceEntry], fetched_at: float) -> None:
+        self._entries = list(entries)
+        self._by_tld = {e.tld.lower(): e for e in self._entries}
+        self._sorted = {"tld": sorted(self._entries, key=lambda e: e.tld)}
+        for field in PRICE_FIELDS:
+            self._sorted[field] = sorted(self._entries, key=self._sort_key(field))
+        self._fetched_at = fetched_at
+
+    def _load_snapshot(self) -> None:
+        assert self.snapshot_path is not None
+        try:
+            data = json.loads(self.snapshot_path.read_text())
+            if data.get("version") != SNAPSHOT_VERSION:
+                return
+            # Parsed in full first, so a malformed snapshot leaves the index empty.
+            entries = [
+                PriceEntry.create(tld, p["registration"], p["renewal"], p["transfer"])
+                for tld, p in data["pricing"].items()
+            ]
+            fetched_at = float(data["fetched_at"])
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable pricing snapshot %s: %s", self.snapshot_path, e)
+            return
+        self._load(entries, fetched_at)
+
+    def _save_snapshot(self) -> None:
+        assert self.snapshot_path is not None
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "fetched_at": self._fetched_at,
+            "pricing": {
+                e.tld: {
+                    "registration": e.registration,
+                    "renewal": e.renewal,
+                    "transfer": e.transfer,
+                }
+                for e in self._entries
+            },
+        }
+        tmp = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data))
+            tmp.replace(self.snapshot_path)
+        except OSError as e:
+            logger.warning("Could not write pricing snapshot %s: %s", self.snapshot_path, e)
+
+
+def _in_range(price: Decimal | None, low: Decimal | None, high: Decimal | None) -> bool:
+    if price is None:
+        return False
+    return (low is None or price >= low) and (high is None or price <= high)
@@ -0,0 +1,77 @@
+"""Opt-in cProfile capture of individual tool calls."""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import random
+import secrets
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ToolProfiler:
+    """Profile selected or sampled tool calls, writing one pstats file per call.
+
+    Only one call is profiled at a time, because the interpreter allows a
+    single active profiler. Tool calls run on one event loop, so a profile
+    also contains whatever other calls did while it was awaiting Porkbun.
+    Files are named ``<time>-<tool>-<id>.prof`` and can be read with
+    ``python -m pstats`` or tools such as snakeviz.
+
+    Attributes:
+        directory: Where profile files are written.
+        tools: Tool names to profile; empty means every tool.
+        sample_rate: Fraction of matching calls that are profiled.
+        profiled: Calls profiled so far.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        tools: Iterable[str] = (),
+        sample_rate: float = 1.0,
+        random: Callable[[], float] = random.random,
+    ) -> None:
+        self.directory = directory
+        self.tools = frozenset(tools)
+        self.sample_rate = sample_rate
+        self.profiled = 0
+        self._random = random
+        self._active = False
+
+    def should_profile(self, tool: str) -> bool:
+        """Decide whether to profile a call to ``tool``."""
+        if self._active or (self.tools and tool not in self.tools):
+            return False
+        return self.sample_rate >= 1 or self._random() < self.sample_rate
+
+    @contextmanager
+    def profile(self, tool: str) -> Iterator[Path]:
+        """Profile a block and write the result, yielding the file it will go to.
+
+        A profile that cannot be written is logged and dropped; the tool call
+        itself is never affected.
+        """
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        path = self.directory / f"{stamp}-{tool}-{secrets.token_hex(3)}.prof"
+        profiler = cProfile.Profile()
+        self._active = True
+        profiler.enable()
+        try:
+            yield path
+        finally:
+            profiler.disable()
+            self._active = False
+            self.profiled += 1
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                profiler.dump_stats(path)
+            except OSError as e:
+                logger.warning("Could not write profile %s: %s", path, e)
+            else:
+                logger.info("Profiled %s to %s", tool, path)
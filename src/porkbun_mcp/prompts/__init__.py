@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from fastmcp import FastMCP
 
+# Tool group -> (module under porkbun_mcp.prompts, registration function).
+# Prompts are registered with the tool group whose tools they walk through.
+PROMPT_GROUPS: dict[str, tuple[str, str]] = {
+    "dns": ("dns", "register_dns_prompts"),
+}
+
 
-def register_prompts(mcp: "FastMCP") -> None:
-    """Register all prompt templates with the MCP server.
+def register_prompts(mcp: "FastMCP", groups: Iterable[str] | None = None) -> None:
+    """Register prompt templates with the MCP server.
 
     Args:
         mcp: The FastMCP server instance.
+        groups: Tool groups whose prompts are registered. None registers all.
     """
-    from porkbun_mcp.prompts.dns import register_dns_prompts
-
-    register_dns_prompts(mcp)
+    for name in PROMPT_GROUPS if groups is None else groups:
+        if name in PROMPT_GROUPS:
+            module, function = PROMPT_GROUPS[name]
+            getattr(import_module(f"porkbun_mcp.prompts.{module}"), function)(mcp)
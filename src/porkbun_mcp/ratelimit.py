@@ -0,0 +1,175 @@
+"""Client-side adaptive rate limiting for Porkbun API calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+# Multiplicative decrease on a 429 and additive increase (as a fraction of the
+# configured rate) on each success, so the limiter converges below the real limit.
+_BACKOFF_FACTOR = 0.5
+_RECOVERY_STEP = 0.05
+_MIN_RATE_FRACTION = 0.1
+
+
+class TokenBucket:
+    """Token bucket that adapts its rate to upstream 429 responses.
+
+    Callers queue in FIFO order on an internal lock, so a caller sleeping for
+    a token holds the queue. ``retry_after`` from a 429 pauses the bucket.
+
+    Attributes:
+        max_rate: Configured requests per second; the rate never exceeds it.
+        rate: Current requests per second after adapting to 429s.
+        burst: Maximum number of tokens that can accumulate.
+        waits: Calls that slept for a token or queued behind another caller.
+        wait_seconds: Total time callers spent waiting.
+        throttled: Upstream 429 responses observed.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.throttled = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> float:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return now
+
+    def _delay(self) -> float:
+        now = self._refill()
+        pause = max(0.0, self._paused_until - now)
+        shortfall = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+        return max(pause, shortfall)
+
+    async def acquire(self, max_wait: float) -> float:
+        """Wait for a token.
+
+        Args:
+            max_wait: Longest time to queue before giving up.
+
+        Returns:
+            Seconds spent waiting.
+
+        Raises:
+            RateLimitError: If a token will not be available within ``max_wait``.
+        """
+        # Imported here so that startup does not load oinker (see LazyPiglet).
+        from oinker import RateLimitError
+
+        start = self._clock()
+        queued = self._lock.locked()
+        try:
+            async with asyncio.timeout(max_wait):
+                await self._lock.acquire()
+        except TimeoutError:
+            raise RateLimitError(
+                "Client-side rate limit queue is full", retry_after=max_wait
+            ) from None
+
+        try:
+            delay = self._delay()
+            remaining = max_wait - (self._clock() - start)
+            if delay > remaining:
+                raise RateLimitError("Client-side rate limit reached", retry_after=delay)
+            if delay > 0:
+                await self._sleep(delay)
+                self._refill()
+            self._tokens -= 1
+        finally:
+            self._lock.release()
+
+        waited = self._clock() - start
+        # The clock nearly always moves a little; only real waits are counted.
+        if queued or delay > 0:
+            self.waits += 1
+            self.wait_seconds += waited
+        return waited
+
+    def on_success(self) -> None:
+        """Creep the rate back towards the configured maximum."""
+        self.rate = min(self.max_rate, self.rate + self.max_rate * _RECOVERY_STEP)
+
+    def on_rate_limited(self, retry_after: float | None) -> None:
+        """Slow down after an upstream 429.
+
+        Args:
+            retry_after: Seconds the API asked us to wait, if it said.
+        """
+        self.throttled += 1
+        self.rate = max(self.max_rate * _MIN_RATE_FRACTION, self.rate * _BACKOFF_FACTOR)
+        pause = retry_after if retry_after is not None else 1 / self.rate
+        self._refill()
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, self._clock() + pause)
+
+
+class RateLimiter:
+    """Named token buckets shared by every Porkbun API call.
+
+    Buckets are looked up by endpoint class (``general``, ``check`` and
+    ``write``); classes without a bucket are not limited.
+
+    Attributes:
+        buckets: Token bucket per endpoint class.
+        max_wait: Longest a call queues for a token before failing.
+    """
+
+    def __init__(
+        self, buckets: dict[str, TokenBucket] | None = None, max_wait: float = 30.0
+    ) -> None:
+        self.buckets = buckets or {}
+        self.max_wait = max_wait
+
+    @classmethod
+    def from_rates(cls, rates: dict[str, float], max_wait: float) -> RateLimiter:
+        """Build a limiter from requests-per-second per endpoint class.
+
+        Args:
+            rates: Requests per second per endpoint class; zero disables limiting.
+            max_wait: Longest a call queues for a token before failing.
+        """
+        buckets = {name: TokenBucket(rate) for name, rate in rates.items() if rate > 0}
+        return cls(buckets, max_wait)
+
+    async def acquire(self, endpoint_class: str) -> float:
+        """Wait for a token for an endpoint class.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        bucket = self.buckets.get(endpoint_class)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire(self.max_wait)
+
+    def record(self, endpoint_class: str, error: BaseException | None) -> None:
+        """Feed the outcome of a call back into its bucket."""
+        bucket = self.buckets.get(endpoint_class)
+        if bucket is None:
+            return
+        if error is None:
+            bucket.on_success()
+            return
+        from oinker import RateLimitError
+
+        if isinstance(error, RateLimitError):
+            bucket.on_rate_limited(error.retry_after)
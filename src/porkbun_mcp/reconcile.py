@@ -0,0 +1,154 @@
+"""Minimal diff between a desired DNS record set and a live zone."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from porkbun_mcp.models import DNSOperation
+
+
+@dataclass(frozen=True, slots=True)
+class DesiredRecord:
+    """A record that should exist, with content already normalised by oinker.
+
+    Attributes:
+        name: Subdomain (None for the root).
+        record_type: Upper-case DNS record type.
+        content: Record content.
+        ttl: TTL in seconds.
+        priority: Priority, or None if the record type has none.
+    """
+
+    name: str | None
+    record_type: str
+    content: str
+    ttl: int
+    priority: int | None = None
+
+
+@dataclass
+class SyncPlan:
+    """Operations that turn a live zone into the desired record set.
+
+    Attributes:
+        operations: Deletes first, then edits and creates.
+        unchanged: Live records that already match.
+        ignored: Live records outside the sync's scope (apex NS records).
+    """
+
+    operations: list[DNSOperation] = field(default_factory=list)
+    unchanged: int = 0
+    ignored: int = 0
+
+
+def _subdomain(fqdn: str, domain: str) -> str | None:
+    """Turn a full record name back into the subdomain Porkbun expects."""
+    fqdn, domain = fqdn.lower(), domain.lower()
+    if fqdn == domain:
+        return None
+    return fqdn.removesuffix(f".{domain}")
+
+
+def _fqdn(name: str | None, domain: str) -> str:
+    return f"{name}.{domain}".lower() if name else domain.lower()
+
+
+def _needs_edit(current: Any, want: DesiredRecord) -> bool:
+    if current.ttl != want.ttl:
+        return True
+    return want.priority is not None and current.priority != want.priority
+
+
+def _write(
+    action: Literal["create", "edit"],
+    domain: str,
+    want: DesiredRecord,
+    record_id: str | None = None,
+) -> DNSOperation:
+    return DNSOperation(
+        action=action,
+        domain=domain,
+        record_type=want.record_type,
+        content=want.content,
+        name=want.name,
+        ttl=want.ttl,
+        priority=want.priority,
+        record_id=record_id,
+    )
+
+
+def plan_sync(domain: str, current: Iterable[Any], desired: Iterable[DesiredRecord]) -> SyncPlan:
+    """Compute the smallest set of changes that reconciles a zone.
+
+    Records are matched on (name, type, content), so a matching record is
+    never touched unless its TTL or priority changed. A leftover record and a
+    missing record with the same name and type become one edit instead of a
+    delete plus a create. Runs in O(n) using hash indexes. Apex NS records are
+    managed by Porkbun and are never changed.
+
+    Args:
+        domain: Domain being reconciled.
+        current: Records currently in the zone (oinker DNS records).
+        desired: Records that should exist afterwards.
+
+    Returns:
+        The plan.
+    """
+    plan = SyncPlan()
+    apex = domain.lower()
+    live: dict[tuple[str, str, str], list[Any]] = defaultdict(list)
+    for r in current:
+        rtype = r.record_type.upper()
+        if rtype == "NS" and r.name.lower() == apex:
+            plan.ignored += 1
+            continue
+        live[(r.name.lower(), rtype, r.content)].append(r)
+
+    edits: list[DNSOperation] = []
+    missing: dict[tuple[str, str], list[DesiredRecord]] = defaultdict(list)
+    for want in dict.fromkeys(desired):
+        key = (_fqdn(want.name, domain), want.record_type, want.content)
+        matches = live.get(key)
+        if not matches:
+            missing[key[:2]].append(want)
+            continue
+        record = matches.pop()
+        if not matches:
+            del live[key]
+        if _needs_edit(record, want):
+            edits.append(_write("edit", domain, want, record.id))
+        else:
+            plan.unchanged += 1
+
+    deletes: list[DNSOperation] = []
+    creates: list[DNSOperation] = []
+    leftovers: dict[tuple[str, str], list[Any]] = defaultdict(list)
+    for (name, rtype, _), records in live.items():
+        leftovers[(name, rtype)].extend(records)
+
+    for name_type, wants in missing.items():
+        spare = leftovers.get(name_type, [])
+        for want in wants:
+            if spare:
+                edits.append(_write("edit", domain, want, spare.pop().id))
+            else:
+                creates.append(_write("create", domain, want))
+
+    for records in leftovers.values():
+        deletes.extend(
+            DNSOperation(
+                action="delete",
+                domain=domain,
+                record_type=r.record_type.upper(),
+                content=r.content,
+                name=_subdomain(r.name, domain),
+                record_id=r.id,
+            )
+            for r in records
+        )
+
+    plan.operations = deletes + edits + creates
+    return plan
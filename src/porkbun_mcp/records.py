@@ -0,0 +1,63 @@
+"""Compact in-memory form of DNS records held by caches and bulk operations."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# TTLs and priorities repeat across a zone but are mostly above the range of
+# ints CPython shares, so equal values are shared here instead.
+_INTS: dict[int, int] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneRecord:
+    """A DNS record as kept in memory between fetching and responding.
+
+    Attribute names match oinker's ``DNSRecordResponse``, so code reading
+    records accepts either. Record types and names are interned: large zones
+    repeat a handful of types and, with wildcard and ACME challenge records,
+    many names. Response models are only built from these for the records a
+    tool actually returns.
+
+    Attributes:
+        id: Record ID.
+        name: Full record name.
+        record_type: Record type.
+        content: Record content.
+        ttl: TTL in seconds.
+        priority: Priority (0 if the type has none).
+        notes: Notes.
+    """
+
+    id: str
+    name: str
+    record_type: str
+    content: str
+    ttl: int
+    priority: int
+    notes: str
+
+
+def _shared_int(value: int) -> int:
+    return _INTS.setdefault(value, value)
+
+
+def compact_record(record: Any) -> ZoneRecord:
+    """Convert an oinker DNS record to a ``ZoneRecord``."""
+    return ZoneRecord(
+        id=record.id,
+        name=sys.intern(record.name),
+        record_type=sys.intern(record.record_type),
+        content=record.content,
+        ttl=_shared_int(record.ttl),
+        priority=_shared_int(record.priority),
+        notes=record.notes,
+    )
+
+
+def compact_zone(records: Iterable[Any]) -> list[ZoneRecord]:
+    """Convert a zone's oinker records to ``ZoneRecord``s."""
+    return [compact_record(r) for r in records]
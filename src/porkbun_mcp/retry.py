@@ -0,0 +1,126 @@
+"""Retry policy for transient Porkbun API failures."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def is_transient(e: BaseException) -> bool:
+    """Whether an error is worth retrying: rate limits, 5xx and connection errors.
+
+    Args:
+        e: Exception raised by an AsyncPiglet call.
+    """
+    # Imported here so that startup does not load them (see LazyPiglet).
+    import httpx
+    from oinker import APIError, RateLimitError
+
+    match e:
+        case RateLimitError():
+            return True
+        case APIError(status_code=int(status)) if status >= 500:
+            return True
+        case APIError() if isinstance(e.__cause__, httpx.TransportError):
+            # oinker wraps connection errors once its own retries are exhausted.
+            return True
+        case httpx.TransportError():
+            return True
+        case _:
+            return False
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Jittered exponential backoff for idempotent calls.
+
+    Attributes:
+        max_attempts: Total attempts including the first; 1 disables retries.
+        base_delay: Delay before the first retry, doubled on each later retry.
+        max_delay: Upper bound on a single delay.
+        jitter: Fraction of each delay that is randomised (0 = none, 1 = full jitter).
+        deadline: Seconds a call may take, retries and backoff included. An
+            attempt still running at the deadline is cancelled, and no retry
+            is started that could not finish its backoff before it.
+    """
+
+    max_attempts: int = 1
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    jitter: float = 0.5
+    deadline: float = 30.0
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    sleep: Callable[[float], Awaitable[None]] = field(default=asyncio.sleep, repr=False)
+
+    def backoff(self, retry: int) -> float:
+        """Delay before retry number ``retry`` (starting at 1)."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    async def run(self, fn: Callable[[], Awaitable[Any]], retryable: bool) -> tuple[Any, int]:
+        """Call ``fn``, retrying transient failures when ``retryable`` is set.
+
+        Args:
+            fn: Zero-argument coroutine function making one attempt.
+            retryable: Whether the call is safe to repeat.
+
+        Returns:
+            The result and the number of attempts made.
+
+        Raises:
+            TimeoutError: If the deadline passed while an attempt was running.
+        """
+        start = self.clock()
+        attempt = 1
+        while True:
+            timeout = asyncio.timeout(self.deadline - (self.clock() - start))
+            try:
+                async with timeout:
+                    return await fn(), attempt
+            except Exception as e:
+                if timeout.expired():
+                    error = TimeoutError(f"no response within the {self.deadline:g}s deadline")
+                    error.attempts = attempt  # ty: ignore[unresolved-attribute]
+                    raise error from e
+                if not retryable or attempt >= self.max_attempts or not is_transient(e):
+                    e.attempts = attempt  # ty: ignore[unresolved-attribute]
+                    raise
+                delay = self.backoff(attempt)
+                from oinker import RateLimitError
+
+                if isinstance(e, RateLimitError) and e.retry_after:
+                    delay = max(delay, e.retry_after)
+                if self.clock() - start + delay > self.deadline:
+                    e.attempts = attempt  # ty: ignore[unresolved-attribute]
+                    raise
+            await self.sleep(delay)
+            attempt += 1
+
+
+@dataclass
+class CallAttempts:
+    """Upstream attempt counters for one tool invocation."""
+
+    calls: int = 0
+    attempts: int = 0
+
+    @property
+    def retried(self) -> bool:
+        """Whether any upstream call needed more than one attempt."""
+        return self.attempts > self.calls
+
+
+current_attempts: ContextVar[CallAttempts | None] = ContextVar("current_attempts", default=None)
+
+
+def record_attempts(attempts: int) -> None:
+    """Add one upstream call's attempts to the current tool invocation, if any."""
+    counter = current_attempts.get()
+    if counter is not None:
+        counter.calls += 1
+        counter.attempts += attempts
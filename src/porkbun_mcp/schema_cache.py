@@ -0,0 +1,253 @@
+"""Tool and prompt schemas cached across server processes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable, Sequence
+from importlib import metadata
+from pathlib import Path
+from types import FunctionType
+from typing import TYPE_CHECKING, Any, cast, get_type_hints
+
+import fastmcp
+import pydantic
+from mcp.types import ToolAnnotations
+
+# Building tools from cached schemas needs FastMCP internals that may move
+# between releases (pyproject pins the range this was written against);
+# without them tools register through FastMCP as usual.
+try:
+    from fastmcp.prompts.base import PromptArgument
+    from fastmcp.prompts.function_prompt import FunctionPrompt, PromptMeta
+    from fastmcp.server.dependencies import (
+        transform_context_annotations,
+        without_injected_parameters,
+    )
+    from fastmcp.tools.function_tool import FunctionTool, ToolMeta
+    from fastmcp.utilities.tasks import TaskConfig
+except ImportError as e:
+    _INTERNALS_ERROR: Exception | None = e
+else:
+    _INTERNALS_ERROR = None
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+logger = logging.getLogger(__name__)
+
+# Raised when the FastMCP internals used here no longer fit together.
+_INTERNALS_ERRORS = (AttributeError, TypeError, pydantic.ValidationError)
+
+CACHE_VERSION = 1
+
+_PACKAGE_DIR = Path(__file__).parent
+
+
+def _package_version() -> str:
+    try:
+        return metadata.version("porkbun-mcp")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _sources_digest() -> str:
+    """Fingerprint the package sources, so edits in a checkout invalidate the cache."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(_PACKAGE_DIR):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"):
+                stat = os.stat(os.path.join(root, name))
+                digest.update(f"{root}/{name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return digest.hexdigest()
+
+
+def cache_key(groups: Sequence[str]) -> dict[str, Any]:
+    """Identify the tool and prompt definitions a cache file was generated from.
+
+    Args:
+        groups: Registered tool groups, in registration order.
+    """
+    return {
+        "version": CACHE_VERSION,
+        "porkbun_mcp": _package_version(),
+        "fastmcp": fastmcp.__version__,
+        "pydantic": pydantic.VERSION,
+        "groups": list(groups),
+        "sources": _sources_digest(),
+    }
+
+
+class SchemaCache:
+    """Registers tools and prompts, reusing schemas generated by an earlier process.
+
+    Generating the JSON schemas of tool parameters and results is most of the
+    cost of ``create_server``, and a stdio server is started for every
+    session. The first process with a given key registers through FastMCP as
+    usual and saves what it generated; later ones build the same tools and
+    prompts from the file. Arguments are still validated against the function
+    signatures when tools are called.
+
+    If the FastMCP internals this relies on are missing or have changed, the
+    cache turns itself off and everything registers through FastMCP's own
+    ``tool`` and ``prompt`` decorators.
+
+    Pass ``registry()`` to the registration functions in place of the server.
+
+    Attributes:
+        path: JSON cache location, or None to always generate schemas.
+        key: Key the cache file must match, from ``cache_key``.
+        hits: Tools and prompts built from the cache.
+        misses: Tools and prompts whose schemas were generated.
+    """
+
+    def __init__(self, path: Path | None, key: dict[str, Any]) -> None:
+        self.path = path
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+        self._tools: dict[str, dict[str, Any]] = {}
+        self._prompts: dict[str, dict[str, Any]] = {}
+        if _INTERNALS_ERROR is not None:
+            self._disable(_INTERNALS_ERROR)
+        if self.path is not None:
+            self._load()
+
+    def registry(self, mcp: FastMCP) -> FastMCP:
+        """Return a stand-in for ``mcp`` whose ``tool`` and ``prompt`` decorators use the cache."""
+        return cast("FastMCP", _Registry(self, mcp))
+
+    def save(self) -> None:
+        """Write the schemas to the cache file if any were generated."""
+        if self.path is None or not self.misses:
+            return
+        data = {"key": self.key, "tools": self._tools, "prompts": self._prompts}
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data))
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning("Could not write schema cache %s: %s", self.path, e)
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable schema cache %s: %s", self.path, e)
+            return
+        if not isinstance(data, dict) or data.get("key") != self.key:
+            return
+        self._tools = data["tools"]
+        self._prompts = data["prompts"]
+
+    def add_tool(self, mcp: FastMCP, fn: FunctionType, annotations: dict[str, Any]) -> None:
+        """Register a tool as ``@mcp.tool(annotations=...)`` would."""
+        if self.path is not None:
+            try:
+                self._add_tool(mcp, fn, annotations)
+                return
+            except _INTERNALS_ERRORS as e:
+                self._disable(e)
+        self.misses += 1
+        mcp.tool(annotations=annotations or None)(fn)
+
+    def add_prompt(self, mcp: FastMCP, fn: FunctionType) -> None:
+        """Register a prompt as ``@mcp.prompt`` would."""
+        if self.path is not None:
+            try:
+                self._add_prompt(mcp, fn)
+                return
+            except _INTERNALS_ERRORS as e:
+                self._disable(e)
+        self.misses += 1
+        mcp.prompt(fn)
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning(
+            "Tool schema cache disabled, unsupported FastMCP %s: %s", fastmcp.__version__, error
+        )
+        self.path = None
+        self._tools.clear()
+        self._prompts.clear()
+
+    def _add_tool(self, mcp: FastMCP, fn: FunctionType, annotations: dict[str, Any]) -> None:
+        tool_annotations = ToolAnnotations(**annotations) if annotations else None
+        entry = self._tools.get(fn.__name__)
+        if entry is None:
+            self.misses += 1
+            fn.__fastmcp__ = ToolMeta(annotations=tool_annotations)  # ty: ignore[unresolved-attribute]
+            tool = cast("FunctionTool", mcp.add_tool(fn))
+            self._tools[tool.name] = {
+                "description": tool.description,
+                "parameters": tool.parameters,
+                "output_schema": tool.output_schema,
+            }
+            return
+        self.hits += 1
+        wrapped = transform_context_annotations(fn)
+        mcp.add_tool(
+            FunctionTool(
+                fn=wrapped,
+                return_type=get_type_hints(wrapped, include_extras=True).get("return"),
+                name=fn.__name__,
+                description=entry["description"],
+                parameters=entry["parameters"],
+                output_schema=entry["output_schema"],
+                annotations=tool_annotations,
+                task_config=TaskConfig.from_bool(False),
+            )
+        )
+
+    def _add_prompt(self, mcp: FastMCP, fn: FunctionType) -> None:
+        entry = self._prompts.get(fn.__name__)
+        if entry is None:
+            self.misses += 1
+            fn.__fastmcp__ = PromptMeta()  # ty: ignore[unresolved-attribute]
+            prompt = mcp.add_prompt(fn)
+            self._prompts[prompt.name] = {
+                "description": prompt.description,
+                "arguments": [
+                    a.model_dump(mode="json", exclude_none=True) for a in prompt.arguments or ()
+                ],
+            }
+            return
+        self.hits += 1
+        mcp.add_prompt(
+            FunctionPrompt(
+                fn=without_injected_parameters(transform_context_annotations(fn)),
+                name=fn.__name__,
+                description=entry["description"],
+                arguments=[PromptArgument.model_validate(a) for a in entry["arguments"]],
+            )
+        )
+
+
+class _Registry:
+    """Forwards to a FastMCP server, registering tools and prompts through a SchemaCache."""
+
+    def __init__(self, cache: SchemaCache, mcp: FastMCP) -> None:
+        self._cache = cache
+        self._mcp = mcp
+
+    def tool(
+        self, *, annotations: dict[str, Any] | None = None
+    ) -> Callable[[FunctionType], FunctionType]:
+        def decorator(fn: FunctionType) -> FunctionType:
+            self._cache.add_tool(self._mcp, fn, annotations or {})
+            return fn
+
+        return decorator
+
+    def prompt(self, fn: FunctionType) -> FunctionType:
+        self._cache.add_prompt(self._mcp, fn)
+        return fn
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._mcp, name)
@@ -0,0 +1,261 @@
+"""In-memory inverted index over cached DNS zones for account-wide search."""
+
+from __future__ import annotations
+
+import ipaddress
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from fnmatch import fnmatchcase
+from operator import itemgetter
+from typing import Any
+
+# (domain, record ID)
+RecordKey = tuple[str, str]
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def normalize_content(content: str) -> str:
+    """Canonical form of record content for exact matching.
+
+    IP addresses are compared in their compressed form and everything else
+    case-insensitively.
+    """
+    try:
+        return str(ipaddress.ip_address(content))
+    except ValueError:
+        return content.lower()
+
+
+def _labels(name: str) -> list[str]:
+    """DNS labels of a name, right to left."""
+    return name.lower().rstrip(".").split(".")[::-1]
+
+
+def _literal_suffix(pattern: str) -> list[str]:
+    """Right-most labels of a name glob that contain no wildcards."""
+    suffix: list[str] = []
+    for label in _labels(pattern):
+        if _GLOB_CHARS & set(label):
+            break
+        suffix.append(label)
+    return suffix
+
+
+class _TrieNode:
+    __slots__ = ("children", "keys")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.keys: set[RecordKey] = set()
+
+
+class _NameTrie:
+    """Record keys by name, organised by reversed DNS labels for suffix lookups."""
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+
+    def add(self, name: str, key: RecordKey) -> None:
+        node = self._root
+        for label in _labels(name):
+            node = node.children.setdefault(label, _TrieNode())
+        node.keys.add(key)
+
+    def remove(self, name: str, key: RecordKey) -> None:
+        labels = _labels(name)
+        path = [self._root]
+        for label in labels:
+            child = path[-1].children.get(label)
+            if child is None:
+                return
+            path.append(child)
+        path[-1].keys.discard(key)
+        # Prune branches that no longer hold any record, deepest first.
+        for depth in range(len(labels), 0, -1):
+            node = path[depth]
+            if node.keys or node.children:
+                break
+            del path[depth - 1].children[labels[depth - 1]]
+
+    def under(self, suffix: list[str]) -> set[RecordKey]:
+        """Keys of every name ending in the given labels (right to left)."""
+        node = self._root
+        for label in suffix:
+            child = node.children.get(label)
+            if child is None:
+                return set()
+            node = child
+        found: set[RecordKey] = set()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            found |= node.keys
+            stack.extend(node.children.values())
+        return found
+
+
+class RecordIndex:
+    """Inverted index of DNS records across every indexed domain.
+
+    Records are indexed by normalised content, type, name (as a suffix trie)
+    and, for A/AAAA records, numeric address for CIDR range lookups. Zones are
+    replaced one domain at a time, either from ZoneCache change notifications
+    or by ``sync`` before a search, so each update only touches that domain's
+    records.
+
+    Attributes:
+        records: Indexed records by (domain, record ID).
+    """
+
+    def __init__(self) -> None:
+        self.records: dict[RecordKey, Any] = {}
+        self._zones: dict[str, list[Any]] = {}
+        self._by_content: dict[str, set[RecordKey]] = defaultdict(set)
+        self._by_type: dict[str, set[RecordKey]] = defaultdict(set)
+        self._names = _NameTrie()
+        # Per domain and IP version, (address, record ID) sorted by address.
+        self._addresses: dict[str, dict[int, list[tuple[int, str]]]] = {}
+
+    @property
+    def domains(self) -> int:
+        """Number of indexed domains."""
+        return len(self._zones)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def on_zone_change(self, domain: str, records: list[Any] | None) -> None:
+        """ZoneCache listener: index a refreshed zone, or drop a dropped one."""
+        if records is None:
+            self.remove(domain)
+        else:
+            self.sync(domain, records)
+
+    def sync(self, domain: str, records: list[Any]) -> None:
+        """Replace a domain's indexed records unless this exact zone is already indexed.
+
+        Args:
+            domain: Domain name.
+            records: The domain's full zone (oinker DNS records).
+        """
+        domain = domain.lower()
+        if self._zones.get(domain) is records:
+            return
+        self.remove(domain)
+        self._zones[domain] = records
+        for r in records:
+            key = (domain, r.id)
+            self.records[key] = r
+            self._by_content[normalize_content(r.content)].add(key)
+            self._by_type[r.record_type.upper()].add(key)
+            self._names.add(r.name, key)
+        self._addresses[domain] = _addresses(records)
+
+    def remove(self, domain: str) -> None:
+        """Drop every indexed record of a domain."""
+        domain = domain.lower()
+        records = self._zones.pop(domain, None)
+        if records is None:
+            return
+        for r in records:
+            key = (domain, r.id)
+            self.records.pop(key, None)
+            _discard(self._by_content, normalize_content(r.content), key)
+            _discard(self._by_type, r.record_type.upper(), key)
+            self._names.remove(r.name, key)
+        del self._addresses[domain]
+
+    def search(
+        self,
+        content: str | None = None,
+        cidr: ipaddress.IPv4Network | ipaddress.IPv6Network | None = None,
+        name: str | None = None,
+        record_type: str | None = None,
+        min_ttl: int | None = None,
+        max_ttl: int | None = None,
+        domains: Iterable[str] | None = None,
+    ) -> list[tuple[str, Any]]:
+        """Find records matching every given criterion.
+
+        Args:
+            content: Exact content (IP addresses in any notation).
+            cidr: Address range that A/AAAA content must fall in.
+            name: Glob on the full record name (e.g. ``*.example.com``).
+            record_type: Record type.
+            min_ttl: Minimum TTL (inclusive).
+            max_ttl: Maximum TTL (inclusive).
+            domains: Only search these domains.
+
+        Returns:
+            (domain, record) pairs sorted by domain, name, type and content.
+        """
+        candidates: list[set[RecordKey]] = []
+        if content is not None:
+            candidates.append(self._by_content.get(normalize_content(content), set()))
+        if record_type is not None:
+            candidates.append(self._by_type.get(record_type.upper(), set()))
+        if cidr is not None:
+            candidates.append(set(self._in_network(cidr)))
+        if name is not None and (suffix := _literal_suffix(name)):
+            candidates.append(self._names.under(suffix))
+
+        if candidates:
+            candidates.sort(key=len)
+            keys = candidates[0].intersection(*candidates[1:])
+        else:
+            keys = self.records.keys()
+
+        scope = {d.lower() for d in domains} if domains is not None else None
+        pattern = name.lower() if name is not None else None
+        matches = []
+        for key in keys:
+            r = self.records[key]
+            if scope is not None and key[0] not in scope:
+                continue
+            if pattern is not None and not fnmatchcase(r.name.lower(), pattern):
+                continue
+            if min_ttl is not None and r.ttl < min_ttl:
+                continue
+            if max_ttl is not None and r.ttl > max_ttl:
+                continue
+            matches.append((key[0], r))
+        matches.sort(key=lambda m: (m[0], m[1].name, m[1].record_type, m[1].content))
+        return matches
+
+    def _in_network(
+        self, network: ipaddress.IPv4Network | ipaddress.IPv6Network
+    ) -> Iterator[RecordKey]:
+        first, last = int(network.network_address), int(network.broadcast_address)
+        for domain, by_version in self._addresses.items():
+            addresses = by_version[network.version]
+            lo = bisect_left(addresses, first, key=itemgetter(0))
+            hi = bisect_right(addresses, last, key=itemgetter(0))
+            for _, record_id in addresses[lo:hi]:
+                yield domain, record_id
+
+
+def _addresses(records: Iterable[Any]) -> dict[int, list[tuple[int, str]]]:
+    """A/AAAA records of one zone as (address, record ID), sorted per IP version."""
+    addresses: dict[int, list[tuple[int, str]]] = {4: [], 6: []}
+    for r in records:
+        if r.record_type.upper() not in ("A", "AAAA"):
+            continue
+        try:
+            ip = ipaddress.ip_address(r.content)
+        except ValueError:
+            continue
+        addresses[ip.version].append((int(ip), r.id))
+    for entries in addresses.values():
+        entries.sort()
+    return addresses
+
+
+def _discard(index: dict[str, set[RecordKey]], value: str, key: RecordKey) -> None:
+    keys = index.get(value)
+    if keys is None:
+        return
+    keys.discard(key)
+    if not keys:
+        del index[value]
@@ -2,22 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from fastmcp import FastMCP
-from oinker import AsyncPiglet
 
+from porkbun_mcp.cache import ZoneCache
 from porkbun_mcp.config import PorkbunMCPSettings
+from porkbun_mcp.jobs import JobManager
+from porkbun_mcp.metrics import Metrics
+from porkbun_mcp.pagination import SnapshotStore
+from porkbun_mcp.pricing_index import PricingIndex, pricing_fetcher
+from porkbun_mcp.profiling import ToolProfiler
+from porkbun_mcp.ratelimit import RateLimiter
+from porkbun_mcp.retry import RetryPolicy
+from porkbun_mcp.search_index import RecordIndex
+from porkbun_mcp.tracing import JsonlExporter, Tracer
+from porkbun_mcp.upstream import LazyPiglet, Upstream
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from oinker import AsyncPiglet
 
 
 @dataclass
 class AppContext:
     """Typed application context for lifespan-managed resources."""
 
-    piglet: AsyncPiglet
+    piglet: AsyncPiglet | LazyPiglet
     read_only: bool
+    zone_cache: ZoneCache = field(default_factory=ZoneCache)
+    pricing: PricingIndex = field(default_factory=PricingIndex)
+    limiter: RateLimiter = field(default_factory=RateLimiter)
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    search_index: RecordIndex = field(default_factory=RecordIndex)
+    snapshots: SnapshotStore = field(default_factory=SnapshotStore)
+    jobs: JobManager = field(default_factory=JobManager)
+    journal_dir: Path | None = None
+    metrics: Metrics = field(default_factory=Metrics)
+    tracer: Tracer = field(default_factory=Tracer)
+    profiler: ToolProfiler | None = None
+    upstream: Upstream = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.upstream = Upstream(
+            self.piglet, limiter=self.limiter, retry=self.retry, metrics=self.metrics
+        )
+        self.zone_cache.add_listener(self.search_index.on_zone_change)
 
 
 @asynccontextmanager
@@ -30,18 +66,79 @@ async def lifespan(mcp: "FastMCP") -> AsyncIterator[AppContext]:
     get_muddy = get_muddy_override if get_muddy_override is not None else settings.get_muddy
     read_only = not get_muddy
 
-    async with AsyncPiglet(
+    # Opened by the first Porkbun request, keeping oinker and httpx out of startup.
+    # RetryPolicy does the retrying; oinker's own retries would run inside
+    # every attempt and go uncounted.
+    piglet = LazyPiglet(
         api_key=settings.api_key,
         secret_key=settings.secret_key,
-    ) as piglet:
-        yield AppContext(piglet=piglet, read_only=read_only)
-
-
-def create_server(get_muddy: bool | None = None) -> FastMCP:
+        base_url=settings.api_base_url,
+        max_retries=0,
+    )
+    app = AppContext(
+        piglet=piglet,
+        read_only=read_only,
+        zone_cache=ZoneCache(
+            ttl=settings.zone_cache_ttl,
+            max_bytes=settings.zone_cache_max_bytes,
+        ),
+        pricing=PricingIndex(
+            snapshot_path=settings.pricing_cache_path,
+            refresh_interval=settings.pricing_refresh_interval,
+            fetch=pricing_fetcher(settings.api_base_url),
+        ),
+        limiter=RateLimiter.from_rates(
+            {
+                "general": settings.rate_limit_general,
+                "check": settings.rate_limit_check,
+                "write": settings.rate_limit_write,
+            },
+            max_wait=settings.rate_limit_max_wait,
+        ),
+        retry=RetryPolicy(
+            max_attempts=settings.retry_max_attempts,
+            base_delay=settings.retry_base_delay,
+            jitter=settings.retry_jitter,
+            deadline=settings.retry_deadline,
+        ),
+        snapshots=SnapshotStore(ttl=settings.page_snapshot_ttl),
+        jobs=JobManager(max_finished=settings.jobs_max_finished),
+        journal_dir=settings.journal_dir,
+        # Shared with the middleware and the /metrics route set up in create_server.
+        metrics=getattr(mcp, "_metrics", None) or Metrics(),
+    )
+    if settings.profile_dir is not None:
+        app.profiler = ToolProfiler(
+            settings.profile_dir,
+            tools=[t.strip() for t in settings.profile_tools.split(",") if t.strip()],
+            sample_rate=settings.profile_sample_rate,
+        )
+    exporter = JsonlExporter(settings.trace_file) if settings.trace_file else None
+    if exporter is not None:
+        app.tracer = Tracer(exporter)
+    try:
+        yield app
+    finally:
+        # Background jobs use piglet, so stop them before it is closed.
+        await app.jobs.shutdown()
+        await piglet.aclose()
+        if exporter is not None:
+            await asyncio.to_thread(exporter.close)
+
+
+def create_server(
+    get_muddy: bool | None = None, tools: str | Iterable[str] | None = None
+) -> FastMCP:
     """Create and configure the MCP server.
 
     Args:
         get_muddy: Enable write operations. If None, uses PORKBUN_GET_MUDDY env var.
+        tools: Tool groups to register, comma-separated or as an iterable, e.g.
+            ``"dns,pricing"``. If None, uses PORKBUN_TOOLS env var; empty
+            registers every group.
+
+    Raises:
+        ValueError: If a tool group is unknown.
     """
     mcp = FastMCP(
         name="porkbun",
@@ -54,11 +151,37 @@ Tool selection:
         lifespan=lifespan,
     )
 
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+    from porkbun_mcp.metrics import CONTENT_TYPE
+    from porkbun_mcp.middleware import (
+        AttemptsMiddleware,
+        MetricsMiddleware,
+        ProfilingMiddleware,
+        TracingMiddleware,
+    )
     from porkbun_mcp.prompts import register_prompts
-    from porkbun_mcp.tools import register_tools
+    from porkbun_mcp.schema_cache import SchemaCache, cache_key
+    from porkbun_mcp.tools import register_tools, select_tool_groups
 
-    register_tools(mcp)
-    register_prompts(mcp)
+    settings = PorkbunMCPSettings()
+    groups = select_tool_groups(settings.tools if tools is None else tools)
+    schemas = SchemaCache(settings.schema_cache_path, cache_key(groups))
+    register_tools(schemas.registry(mcp), groups)
+    register_prompts(schemas.registry(mcp), groups)
+    schemas.save()
+    metrics = Metrics()
+    mcp._metrics = metrics  # ty: ignore[unresolved-attribute]
+    mcp.add_middleware(MetricsMiddleware(metrics))
+    mcp.add_middleware(TracingMiddleware())
+    mcp.add_middleware(ProfilingMiddleware())
+    mcp.add_middleware(AttemptsMiddleware())
+
+    @mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+    async def metrics_endpoint(request: Request) -> Response:
+        """Serve metrics for Prometheus (HTTP transports only)."""
+        return Response(metrics.render(), media_type=CONTENT_TYPE)
 
     if get_muddy is not None:
         mcp._get_muddy_override = get_muddy  # ty: ignore[unresolved-attribute]
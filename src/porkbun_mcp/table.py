@@ -0,0 +1,74 @@
+"""Compact tabular form of list results, built straight from upstream objects."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Annotated, Any
+
+from pydantic import Field
+
+from porkbun_mcp.models import OutputFormat, Table
+
+FormatParam = Annotated[
+    OutputFormat,
+    Field(
+        description=(
+            "'table' names the fields once and returns each item as an array of values, "
+            "leaving out empty fields; much smaller for long lists"
+        )
+    ),
+]
+
+
+@dataclass(frozen=True, slots=True)
+class Column:
+    """One table column.
+
+    Attributes:
+        name: Column name, matching the field of the object response.
+        get: Reads the value from an upstream object.
+        default: Value that, like None, does not count as data.
+    """
+
+    name: str
+    get: Callable[[Any], Any]
+    default: Any = None
+
+
+def column(name: str, attr: str | None = None, default: Any = None) -> Column:
+    """Build a column reading attribute ``attr`` (default: ``name``)."""
+    return Column(name, attrgetter(attr or name), default)
+
+
+def to_table(
+    items: Sequence[Any],
+    columns: Sequence[Column],
+    total: int | None = None,
+    next_cursor: str | None = None,
+) -> Table:
+    """Build a table from upstream objects without a response model per item.
+
+    Columns holding only None or their default are left out.
+
+    Args:
+        items: Upstream objects, one per row.
+        columns: Candidate columns, in output order.
+        total: Items across all pages (defaults to ``len(items)``).
+        next_cursor: Cursor of the next page, if paginated.
+    """
+    names: list[str] = []
+    values: list[list[Any]] = []
+    for c in columns:
+        column_values = [c.get(item) for item in items]
+        if any(v is not None and v != c.default for v in column_values):
+            names.append(c.name)
+            values.append(column_values)
+    rows = [list(row) for row in zip(*values, strict=True)] if values else [[] for _ in items]
+    return Table.model_construct(
+        columns=names,
+        rows=rows,
+        total=len(items) if total is None else total,
+        next_cursor=next_cursor,
+    )
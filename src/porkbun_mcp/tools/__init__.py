@@ -2,24 +2,70 @@
 
 from __future__ import annotations
 
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from fastmcp import FastMCP
 
+# Tool group -> (module under porkbun_mcp.tools, registration function), in
+# registration order. A group's module is only imported when it is selected.
+TOOL_GROUPS: dict[str, tuple[str, str]] = {
+    "ping": ("ping", "register_ping_tools"),
+    "dns": ("dns", "register_dns_tools"),
+    "domains": ("domains", "register_domain_tools"),
+    "dnssec": ("dnssec", "register_dnssec_tools"),
+    "ssl": ("ssl", "register_ssl_tools"),
+    "pricing": ("pricing", "register_pricing_tools"),
+    "jobs": ("jobs", "register_job_tools"),
+    "stats": ("stats", "register_stats_tools"),
+}
+
+# Groups whose tools can start background jobs need the job tools to follow them.
+_REQUIRES: dict[str, tuple[str, ...]] = {
+    "dns": ("jobs",),
+    "domains": ("jobs",),
+}
+
+
+def select_tool_groups(spec: str | Iterable[str] | None = None) -> list[str]:
+    """Resolve a tool group selection to the groups to register.
+
+    Args:
+        spec: Comma-separated group names or an iterable of them. None or an
+            empty selection selects every group.
+
+    Returns:
+        Selected groups plus the groups they require, in registration order.
+
+    Raises:
+        ValueError: If a group name is unknown.
+    """
+    names = spec.split(",") if isinstance(spec, str) else list(spec or ())
+    selected = {name.strip() for name in names if name.strip()}
+    if not selected:
+        return list(TOOL_GROUPS)
+    unknown = selected - TOOL_GROUPS.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown tool groups: {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(TOOL_GROUPS)}"
+        )
+    for name in list(selected):
+        selected.update(_REQUIRES.get(name, ()))
+    return [name for name in TOOL_GROUPS if name in selected]
+
+
+def register_tools(mcp: "FastMCP", groups: Iterable[str] | None = None) -> None:
+    """Register tools with the MCP server.
 
-def register_tools(mcp: "FastMCP") -> None:
-    """Register all tools with the MCP server."""
-    from porkbun_mcp.tools.dns import register_dns_tools
-    from porkbun_mcp.tools.dnssec import register_dnssec_tools
-    from porkbun_mcp.tools.domains import register_domain_tools
-    from porkbun_mcp.tools.ping import register_ping_tools
-    from porkbun_mcp.tools.pricing import register_pricing_tools
-    from porkbun_mcp.tools.ssl import register_ssl_tools
-
-    register_ping_tools(mcp)
-    register_dns_tools(mcp)
-    register_domain_tools(mcp)
-    register_dnssec_tools(mcp)
-    register_ssl_tools(mcp)
-    register_pricing_tools(mcp)
+    Args:
+        mcp: The FastMCP server instance.
+        groups: Tool groups to register, as returned by ``select_tool_groups``.
+            None registers every group.
+    """
+    for name in TOOL_GROUPS if groups is None else groups:
+        module, function = TOOL_GROUPS[name]
+        getattr(import_module(f"porkbun_mcp.tools.{module}"), function)(mcp)
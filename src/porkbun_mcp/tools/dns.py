@@ -1,18 +1,63 @@
 """DNS record tools for the Porkbun MCP server."""
 
+import ipaddress
+import re
+from fnmatch import fnmatchcase
+from functools import partial
 from typing import TYPE_CHECKING, Annotated
 
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
-from pydantic import Field
+from pydantic import Field, ValidationError
 
-from porkbun_mcp.context import get_piglet, require_writes
+from porkbun_mcp.bulk import (
+    PlannedChange,
+    apply_changes,
+    settle_interrupted,
+    skipped,
+    summarize,
+)
+from porkbun_mcp.context import (
+    get_app_context,
+    get_snapshot_store,
+    get_upstream,
+    get_zone_cache,
+    require_writes,
+)
 from porkbun_mcp.errors import handle_oinker_error
-from porkbun_mcp.models import DNSRecord, DNSRecordCreated, DNSRecordDeleted
+from porkbun_mcp.fanout import AllDomains, fan_out, resolve_domains
+from porkbun_mcp.jobs import Progress
+from porkbun_mcp.journal import BatchJournal, JournalState, batch_id
+from porkbun_mcp.models import (
+    DNSBulkResult,
+    DNSDesiredRecord,
+    DNSListManyResult,
+    DNSOperation,
+    DNSOperationResult,
+    DNSRecord,
+    DNSRecordCreated,
+    DNSRecordDeleted,
+    DNSRecordField,
+    DNSSearchMatch,
+    DNSSearchResult,
+    DNSSyncResult,
+    DomainDNSRecords,
+    JobInfo,
+    Page,
+    PartialDNSRecord,
+    Table,
+)
+from porkbun_mcp.reconcile import DesiredRecord, plan_sync
+from porkbun_mcp.records import ZoneRecord, compact_zone
+from porkbun_mcp.table import FormatParam, column, to_table
+from porkbun_mcp.tools.jobs import BackgroundParam, run_or_submit
+from porkbun_mcp.tracing import span
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
+    from porkbun_mcp.server import AppContext
+
 from typing import Any
 
 
@@ -27,9 +72,211 @@ def _get_dns_record_class(record_type: str) -> type:
     return record_cls
 
 
+def _build_record(
+    record_cls: type, content: str, name: str | None, ttl: int, priority: int | None
+) -> Any:
+    """Build an oinker record, validating its content."""
+    kwargs: dict[str, str | int] = {"content": content, "ttl": ttl}
+    if name is not None:
+        kwargs["name"] = name
+    if priority is not None:
+        kwargs["priority"] = priority
+    return record_cls(**kwargs)
+
+
+def _plan_operation(index: int, op: DNSOperation) -> PlannedChange:
+    """Validate a bulk operation locally, raising ToolError if it is invalid."""
+    if op.action in ("edit", "delete") and not op.record_id:
+        raise ToolError(f"record_id is required to {op.action} a record")
+    if op.action == "delete":
+        return PlannedChange(index, op.action, op.domain, record_id=op.record_id)
+    if not op.record_type or op.content is None:
+        raise ToolError(f"record_type and content are required to {op.action} a record")
+
+    record_cls = _get_dns_record_class(op.record_type)
+    try:
+        record = _build_record(record_cls, op.content, op.name, op.ttl, op.priority)
+    except Exception as e:
+        raise handle_oinker_error(e, f"validate {op.record_type} record") from e
+    return PlannedChange(index, op.action, op.domain, op.record_id, record)
+
+
+def _plan_operations(operations: list[DNSOperation]) -> list[PlannedChange]:
+    """Validate every bulk operation, reporting all invalid ones together."""
+    changes: list[PlannedChange] = []
+    errors: list[str] = []
+    for index, op in enumerate(operations):
+        try:
+            changes.append(_plan_operation(index, op))
+        except ToolError as e:
+            errors.append(f"operation {index}: {e}")
+    if errors:
+        raise ToolError("Invalid operations, nothing was applied:\n" + "\n".join(errors))
+    return changes
+
+
+async def _begin_journal(app: "AppContext", operations: list[DNSOperation]) -> BatchJournal | None:
+    """Start a batch's journal, or return None if journaling is disabled."""
+    if app.journal_dir is None:
+        return None
+    planned = [op.model_dump(mode="json") for op in operations]
+    journal = BatchJournal(app.journal_dir, batch_id(planned))
+    try:
+        await journal.begin(planned)
+    except FileExistsError:
+        raise ToolError(
+            f"Batch {journal.id} with these operations is running or was interrupted; "
+            f"call again with resume={journal.id!r} and no operations to finish it "
+            "without repeating operations that completed"
+        ) from None
+    except OSError as e:
+        raise ToolError(f"Could not write batch journal, nothing was applied: {e}") from e
+    return journal
+
+
+async def _resume_journal(
+    app: "AppContext", resume: str
+) -> tuple[BatchJournal, JournalState, list[DNSOperation]]:
+    """Replay an interrupted batch's journal, with the operations it recorded."""
+    if app.journal_dir is None:
+        raise ToolError("Cannot resume: the batch journal is disabled (set PORKBUN_JOURNAL_DIR)")
+    journal = BatchJournal(app.journal_dir, resume)
+    state = await journal.load()
+    if state is None or not state.operations:
+        raise ToolError(f"No interrupted batch {resume} to resume")
+    try:
+        operations = [DNSOperation.model_validate(op) for op in state.operations]
+    except ValidationError as e:
+        raise ToolError(f"Batch journal {resume} is unreadable: {e}") from e
+    return journal, state, operations
+
+
+def _desired_records(records: list[DNSDesiredRecord]) -> list[DesiredRecord]:
+    """Validate and normalise desired records, reporting all invalid ones together."""
+    desired: list[DesiredRecord] = []
+    errors: list[str] = []
+    for index, r in enumerate(records):
+        try:
+            record_cls = _get_dns_record_class(r.record_type)
+            try:
+                record = _build_record(record_cls, r.content, r.name, r.ttl, r.priority)
+            except Exception as e:
+                raise handle_oinker_error(e, f"validate {r.record_type} record") from e
+        except ToolError as e:
+            errors.append(f"record {index}: {e}")
+            continue
+        desired.append(
+            DesiredRecord(
+                name=r.name.lower() if r.name else None,
+                record_type=r.record_type.upper(),
+                content=record.content,
+                ttl=record.ttl,
+                priority=getattr(record, "priority", None),
+            )
+        )
+    if errors:
+        raise ToolError("Invalid records, nothing was changed:\n" + "\n".join(errors))
+    return desired
+
+
 def _to_dns_record(r: Any) -> DNSRecord:
     """Convert oinker DNS record to Pydantic model."""
-    return DNSRecord(
+    return DNSRecord.model_construct(
+        id=r.id,
+        type=r.record_type,
+        name=r.name,
+        content=r.content,
+        ttl=r.ttl,
+        priority=r.priority,
+        notes=r.notes,
+    )
+
+
+# oinker attribute behind each DNSRecord field.
+_RECORD_ATTRS: dict[str, str] = {
+    "id": "id",
+    "type": "record_type",
+    "name": "name",
+    "content": "content",
+    "ttl": "ttl",
+    "priority": "priority",
+    "notes": "notes",
+}
+
+# Table columns; oinker reports a missing priority as 0 and missing notes as "".
+_RECORD_COLUMNS = [
+    column("id"),
+    column("type", "record_type"),
+    column("name"),
+    column("content"),
+    column("ttl"),
+    column("priority", default=0),
+    column("notes", default=""),
+]
+
+
+def _compile_name_regex(pattern: str | None) -> re.Pattern[str] | None:
+    """Compile a name regex, raising ToolError if it is invalid."""
+    if pattern is None:
+        return None
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        raise ToolError(f"Invalid name_regex: {e}") from e
+
+
+def _filter_records(
+    records: list[Any],
+    record_type: str | None = None,
+    name: str | None = None,
+    name_regex: re.Pattern[str] | None = None,
+    content_contains: str | None = None,
+) -> list[Any]:
+    """Select oinker records matching every given filter, before any model is built."""
+    rtype = record_type.upper() if record_type else None
+    glob = name.lower() if name else None
+    needle = content_contains.lower() if content_contains else None
+    return [
+        r
+        for r in records
+        if (rtype is None or r.record_type.upper() == rtype)
+        and (glob is None or fnmatchcase(r.name.lower(), glob))
+        and (name_regex is None or name_regex.search(r.name))
+        and (needle is None or needle in r.content.lower())
+    ]
+
+
+def _project(
+    records: list[Any], fields: list[DNSRecordField] | None
+) -> list[DNSRecord] | list[PartialDNSRecord]:
+    """Convert oinker records to full models, or to just the requested fields."""
+    if not fields:
+        with span("convert", model="DNSRecord", count=len(records)):
+            return [_to_dns_record(r) for r in records]
+    attrs = {f: _RECORD_ATTRS[f] for f in fields}
+    with span("convert", model="PartialDNSRecord", count=len(records)):
+        return [
+            PartialDNSRecord.model_construct(**{f: getattr(r, a) for f, a in attrs.items()})
+            for r in records
+        ]
+
+
+def _record_table(
+    records: list[Any],
+    fields: list[DNSRecordField] | None,
+    total: int | None = None,
+    next_cursor: str | None = None,
+) -> Table:
+    """Build a table of oinker records, with only the requested fields if given."""
+    columns = [c for c in _RECORD_COLUMNS if not fields or c.name in fields]
+    with span("convert", model="Table", count=len(records)):
+        return to_table(records, columns, total, next_cursor)
+
+
+def _to_search_match(domain: str, r: Any) -> DNSSearchMatch:
+    """Convert an indexed oinker DNS record to a search match."""
+    return DNSSearchMatch(
+        domain=domain,
         id=r.id,
         type=r.record_type,
         name=r.name,
@@ -40,6 +287,49 @@ def _to_dns_record(r: Any) -> DNSRecord:
     )
 
 
+def _domain_records(domain: str, zone: list[Any] | Exception) -> DomainDNSRecords:
+    """Build one domain's entry of a multi-domain listing."""
+    if isinstance(zone, Exception):
+        error = handle_oinker_error(zone, f"list DNS records for {domain}")
+        return DomainDNSRecords(domain=domain, error=str(error))
+    with span("convert", model="DNSRecord", count=len(zone)):
+        return DomainDNSRecords(domain=domain, records=[_to_dns_record(r) for r in zone])
+
+
+async def _list_zone(app: "AppContext", domain: str) -> list[ZoneRecord]:
+    """Fetch all records for a domain from Porkbun in their compact form."""
+    return compact_zone(await app.upstream.call("dns.list", domain))
+
+
+async def _fetch_zone(app: "AppContext", domain: str) -> list[ZoneRecord]:
+    """Get all records for a domain through the zone cache, without a request context."""
+    return await app.zone_cache.get_zone(domain, partial(_list_zone, app))
+
+
+async def _get_zone(ctx: Context, domain: str) -> list[ZoneRecord]:
+    """Get all records for a domain through the zone cache."""
+    return await _fetch_zone(get_app_context(ctx), domain)
+
+
+def _record_fqdn(domain: str, subdomain: str | None) -> str:
+    """Build the full record name Porkbun reports for a subdomain."""
+    return f"{subdomain}.{domain}" if subdomain else domain
+
+
+def _find_record(records: list[Any], record_id: str) -> Any | None:
+    """Find a record in a zone by ID."""
+    return next((r for r in records if r.id == record_id), None)
+
+
+def _filter_name_type(
+    records: list[Any], domain: str, record_type: str, subdomain: str | None
+) -> list[Any]:
+    """Select the records of a zone matching a subdomain and type."""
+    fqdn = _record_fqdn(domain, subdomain).lower()
+    rtype = record_type.upper()
+    return [r for r in records if r.record_type.upper() == rtype and r.name.lower() == fqdn]
+
+
 def register_dns_tools(mcp: "FastMCP") -> None:
     """Register DNS tools with the MCP server."""
 
@@ -47,15 +337,199 @@ def register_dns_tools(mcp: "FastMCP") -> None:
     async def dns_list(
         ctx: Context,
         domain: Annotated[str, Field(description="Domain name (e.g., 'example.com')")],
-    ) -> list[DNSRecord]:
-        """List all DNS records for a domain."""
-        piglet = get_piglet(ctx)
+        record_type: Annotated[
+            str | None, Field(description="Only records of this type (e.g., 'TXT')")
+        ] = None,
+        name: Annotated[
+            str | None,
+            Field(description="Glob on the full record name (e.g., '_dmarc.*', '*.example.com')"),
+        ] = None,
+        name_regex: Annotated[
+            str | None,
+            Field(description="Case-insensitive regex searched in the full record name"),
+        ] = None,
+        content_contains: Annotated[
+            str | None, Field(description="Case-insensitive substring of the record content")
+        ] = None,
+        fields: Annotated[
+            list[DNSRecordField] | None,
+            Field(min_length=1, description="Only return these fields of each record"),
+        ] = None,
+        page_size: Annotated[
+            int | None,
+            Field(ge=1, le=1000, description="Records per page; returns a page with a cursor"),
+        ] = None,
+        cursor: Annotated[
+            str | None,
+            Field(description="next_cursor from the previous page (other filters are ignored)"),
+        ] = None,
+        format: FormatParam = "objects",
+    ) -> list[DNSRecord] | list[PartialDNSRecord] | Page[DNSRecord | PartialDNSRecord] | Table:
+        """List DNS records for a domain.
 
-        try:
-            records = await piglet.dns.list(domain)
-            return [_to_dns_record(r) for r in records]
-        except Exception as e:
-            raise handle_oinker_error(e, f"list DNS records for {domain}") from e
+        Filter server-side on large zones instead of listing everything, e.g.
+        DMARC policy only: record_type="TXT", name="_dmarc.*",
+        fields=["name", "content"]. Set page_size to page through large zones;
+        later pages come from the same snapshot even if records change.
+        Use format="table" for long listings.
+        """
+        regex = _compile_name_regex(name_regex)
+
+        async def load() -> list[ZoneRecord]:
+            try:
+                records = await _get_zone(ctx, domain)
+            except Exception as e:
+                raise handle_oinker_error(e, f"list DNS records for {domain}") from e
+            return _filter_records(records, record_type, name, regex, content_contains)
+
+        table = format == "table"
+        if page_size is None and cursor is None:
+            records = await load()
+            return _record_table(records, fields) if table else _project(records, fields)
+        # Snapshots keep the compact records; models are built per page.
+        store = get_snapshot_store(ctx)
+        scope = f"dns_list:{domain.lower()}"
+        if table:
+            page = await store.page(scope, cursor, page_size, load)
+            return _record_table(page.items, fields, page.total, page.next_cursor)
+
+        def convert(records: list[Any]) -> list[DNSRecord] | list[PartialDNSRecord]:
+            return _project(records, fields)
+
+        return await store.page(
+            scope,
+            cursor,
+            page_size,
+            load,
+            convert=convert,
+            model=Page[DNSRecord | PartialDNSRecord],
+        )
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    async def dns_list_many(
+        ctx: Context,
+        domains: Annotated[
+            list[str] | AllDomains,
+            Field(description="Domain names, or 'all' for every domain in the account"),
+        ],
+        concurrency: Annotated[
+            int, Field(ge=1, le=10, description="Maximum domains fetched at once")
+        ] = 4,
+        background: BackgroundParam = False,
+    ) -> DNSListManyResult | JobInfo:
+        """List DNS records for many domains in one call.
+
+        Use this instead of calling dns_list once per domain, e.g. to find
+        which domains point at an address. A domain that cannot be fetched is
+        reported with its error; the others are still returned. Use
+        background=true for large accounts.
+        """
+        app = get_app_context(ctx)
+
+        async def work(progress: Progress) -> DNSListManyResult:
+            try:
+                names = await resolve_domains(app.upstream, domains, app.snapshots)
+            except Exception as e:
+                raise handle_oinker_error(e, "list domains") from e
+
+            progress.total = len(names)
+            zones = await fan_out(
+                names, partial(_fetch_zone, app), concurrency, on_done=progress.advance
+            )
+            results = [_domain_records(d, z) for d, z in zip(names, zones, strict=True)]
+            failed = sum(r.error is not None for r in results)
+            return DNSListManyResult(
+                succeeded=len(results) - failed, failed=failed, domains=results
+            )
+
+        return await run_or_submit(ctx, "dns_list_many", work, background)
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    async def dns_search(
+        ctx: Context,
+        content: Annotated[
+            str | None, Field(description="Exact record content, e.g. an IP or hostname")
+        ] = None,
+        cidr: Annotated[
+            str | None,
+            Field(description="A/AAAA records within this range (e.g. '203.0.113.0/24')"),
+        ] = None,
+        name: Annotated[
+            str | None,
+            Field(description="Glob on the full record name (e.g. '*.example.com', 'mail.*')"),
+        ] = None,
+        record_type: Annotated[str | None, Field(description="DNS record type")] = None,
+        min_ttl: Annotated[int | None, Field(ge=0, description="Minimum TTL (inclusive)")] = None,
+        max_ttl: Annotated[int | None, Field(ge=0, description="Maximum TTL (inclusive)")] = None,
+        domains: Annotated[
+            list[str] | AllDomains,
+            Field(description="Domains to search, or 'all' for every domain in the account"),
+        ] = "all",
+        limit: Annotated[int, Field(ge=1, description="Maximum records to return")] = 100,
+        concurrency: Annotated[
+            int, Field(ge=1, le=10, description="Maximum zones fetched at once")
+        ] = 4,
+        background: BackgroundParam = False,
+    ) -> DNSSearchResult | JobInfo:
+        """Find DNS records across domains by content, CIDR, name, type or TTL.
+
+        Use this to answer "where is this IP used?" instead of listing every
+        zone. All given criteria must match. Zones are read through the zone
+        cache, so repeated searches are answered locally.
+        """
+        network = None
+        if cidr is not None:
+            try:
+                network = ipaddress.ip_network(cidr, strict=False)
+            except ValueError as e:
+                raise ToolError(f"Invalid CIDR range: {cidr}") from e
+
+        app = get_app_context(ctx)
+
+        async def work(progress: Progress) -> DNSSearchResult:
+            try:
+                names = await resolve_domains(app.upstream, domains, app.snapshots)
+            except Exception as e:
+                raise handle_oinker_error(e, "list domains") from e
+
+            progress.total = len(names)
+            zones = await fan_out(
+                names, partial(_fetch_zone, app), concurrency, on_done=progress.advance
+            )
+            searched: list[str] = []
+            errors: list[str] = []
+            for domain, zone in zip(names, zones, strict=True):
+                if isinstance(zone, Exception):
+                    error = handle_oinker_error(zone, f"list DNS records for {domain}")
+                    errors.append(f"{domain}: {error}")
+                else:
+                    app.search_index.sync(domain, zone)
+                    searched.append(domain)
+
+            matches = app.search_index.search(
+                content=content,
+                cidr=network,
+                name=name,
+                record_type=record_type,
+                min_ttl=min_ttl,
+                max_ttl=max_ttl,
+                domains=searched,
+            )
+            # The index follows the zone cache; zones it did not keep (caching
+            # off, or a zone over the byte budget) are only indexed for this search.
+            for domain in searched:
+                if app.zone_cache.peek(domain) is None:
+                    app.search_index.remove(domain)
+            with span("convert", model="DNSSearchMatch", count=min(len(matches), limit)):
+                records = [_to_search_match(d, r) for d, r in matches[:limit]]
+            return DNSSearchResult(
+                domains_searched=len(searched),
+                total=len(matches),
+                records=records,
+                errors=errors,
+            )
+
+        return await run_or_submit(ctx, "dns_search", work, background)
 
     @mcp.tool(annotations={"readOnlyHint": True})
     async def dns_get(
@@ -64,10 +538,15 @@ def register_dns_tools(mcp: "FastMCP") -> None:
         record_id: Annotated[str, Field(description="DNS record ID")],
     ) -> DNSRecord:
         """Get a specific DNS record by ID."""
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
+        cache = get_zone_cache(ctx)
 
         try:
-            r = await piglet.dns.get(domain, record_id)
+            r = None
+            if cache.enabled:
+                r = _find_record(await _get_zone(ctx, domain), record_id)
+            if r is None:
+                r = await upstream.call("dns.get", domain, record_id)
             if r is None:
                 raise ToolError(f"DNS record {record_id} not found for {domain}")
             return _to_dns_record(r)
@@ -85,17 +564,31 @@ def register_dns_tools(mcp: "FastMCP") -> None:
             str | None,
             Field(description="Subdomain (None for root, '*' for wildcard)"),
         ] = None,
-    ) -> list[DNSRecord]:
+        content_contains: Annotated[
+            str | None, Field(description="Case-insensitive substring of the record content")
+        ] = None,
+        fields: Annotated[
+            list[DNSRecordField] | None,
+            Field(min_length=1, description="Only return these fields of each record"),
+        ] = None,
+    ) -> list[DNSRecord] | list[PartialDNSRecord]:
         """Get DNS records by subdomain and type."""
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
+        cache = get_zone_cache(ctx)
 
         try:
-            records = await piglet.dns.get_by_name_type(domain, record_type, subdomain)
-            return [_to_dns_record(r) for r in records]
+            if cache.enabled:
+                zone = await _get_zone(ctx, domain)
+                records = _filter_name_type(zone, domain, record_type, subdomain)
+            else:
+                records = await upstream.call(
+                    "dns.get_by_name_type", domain, record_type, subdomain
+                )
         except Exception as e:
             raise handle_oinker_error(
                 e, f"get {record_type} records for {subdomain or 'root'}.{domain}"
             ) from e
+        return _project(_filter_records(records, content_contains=content_contains), fields)
 
     @mcp.tool(annotations={"idempotentHint": False})
     async def dns_create(
@@ -119,20 +612,17 @@ def register_dns_tools(mcp: "FastMCP") -> None:
         """Create a new DNS record."""
         require_writes(ctx)
         record_cls = _get_dns_record_class(record_type)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
+        cache = get_zone_cache(ctx)
 
         try:
-            kwargs: dict[str, str | int] = {"content": content, "ttl": ttl}
-            if name is not None:
-                kwargs["name"] = name
-            if priority is not None:
-                kwargs["priority"] = priority
-
-            record = record_cls(**kwargs)
-            record_id = await piglet.dns.create(domain, record)
+            record = _build_record(record_cls, content, name, ttl, priority)
+            record_id = await upstream.call("dns.create", domain, record)
             return DNSRecordCreated(status="created", record_id=record_id)
         except Exception as e:
             raise handle_oinker_error(e, f"create {record_type} record for {domain}") from e
+        finally:
+            cache.invalidate(domain)
 
     @mcp.tool(annotations={"idempotentHint": True})
     async def dns_edit(
@@ -148,20 +638,17 @@ def register_dns_tools(mcp: "FastMCP") -> None:
         """Edit a DNS record by ID."""
         require_writes(ctx)
         record_cls = _get_dns_record_class(record_type)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
+        cache = get_zone_cache(ctx)
 
         try:
-            kwargs: dict[str, str | int] = {"content": content, "ttl": ttl}
-            if name is not None:
-                kwargs["name"] = name
-            if priority is not None:
-                kwargs["priority"] = priority
-
-            record = record_cls(**kwargs)
-            await piglet.dns.edit(domain, record_id, record)
+            record = _build_record(record_cls, content, name, ttl, priority)
+            await upstream.call("dns.edit", domain, record_id, record)
             return DNSRecordCreated(status="updated", record_id=record_id)
         except Exception as e:
             raise handle_oinker_error(e, f"edit DNS record {record_id}") from e
+        finally:
+            cache.invalidate(domain)
 
     @mcp.tool(annotations={"idempotentHint": True})
     async def dns_edit_by_name_type(
@@ -179,10 +666,12 @@ def register_dns_tools(mcp: "FastMCP") -> None:
     ) -> DNSRecordDeleted:
         """Edit all DNS records matching subdomain and type."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
+        cache = get_zone_cache(ctx)
 
         try:
-            await piglet.dns.edit_by_name_type(
+            await upstream.call(
+                "dns.edit_by_name_type",
                 domain,
                 record_type,
                 subdomain,
@@ -200,6 +689,8 @@ def register_dns_tools(mcp: "FastMCP") -> None:
             raise handle_oinker_error(
                 e, f"edit {record_type} records for {subdomain or 'root'}.{domain}"
             ) from e
+        finally:
+            cache.invalidate(domain)
 
     @mcp.tool(annotations={"destructiveHint": True})
     async def dns_delete(
@@ -209,13 +700,16 @@ def register_dns_tools(mcp: "FastMCP") -> None:
     ) -> DNSRecordDeleted:
         """Delete a DNS record by ID."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
+        cache = get_zone_cache(ctx)
 
         try:
-            await piglet.dns.delete(domain, record_id)
+            await upstream.call("dns.delete", domain, record_id)
             return DNSRecordDeleted(status="deleted", message=f"Record {record_id} deleted")
         except Exception as e:
             raise handle_oinker_error(e, f"delete DNS record {record_id}") from e
+        finally:
+            cache.invalidate(domain)
 
     @mcp.tool(annotations={"destructiveHint": True})
     async def dns_delete_by_name_type(
@@ -226,10 +720,11 @@ def register_dns_tools(mcp: "FastMCP") -> None:
     ) -> DNSRecordDeleted:
         """Delete DNS records by subdomain and type."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
+        cache = get_zone_cache(ctx)
 
         try:
-            await piglet.dns.delete_by_name_type(domain, record_type, subdomain)
+            await upstream.call("dns.delete_by_name_type", domain, record_type, subdomain)
             name_part = subdomain or "root"
             return DNSRecordDeleted(
                 status="deleted", message=f"Deleted {record_type} records for {name_part}.{domain}"
@@ -238,3 +733,173 @@ def register_dns_tools(mcp: "FastMCP") -> None:
             raise handle_oinker_error(
                 e, f"delete {record_type} records for {subdomain or 'root'}.{domain}"
             ) from e
+        finally:
+            cache.invalidate(domain)
+
+    @mcp.tool(annotations={"destructiveHint": True})
+    async def dns_bulk_apply(
+        ctx: Context,
+        operations: Annotated[
+            list[DNSOperation] | None,
+            Field(
+                min_length=1,
+                description="DNS creates, edits and deletes to apply; omit when resuming",
+            ),
+        ] = None,
+        stop_on_error: Annotated[
+            bool,
+            Field(description="Skip operations not yet started after the first failure"),
+        ] = False,
+        concurrency: Annotated[
+            int, Field(ge=1, le=10, description="Maximum operations in flight at once")
+        ] = 4,
+        resume: Annotated[
+            str | None,
+            Field(
+                pattern=r"^[0-9a-f]{16}$",
+                description="batch_id of an interrupted call to finish; its operations "
+                "are read from the batch journal and those already done are skipped",
+            ),
+        ] = None,
+        background: BackgroundParam = False,
+    ) -> DNSBulkResult | JobInfo:
+        """Apply many DNS record creates, edits and deletes in one call.
+
+        All operations are validated before any is sent; if one is invalid,
+        nothing is applied. Operations then run concurrently, so their order is
+        not guaranteed; use concurrency=1 to apply them in order. Use
+        background=true for large batches.
+
+        When the server keeps a batch journal (PORKBUN_JOURNAL_DIR), every
+        operation is journaled on disk. If a call fails part-way, its result
+        has a batch_id; call again with resume set to it and no operations:
+        finished operations are not sent again.
+        """
+        require_writes(ctx)
+        app = get_app_context(ctx)
+        journal: BatchJournal | None = None
+        state: JournalState | None = None
+        if resume is not None:
+            if operations is not None:
+                raise ToolError("Pass either operations or resume, not both")
+            journal, state, operations = await _resume_journal(app, resume)
+        elif operations is None:
+            raise ToolError("operations are required unless resuming a batch")
+        changes = _plan_operations(operations)
+        if journal is None:
+            journal = await _begin_journal(app, operations)
+
+        async def work(progress: Progress) -> DNSBulkResult:
+            progress.total = len(changes)
+
+            async def on_result(result: DNSOperationResult) -> None:
+                if journal is not None:
+                    await journal.done(result)
+                progress.advance()
+
+            try:
+                done: dict[int, DNSOperationResult] = {}
+                if state is not None:
+                    done = await settle_interrupted(app.upstream, changes, state)
+                    progress.advance(len(done))
+                results = await apply_changes(
+                    app.upstream,
+                    app.zone_cache,
+                    [c for c in changes if c.index not in done],
+                    concurrency=concurrency,
+                    stop_on_error=stop_on_error,
+                    on_start=journal.started if journal is not None else None,
+                    on_result=on_result,
+                )
+            finally:
+                if journal is not None:
+                    journal.close()
+            summary = summarize(sorted([*done.values(), *results], key=lambda r: r.index))
+            summary.resumed = len(done)
+            if journal is not None:
+                if summary.failed or summary.skipped:
+                    summary.batch_id = journal.id
+                else:
+                    journal.finish()
+            return summary
+
+        return await run_or_submit(ctx, "dns_bulk_apply", work, background)
+
+    @mcp.tool(annotations={"destructiveHint": True, "idempotentHint": True})
+    async def dns_sync(
+        ctx: Context,
+        domain: Annotated[str, Field(description="Domain name (e.g., 'example.com')")],
+        records: Annotated[
+            list[DNSDesiredRecord],
+            Field(description="Every record the zone should contain afterwards"),
+        ],
+        dry_run: Annotated[
+            bool, Field(description="Only compute the plan without changing anything")
+        ] = True,
+        stop_on_error: Annotated[
+            bool,
+            Field(description="Skip operations not yet started after the first failure"),
+        ] = False,
+        concurrency: Annotated[
+            int, Field(ge=1, le=10, description="Maximum operations in flight at once")
+        ] = 4,
+        background: BackgroundParam = False,
+    ) -> DNSSyncResult | JobInfo:
+        """Make a domain's DNS records match a desired set with the fewest changes.
+
+        Records not listed are DELETED. Existing records are matched on name,
+        type and content and left untouched unless their TTL or priority
+        differs; a changed record with the same name and type is edited in
+        place. Apex NS records are never changed. Runs as a dry run by default:
+        review the plan, then call again with dry_run=false to apply it.
+        """
+        desired = _desired_records(records)
+        if not dry_run:
+            require_writes(ctx)
+        app = get_app_context(ctx)
+
+        async def work(progress: Progress) -> DNSSyncResult:
+            try:
+                # Always diff against the live zone, never a cached copy.
+                current = await _list_zone(app, domain)
+            except Exception as e:
+                raise handle_oinker_error(e, f"list DNS records for {domain}") from e
+
+            plan = plan_sync(domain, current, desired)
+            result = DNSSyncResult(
+                domain=domain,
+                dry_run=dry_run,
+                unchanged=plan.unchanged,
+                ignored=plan.ignored,
+                operations=plan.operations,
+            )
+            if dry_run:
+                return result
+
+            changes = _plan_operations(plan.operations)
+            progress.total = len(changes)
+
+            async def on_result(_: DNSOperationResult) -> None:
+                progress.advance()
+
+            apply = partial(
+                apply_changes,
+                app.upstream,
+                app.zone_cache,
+                concurrency=concurrency,
+                stop_on_error=stop_on_error,
+                on_result=on_result,
+            )
+            # Deletes go first so a new record never clashes with one being replaced.
+            deletes = [c for c in changes if c.action == "delete"]
+            writes = [c for c in changes if c.action != "delete"]
+            results = await apply(deletes)
+            if stop_on_error and any(r.status == "failed" for r in results):
+                results += [skipped(c) for c in writes]
+            else:
+                results += await apply(writes)
+            app.zone_cache.invalidate(domain)
+            result.applied = summarize(results)
+            return result
+
+        return await run_or_submit(ctx, "dns_sync", work, background)
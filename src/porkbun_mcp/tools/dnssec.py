@@ -6,7 +6,7 @@ from fastmcp import Context
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
-from porkbun_mcp.context import get_piglet, require_writes
+from porkbun_mcp.context import get_upstream, require_writes
 from porkbun_mcp.errors import handle_oinker_error
 from porkbun_mcp.models import DNSRecordDeleted, DNSSECRecord
 
@@ -23,10 +23,10 @@ def register_dnssec_tools(mcp: "FastMCP") -> None:
         domain: Annotated[str, Field(description="Domain name (e.g., 'example.com')")],
     ) -> list[DNSSECRecord]:
         """List DNSSEC records for a domain."""
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            records = await piglet.dnssec.list(domain)
+            records = await upstream.call("dnssec.list", domain)
             return [
                 DNSSECRecord(
                     key_tag=r.key_tag,
@@ -50,7 +50,7 @@ def register_dnssec_tools(mcp: "FastMCP") -> None:
     ) -> DNSSECRecord:
         """Create a DNSSEC record."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
             from oinker.dnssec import DNSSECRecordCreate
@@ -61,7 +61,7 @@ def register_dnssec_tools(mcp: "FastMCP") -> None:
                 digest_type=digest_type,
                 digest=digest,
             )
-            await piglet.dnssec.create(domain, record)
+            await upstream.call("dnssec.create", domain, record)
             return DNSSECRecord(
                 key_tag=key_tag,
                 algorithm=algorithm,
@@ -81,10 +81,10 @@ def register_dnssec_tools(mcp: "FastMCP") -> None:
     ) -> DNSRecordDeleted:
         """Delete a DNSSEC record."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            await piglet.dnssec.delete(domain, key_tag)
+            await upstream.call("dnssec.delete", domain, key_tag)
             return DNSRecordDeleted(status="deleted", message=f"DNSSEC record {key_tag} deleted")
         except Exception as e:
             raise handle_oinker_error(e, f"delete DNSSEC record {key_tag}") from e
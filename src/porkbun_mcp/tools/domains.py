@@ -1,22 +1,36 @@
 """Domain management tools for the Porkbun MCP server."""
 
+import asyncio
+from collections.abc import Callable
+from functools import partial
+from operator import attrgetter
 from typing import TYPE_CHECKING, Annotated, Literal
 
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
-from porkbun_mcp.context import get_piglet, require_writes
+from porkbun_mcp.context import get_snapshot_store, get_upstream, require_writes
 from porkbun_mcp.errors import handle_oinker_error
+from porkbun_mcp.fanout import AllDomains, domain_pages, fan_out, resolve_domains
+from porkbun_mcp.jobs import Progress
 from porkbun_mcp.models import (
     DomainAvailability,
     DomainInfo,
+    DomainInventory,
+    DomainInventoryItem,
     GlueRecord,
     GlueRecordCreated,
+    JobInfo,
     Nameservers,
+    Page,
+    Table,
     URLForward,
     URLForwardCreated,
 )
+from porkbun_mcp.table import Column, FormatParam, column, to_table
+from porkbun_mcp.tools.jobs import BackgroundParam, run_or_submit
+from porkbun_mcp.tracing import span
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
@@ -26,7 +40,7 @@ from typing import Any
 
 def _to_domain_info(d: Any) -> DomainInfo:
     """Convert oinker domain to Pydantic model."""
-    return DomainInfo(
+    return DomainInfo.model_construct(
         domain=d.domain,
         status=d.status,
         tld=d.tld,
@@ -38,19 +52,168 @@ def _to_domain_info(d: Any) -> DomainInfo:
     )
 
 
+def _isodate(attr: str) -> Callable[[Any], str | None]:
+    """Read a datetime attribute as an ISO 8601 string."""
+    get = attrgetter(attr)
+
+    def read(d: Any) -> str | None:
+        value = get(d)
+        return value.isoformat() if value else None
+
+    return read
+
+
+_DOMAIN_COLUMNS = [
+    column("domain"),
+    column("status"),
+    column("tld"),
+    Column("create_date", _isodate("create_date")),
+    Column("expire_date", _isodate("expire_date")),
+    column("security_lock"),
+    column("whois_privacy"),
+    column("auto_renew"),
+]
+
+# Porkbun reports the root domain's forwards with an empty subdomain.
+_URL_FORWARD_COLUMNS = [
+    column("id"),
+    column("subdomain", default=""),
+    column("location"),
+    column("type"),
+    column("include_path"),
+    column("wildcard"),
+]
+
+
+def _to_url_forward(f: Any) -> URLForward:
+    """Convert oinker URL forward to Pydantic model."""
+    return URLForward(
+        id=f.id,
+        subdomain=f.subdomain,
+        location=f.location,
+        type=f.type,
+        include_path=f.include_path,
+        wildcard=f.wildcard,
+    )
+
+
+async def _inventory_item(upstream: Any, domain: str) -> DomainInventoryItem:
+    """Fetch nameservers and URL forwards of one domain, recording errors inline."""
+    ns, forwards = await asyncio.gather(
+        upstream.call("domains.get_nameservers", domain),
+        upstream.call("domains.get_url_forwards", domain),
+        return_exceptions=True,
+    )
+    item = DomainInventoryItem(domain=domain)
+    # Cancellation (a BaseException) is not a per-domain error; it stops the fan-out.
+    if isinstance(ns, Exception):
+        item.errors.append(str(handle_oinker_error(ns, f"get nameservers for {domain}")))
+    elif isinstance(ns, BaseException):
+        raise ns
+    else:
+        item.nameservers = list(ns)
+    if isinstance(forwards, Exception):
+        item.errors.append(str(handle_oinker_error(forwards, f"get URL forwards for {domain}")))
+    elif isinstance(forwards, BaseException):
+        raise forwards
+    else:
+        item.url_forwards = [_to_url_forward(f) for f in forwards]
+    return item
+
+
 def register_domain_tools(mcp: "FastMCP") -> None:
     """Register domain tools with the MCP server."""
 
     @mcp.tool(annotations={"readOnlyHint": True})
-    async def domains_list(ctx: Context) -> list[DomainInfo]:
-        """List all domains in your Porkbun account."""
-        piglet = get_piglet(ctx)
+    async def domains_list(
+        ctx: Context,
+        page_size: Annotated[
+            int | None,
+            Field(ge=1, le=1000, description="Domains per page; returns a page with a cursor"),
+        ] = None,
+        cursor: Annotated[
+            str | None, Field(description="next_cursor from the previous page")
+        ] = None,
+        format: FormatParam = "objects",
+    ) -> list[DomainInfo] | Page[DomainInfo] | Table:
+        """List all domains in your Porkbun account.
+
+        Porkbun returns domains 1000 at a time; pages are fetched ahead while
+        earlier ones are converted, and progress is reported per page. Set
+        page_size to page through large accounts; later pages are served from
+        a snapshot without calling Porkbun again. Use format="table" for large
+        accounts.
+        """
+        upstream = get_upstream(ctx)
+        table = format == "table"
+
+        async def load() -> list[Any]:
+            # Tables are built from the oinker domains, not from models.
+            domains: list[Any] = []
+            pages = domain_pages(upstream)
+            while True:
+                try:
+                    page = await anext(pages, None)
+                    if page is None:
+                        break
+                    if table:
+                        domains.extend(page)
+                    else:
+                        with span("convert", model="DomainInfo", count=len(page)):
+                            domains.extend(_to_domain_info(d) for d in page)
+                except Exception as e:
+                    raise handle_oinker_error(e, "list domains") from e
+                # Outside the try: a failed progress notification is not a Porkbun error.
+                await ctx.report_progress(len(domains), message=f"{len(domains)} domains")
+            await ctx.report_progress(len(domains), len(domains), f"{len(domains)} domains")
+            return domains
+
+        if not table:
+            if page_size is None and cursor is None:
+                return await load()
+            return await get_snapshot_store(ctx).page(
+                "domains_list", cursor, page_size, load, model=Page[DomainInfo]
+            )
+        if page_size is None and cursor is None:
+            return to_table(await load(), _DOMAIN_COLUMNS)
+        page = await get_snapshot_store(ctx).page("domains_list:table", cursor, page_size, load)
+        return to_table(page.items, _DOMAIN_COLUMNS, page.total, page.next_cursor)
 
-        try:
-            domains = await piglet.domains.list()
-            return [_to_domain_info(d) for d in domains]
-        except Exception as e:
-            raise handle_oinker_error(e, "list domains") from e
+    @mcp.tool(annotations={"readOnlyHint": True})
+    async def domains_inventory(
+        ctx: Context,
+        domains: Annotated[
+            list[str] | AllDomains,
+            Field(description="Domain names, or 'all' for every domain in the account"),
+        ],
+        concurrency: Annotated[
+            int, Field(ge=1, le=10, description="Maximum domains fetched at once")
+        ] = 4,
+        background: BackgroundParam = False,
+    ) -> DomainInventory | JobInfo:
+        """Get nameservers and URL forwards for many domains in one call.
+
+        Errors for a domain are reported in its entry; the others are still
+        returned. Use background=true for large accounts.
+        """
+        upstream = get_upstream(ctx)
+        snapshots = get_snapshot_store(ctx)
+
+        async def work(progress: Progress) -> DomainInventory:
+            try:
+                names = await resolve_domains(upstream, domains, snapshots)
+            except Exception as e:
+                raise handle_oinker_error(e, "list domains") from e
+
+            progress.total = len(names)
+            items = await fan_out(
+                names, partial(_inventory_item, upstream), concurrency, on_done=progress.advance
+            )
+            # _inventory_item records its own errors, so fan_out never sees one.
+            results = [i for i in items if isinstance(i, DomainInventoryItem)]
+            return DomainInventory(failed=sum(bool(i.errors) for i in results), domains=results)
+
+        return await run_or_submit(ctx, "domains_inventory", work, background)
 
     @mcp.tool(annotations={"readOnlyHint": True})
     async def domains_get_nameservers(
@@ -58,10 +221,10 @@ def register_domain_tools(mcp: "FastMCP") -> None:
         domain: Annotated[str, Field(description="Domain name (e.g., 'example.com')")],
     ) -> Nameservers:
         """Get nameservers for a domain."""
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            ns = await piglet.domains.get_nameservers(domain)
+            ns = await upstream.call("domains.get_nameservers", domain)
             return Nameservers(domain=domain, nameservers=list(ns))
         except Exception as e:
             raise handle_oinker_error(e, f"get nameservers for {domain}") from e
@@ -74,10 +237,10 @@ def register_domain_tools(mcp: "FastMCP") -> None:
     ) -> Nameservers:
         """Update nameservers for a domain."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            await piglet.domains.update_nameservers(domain, nameservers)
+            await upstream.call("domains.update_nameservers", domain, nameservers)
             return Nameservers(domain=domain, nameservers=nameservers)
         except Exception as e:
             raise handle_oinker_error(e, f"update nameservers for {domain}") from e
@@ -86,23 +249,16 @@ def register_domain_tools(mcp: "FastMCP") -> None:
     async def domains_get_url_forwards(
         ctx: Context,
         domain: Annotated[str, Field(description="Domain name (e.g., 'example.com')")],
-    ) -> list[URLForward]:
+        format: FormatParam = "objects",
+    ) -> list[URLForward] | Table:
         """Get URL forwarding rules for a domain."""
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            forwards = await piglet.domains.get_url_forwards(domain)
-            return [
-                URLForward(
-                    id=f.id,
-                    subdomain=f.subdomain,
-                    location=f.location,
-                    type=f.type,
-                    include_path=f.include_path,
-                    wildcard=f.wildcard,
-                )
-                for f in forwards
-            ]
+            forwards = await upstream.call("domains.get_url_forwards", domain)
+            if format == "table":
+                return to_table(forwards, _URL_FORWARD_COLUMNS)
+            return [_to_url_forward(f) for f in forwards]
         except Exception as e:
             raise handle_oinker_error(e, f"get URL forwards for {domain}") from e
 
@@ -121,7 +277,7 @@ def register_domain_tools(mcp: "FastMCP") -> None:
     ) -> URLForwardCreated:
         """Add a URL forwarding rule."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
             from oinker.domains import URLForwardCreate
@@ -133,7 +289,7 @@ def register_domain_tools(mcp: "FastMCP") -> None:
                 include_path=include_path,
                 wildcard=wildcard,
             )
-            await piglet.domains.add_url_forward(domain, forward)
+            await upstream.call("domains.add_url_forward", domain, forward)
             return URLForwardCreated(status="created", message=f"URL forward created for {domain}")
         except ToolError:
             raise
@@ -148,10 +304,10 @@ def register_domain_tools(mcp: "FastMCP") -> None:
     ) -> URLForwardCreated:
         """Delete a URL forwarding rule."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            await piglet.domains.delete_url_forward(domain, forward_id)
+            await upstream.call("domains.delete_url_forward", domain, forward_id)
             return URLForwardCreated(status="deleted", message=f"URL forward {forward_id} deleted")
         except Exception as e:
             raise handle_oinker_error(e, f"delete URL forward {forward_id}") from e
@@ -163,14 +319,15 @@ def register_domain_tools(mcp: "FastMCP") -> None:
     ) -> DomainAvailability:
         """Check domain availability and pricing.
 
-        WARNING: Heavily rate-limited (1 request per 10 seconds).
+        WARNING: Heavily rate-limited (1 request per 10 seconds). Calls are
+        queued client-side and may wait before running.
         For price comparisons, use pricing_get first (no rate limits).
         Only use this tool when you need to confirm a specific domain is available.
         """
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            result = await piglet.domains.check(domain)
+            result = await upstream.call("domains.check", domain)
             return DomainAvailability(
                 domain=domain,
                 available=result.available,
@@ -186,10 +343,10 @@ def register_domain_tools(mcp: "FastMCP") -> None:
         domain: Annotated[str, Field(description="Domain name (e.g., 'example.com')")],
     ) -> list[GlueRecord]:
         """Get glue records for a domain."""
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            glue_records = await piglet.domains.get_glue_records(domain)
+            glue_records = await upstream.call("domains.get_glue_records", domain)
             return [
                 GlueRecord(
                     hostname=g.hostname,
@@ -210,10 +367,10 @@ def register_domain_tools(mcp: "FastMCP") -> None:
     ) -> GlueRecordCreated:
         """Create a glue record for self-hosted nameservers."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            await piglet.domains.create_glue_record(domain, subdomain, ips)
+            await upstream.call("domains.create_glue_record", domain, subdomain, ips)
             return GlueRecordCreated(
                 status="created",
                 message=f"Glue record {subdomain}.{domain} created with IPs: {', '.join(ips)}",
@@ -230,10 +387,10 @@ def register_domain_tools(mcp: "FastMCP") -> None:
     ) -> GlueRecordCreated:
         """Update a glue record's IP addresses."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            await piglet.domains.update_glue_record(domain, subdomain, ips)
+            await upstream.call("domains.update_glue_record", domain, subdomain, ips)
             return GlueRecordCreated(
                 status="updated",
                 message=f"Glue record {subdomain}.{domain} updated with IPs: {', '.join(ips)}",
@@ -249,10 +406,10 @@ def register_domain_tools(mcp: "FastMCP") -> None:
     ) -> GlueRecordCreated:
         """Delete a glue record."""
         require_writes(ctx)
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            await piglet.domains.delete_glue_record(domain, subdomain)
+            await upstream.call("domains.delete_glue_record", domain, subdomain)
             return GlueRecordCreated(
                 status="deleted",
                 message=f"Glue record {subdomain}.{domain} deleted",
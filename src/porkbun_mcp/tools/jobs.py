@@ -0,0 +1,107 @@
+"""Background job tools for the Porkbun MCP server."""
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Annotated, Any
+
+from fastmcp import Context
+from fastmcp.exceptions import ToolError
+from pydantic import Field
+
+from porkbun_mcp.context import get_jobs
+from porkbun_mcp.errors import handle_oinker_error
+from porkbun_mcp.jobs import Job, Progress, Work
+from porkbun_mcp.models import JobInfo, JobResult
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+BackgroundParam = Annotated[
+    bool,
+    Field(description="Return a job ID at once; follow it with job_status and job_result"),
+]
+
+
+def _isoformat(ts: float | None) -> str | None:
+    return None if ts is None else datetime.fromtimestamp(ts, UTC).isoformat()
+
+
+def _to_job_info(job: Job) -> JobInfo:
+    """Convert a job to Pydantic model."""
+    return JobInfo(
+        job_id=job.id,
+        kind=job.kind,
+        state=job.state,
+        done=job.progress.done,
+        total=job.progress.total,
+        created_at=_isoformat(job.created_at) or "",
+        finished_at=_isoformat(job.finished_at),
+        error=job.error,
+    )
+
+
+async def run_or_submit(ctx: Context, kind: str, work: Work, background: bool) -> Any:
+    """Run a tool's work now, or start it as a background job and return its JobInfo.
+
+    The work must only use lifespan resources captured before submission,
+    never ``ctx``, because the request may be over before it runs.
+
+    Args:
+        ctx: MCP context of the submitting call.
+        kind: Name of the submitting tool.
+        work: Coroutine function taking a Progress and returning the tool's result.
+        background: Whether to run in the background.
+    """
+    if not background:
+        return await work(Progress())
+
+    def format_error(e: Exception) -> str:
+        return str(e if isinstance(e, ToolError) else handle_oinker_error(e, kind))
+
+    return _to_job_info(get_jobs(ctx).submit(kind, work, format_error))
+
+
+def _get_job(ctx: Context, job_id: str) -> Job:
+    job = get_jobs(ctx).get(job_id)
+    if job is None:
+        raise ToolError(f"Unknown job: {job_id}. Finished jobs are kept for a limited time.")
+    return job
+
+
+def register_job_tools(mcp: "FastMCP") -> None:
+    """Register background job tools with the MCP server."""
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    async def job_status(
+        ctx: Context,
+        job_id: Annotated[str, Field(description="Job ID returned by a background tool call")],
+    ) -> JobInfo:
+        """Get the state and progress of a background job."""
+        return _to_job_info(_get_job(ctx, job_id))
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    async def job_result(
+        ctx: Context,
+        job_id: Annotated[str, Field(description="Job ID returned by a background tool call")],
+    ) -> JobResult:
+        """Get a background job's result once it has succeeded.
+
+        While the job is running, result is None; poll job_status until the
+        state is no longer "running".
+        """
+        job = _get_job(ctx, job_id)
+        result = job.result.model_dump(mode="json") if job.state == "succeeded" else None
+        return JobResult(job=_to_job_info(job), result=result)
+
+    @mcp.tool(annotations={"idempotentHint": True})
+    async def job_cancel(
+        ctx: Context,
+        job_id: Annotated[str, Field(description="Job ID returned by a background tool call")],
+    ) -> JobInfo:
+        """Cancel a running background job.
+
+        Changes already sent to Porkbun are not rolled back.
+        """
+        job = await get_jobs(ctx).cancel(job_id)
+        if job is None:
+            raise ToolError(f"Unknown job: {job_id}. Finished jobs are kept for a limited time.")
+        return _to_job_info(job)
@@ -1,41 +1,112 @@
 """TLD pricing tools for the Porkbun MCP server."""
 
-from typing import TYPE_CHECKING, Any
+from decimal import Decimal
+from typing import TYPE_CHECKING, Annotated
 
 from fastmcp import Context
-from oinker.pricing import get_pricing
+from pydantic import Field
 
+from porkbun_mcp.context import get_pricing_index, get_snapshot_store
 from porkbun_mcp.errors import handle_oinker_error
-from porkbun_mcp.models import TLDPricing
+from porkbun_mcp.models import Page, Table, TLDPricing
+from porkbun_mcp.pricing_index import PriceEntry, PriceField, SortField
+from porkbun_mcp.table import FormatParam, column, to_table
+from porkbun_mcp.tracing import span
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
-def _to_tld_pricing(tld: str, p: Any) -> TLDPricing:
-    """Convert oinker pricing entry to Pydantic model."""
-    return TLDPricing(
-        tld=tld,
-        registration=p.registration,
-        renewal=p.renewal,
-        transfer=p.transfer,
+def _to_tld_pricing(e: PriceEntry) -> TLDPricing:
+    """Convert a pricing index entry to Pydantic model."""
+    return TLDPricing.model_construct(
+        tld=e.tld,
+        registration=e.registration,
+        renewal=e.renewal,
+        transfer=e.transfer,
     )
 
 
+_PRICING_COLUMNS = [column("tld"), column("registration"), column("renewal"), column("transfer")]
+
+
+def _to_decimal(value: float | None) -> Decimal | None:
+    return None if value is None else Decimal(str(value))
+
+
 def register_pricing_tools(mcp: "FastMCP") -> None:
     """Register pricing tools with the MCP server."""
 
     @mcp.tool(annotations={"readOnlyHint": True})
-    async def pricing_get(ctx: Context) -> list[TLDPricing]:  # noqa: ARG001
-        """Get pricing for all available TLDs.
+    async def pricing_get(
+        ctx: Context,
+        tlds: Annotated[
+            list[str] | None,
+            Field(description="Only return these TLDs (e.g., ['com', 'dev'])"),
+        ] = None,
+        price_field: Annotated[
+            PriceField,
+            Field(description="Price that min_price/max_price filter on"),
+        ] = "registration",
+        min_price: Annotated[
+            float | None, Field(ge=0, description="Minimum price in USD (inclusive)")
+        ] = None,
+        max_price: Annotated[
+            float | None, Field(ge=0, description="Maximum price in USD (inclusive)")
+        ] = None,
+        sort_by: Annotated[
+            SortField | None,
+            Field(description="Sort by TLD name or ascending price"),
+        ] = None,
+        limit: Annotated[int | None, Field(ge=1, description="Maximum TLDs to return")] = None,
+        page_size: Annotated[
+            int | None,
+            Field(ge=1, le=1000, description="TLDs per page; returns a page with a cursor"),
+        ] = None,
+        cursor: Annotated[
+            str | None,
+            Field(description="next_cursor from the previous page (other filters are ignored)"),
+        ] = None,
+        format: FormatParam = "objects",
+    ) -> list[TLDPricing] | Page[TLDPricing] | Table:
+        """Get pricing for available TLDs.
 
-        PREFERRED for price lookups - no rate limits, returns all TLD prices at once.
-        Use this FIRST when users ask about domain costs, then filter by TLD.
+        PREFERRED for price lookups - no rate limits, served from a local cache.
+        Use this FIRST when users ask about domain costs. Filter server-side
+        instead of fetching everything, e.g. the 10 cheapest renewals under $5:
+        price_field="renewal", max_price=5, sort_by="renewal", limit=10.
         Only use domains_check_availability when you need to verify a specific
-        domain is actually available for purchase.
+        domain is actually available for purchase. Use format="table" when
+        fetching many TLDs.
         """
-        try:
-            pricing_dict = await get_pricing()
-            return [_to_tld_pricing(tld, p) for tld, p in pricing_dict.items()]
-        except Exception as e:
-            raise handle_oinker_error(e, "get TLD pricing") from e
+        index = get_pricing_index(ctx)
+        table = format == "table"
+
+        async def query() -> list[PriceEntry]:
+            try:
+                return await index.query(
+                    tlds=tlds,
+                    price_field=price_field,
+                    min_price=_to_decimal(min_price),
+                    max_price=_to_decimal(max_price),
+                    sort_by=sort_by,
+                    limit=limit,
+                )
+            except Exception as e:
+                raise handle_oinker_error(e, "get TLD pricing") from e
+
+        async def load() -> list[TLDPricing]:
+            entries = await query()
+            with span("convert", model="TLDPricing", count=len(entries)):
+                return [_to_tld_pricing(e) for e in entries]
+
+        if not table:
+            if page_size is None and cursor is None:
+                return await load()
+            return await get_snapshot_store(ctx).page(
+                "pricing_get", cursor, page_size, load, model=Page[TLDPricing]
+            )
+        if page_size is None and cursor is None:
+            return to_table(await query(), _PRICING_COLUMNS)
+        page = await get_snapshot_store(ctx).page("pricing_get:table", cursor, page_size, query)
+        return to_table(page.items, _PRICING_COLUMNS, page.total, page.next_cursor)
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Annotated, Any
 from fastmcp import Context
 from pydantic import Field
 
-from porkbun_mcp.context import get_piglet
+from porkbun_mcp.context import get_upstream
 from porkbun_mcp.errors import handle_oinker_error
 from porkbun_mcp.models import SSLBundle
 
@@ -34,10 +34,10 @@ def register_ssl_tools(mcp: "FastMCP") -> None:
 
         Only available for domains using Porkbun nameservers.
         """
-        piglet = get_piglet(ctx)
+        upstream = get_upstream(ctx)
 
         try:
-            bundle = await piglet.ssl.retrieve(domain)
+            bundle = await upstream.call("ssl.retrieve", domain)
             return _to_ssl_bundle(bundle)
         except Exception as e:
             raise handle_oinker_error(e, f"retrieve SSL bundle for {domain}") from e
@@ -0,0 +1,49 @@
+"""Server statistics tools for the Porkbun MCP server."""
+
+from typing import TYPE_CHECKING
+
+from fastmcp import Context
+
+from porkbun_mcp.context import get_upstream, get_zone_cache
+from porkbun_mcp.models import CoalescingStats, RateLimitStats, ServerStats, ZoneCacheStats
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+
+def register_stats_tools(mcp: "FastMCP") -> None:
+    """Register server statistics tools with the MCP server."""
+
+    @mcp.tool(annotations={"readOnlyHint": True})
+    async def server_stats(ctx: Context) -> ServerStats:
+        """Get cache, coalescing and rate limiter statistics for this server."""
+        cache = get_zone_cache(ctx)
+        upstream = get_upstream(ctx)
+        flight = upstream.flight
+        return ServerStats(
+            zone_cache=ZoneCacheStats(
+                enabled=cache.enabled,
+                hits=cache.stats.hits,
+                misses=cache.stats.misses,
+                evictions=cache.stats.evictions,
+                invalidations=cache.stats.invalidations,
+                zones=len(cache),
+                bytes=cache.size,
+            ),
+            coalescing=CoalescingStats(
+                calls=flight.calls,
+                coalesced=flight.coalesced,
+                in_flight=flight.in_flight,
+            ),
+            rate_limits=[
+                RateLimitStats(
+                    endpoint_class=name,
+                    max_rate=bucket.max_rate,
+                    rate=bucket.rate,
+                    waits=bucket.waits,
+                    wait_seconds=bucket.wait_seconds,
+                    throttled=bucket.throttled,
+                )
+                for name, bucket in upstream.limiter.buckets.items()
+            ],
+        )
@@ -0,0 +1,217 @@
+"""Optional tracing of tool calls down to individual Porkbun requests."""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, Protocol
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[tuple[Tracer, Span] | None] = ContextVar("porkbun_span", default=None)
+_NOOP: AbstractContextManager[None] = nullcontext()
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed step of a tool call.
+
+    Attributes:
+        name: What the step does, e.g. ``"piglet.dns.list"``.
+        trace_id: Shared by every span of one tool call.
+        span_id: Unique ID of this span.
+        parent_id: Enclosing span, or None for the tool call itself.
+        start: Start time (epoch seconds).
+        end: End time, once finished.
+        attributes: Extra details such as the tool or method name.
+        status: ``"error"`` if the step raised.
+        error: Exception raised by the step.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start: float
+    end: float | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: Literal["ok", "error"] = "ok"
+    error: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Seconds between start and end, once finished."""
+        return None if self.end is None else self.end - self.start
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain representation for exporters."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "end": self.end,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class SpanExporter(Protocol):
+    """Receives every span once it has finished."""
+
+    def export(self, span: Span) -> None:
+        """Handle a finished span."""
+        ...
+
+
+class InMemoryExporter:
+    """Keeps finished spans in a list, for tests.
+
+    Attributes:
+        spans: Finished spans in the order they ended.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        """Append the span."""
+        self.spans.append(span)
+
+    def names(self) -> list[str]:
+        """Names of the finished spans."""
+        return [s.name for s in self.spans]
+
+
+class JsonlExporter:
+    """Appends each finished span as one JSON line to a local file.
+
+    Spans are queued and written by a background thread, so a traced tool
+    call never waits on the file; the file is flushed whenever the queue runs
+    empty.
+
+    Attributes:
+        path: Trace file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._queue: queue.SimpleQueue[dict[str, Any] | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+
+    def export(self, span: Span) -> None:
+        """Queue the span for writing."""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._write, name="porkbun-trace-writer", daemon=True
+            )
+            self._writer.start()
+        self._queue.put(span.to_dict())
+
+    def close(self) -> None:
+        """Write the spans still queued and close the trace file."""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def _write(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            file = self.path.open("a")
+        except OSError as e:
+            logger.warning("Cannot write traces to %s: %s", self.path, e)
+            while self._queue.get() is not None:
+                pass
+            return
+        with file:
+            while (span := self._queue.get()) is not None:
+                file.write(json.dumps(span, default=str) + "\n")
+                if self._queue.empty():
+                    file.flush()
+
+
+class Tracer:
+    """Creates spans and hands finished ones to an exporter.
+
+    Without an exporter the tracer is disabled and ``TracingMiddleware``
+    passes calls straight through, so no span is ever created.
+
+    Attributes:
+        exporter: Destination for finished spans, or None when disabled.
+    """
+
+    def __init__(self, exporter: SpanExporter | None = None) -> None:
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return self.exporter is not None
+
+    @contextmanager
+    def start(self, name: str, parent: Span | None = None, **attributes: Any) -> Iterator[Span]:
+        """Time a block as a span, making it the parent of spans started inside it.
+
+        Args:
+            name: Span name.
+            parent: Enclosing span; None starts a new trace.
+            **attributes: Extra details recorded on the span.
+        """
+        span = self._new(name, parent, time.time(), attributes)
+        token = _current.set((self, span))
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current.reset(token)
+            self._finish(span, time.time())
+
+    def _new(
+        self, name: str, parent: Span | None, start: float, attributes: dict[str, Any]
+    ) -> Span:
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start=start,
+            attributes=attributes,
+        )
+
+    def _finish(self, span: Span, end: float) -> None:
+        span.end = end
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager[Span | None]:
+    """Time a block as a child of the current span.
+
+    Outside a traced tool call this returns a shared no-op context manager,
+    so instrumented code costs one context variable lookup when tracing is off.
+
+    Args:
+        name: Span name.
+        **attributes: Extra details recorded on the span.
+    """
+    current = _current.get()
+    if current is None:
+        return _NOOP
+    tracer, parent = current
+    return tracer.start(name, parent, **attributes)
@@ -0,0 +1,248 @@
+"""Shared call path for Porkbun API requests made by the tools."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from porkbun_mcp.errors import error_category
+from porkbun_mcp.metrics import Metrics
+from porkbun_mcp.ratelimit import RateLimiter
+from porkbun_mcp.retry import RetryPolicy, record_attempts
+from porkbun_mcp.tracing import span
+
+if TYPE_CHECKING:
+    from oinker import AsyncPiglet
+
+# AsyncPiglet methods that never change account state.
+READ_OPERATIONS = frozenset(
+    {
+        "ping",
+        "dns.list",
+        "dns.get",
+        "dns.get_by_name_type",
+        "dnssec.list",
+        "domains.list",
+        "domains.get_nameservers",
+        "domains.get_url_forwards",
+        "domains.check",
+        "domains.get_glue_records",
+        "ssl.retrieve",
+    }
+)
+
+
+# Writes behind tools annotated idempotentHint=True; repeating them is harmless.
+IDEMPOTENT_WRITE_OPERATIONS = frozenset(
+    {
+        "dns.edit",
+        "dns.edit_by_name_type",
+        "domains.update_nameservers",
+        "domains.update_glue_record",
+    }
+)
+
+RETRYABLE_OPERATIONS = READ_OPERATIONS | IDEMPOTENT_WRITE_OPERATIONS
+
+# Porkbun limits domain availability checks far more tightly than other endpoints.
+CHECK_OPERATIONS = frozenset({"domains.check"})
+
+
+def endpoint_class(operation: str) -> str:
+    """Return the rate limit class for an AsyncPiglet operation.
+
+    Args:
+        operation: Dotted method path on AsyncPiglet.
+
+    Returns:
+        ``"check"``, ``"general"`` for other reads, or ``"write"``.
+    """
+    if operation in CHECK_OPERATIONS:
+        return "check"
+    if operation in READ_OPERATIONS:
+        return "general"
+    return "write"
+
+
+class SingleFlight:
+    """Share one in-flight call between identical concurrent callers.
+
+    Callers that arrive while a call with the same key is running await that
+    call instead of starting their own, and all of them receive its result or
+    its exception. Nothing is cached once the call finishes.
+
+    Attributes:
+        calls: Calls made through this instance.
+        coalesced: Calls that joined an in-flight call instead of starting one.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Identity of the call, e.g. operation name and arguments.
+            fn: Zero-argument coroutine function performing the call.
+
+        Returns:
+            The shared call's result.
+        """
+        self.calls += 1
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._finish(key, f))
+        else:
+            self.coalesced += 1
+        # Shield so one caller being cancelled does not cancel the call for the others.
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved even if every caller was cancelled.
+            future.exception()
+
+
+def _call_key(operation: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable | None:
+    key = (operation, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class LazyPiglet:
+    """An AsyncPiglet that is created and opened on the first request.
+
+    Importing oinker and opening its HTTP client (which loads the system's TLS
+    certificates) is a sizeable share of startup, and a stdio session that
+    only lists tools never needs either.
+
+    Args:
+        **options: Keyword arguments for ``AsyncPiglet``.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        self._options = options
+        self._piglet: AsyncPiglet | None = None
+
+    async def get(self) -> AsyncPiglet:
+        """Return the client, opening it on first use."""
+        if self._piglet is None:
+            from oinker import AsyncPiglet
+
+            piglet = AsyncPiglet(**self._options)
+            await piglet.__aenter__()
+            self._piglet = piglet
+        return self._piglet
+
+    async def aclose(self) -> None:
+        """Close the client if it was opened."""
+        piglet, self._piglet = self._piglet, None
+        if piglet is not None:
+            await piglet.__aexit__(None, None, None)
+
+
+class Upstream:
+    """Entry point for every AsyncPiglet call made by the tools.
+
+    Operations are named by their attribute path on AsyncPiglet, e.g.
+    ``"dns.list"``. Concurrent read operations with identical arguments are
+    coalesced into a single request, and every request waits for a token from
+    the rate limiter bucket of its endpoint class. Reads and idempotent writes
+    are retried on transient failures; other writes are attempted once.
+
+    Attributes:
+        piglet: The underlying oinker client, or one opened on first use.
+        flight: Single-flight group used for read operations.
+        limiter: Client-side rate limiter.
+        retry: Retry policy for idempotent operations.
+        metrics: Per-request latency, error and rate limiter metrics.
+    """
+
+    def __init__(
+        self,
+        piglet: AsyncPiglet | LazyPiglet,
+        flight: SingleFlight | None = None,
+        limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
+        self.piglet = piglet
+        self.flight = flight or SingleFlight()
+        self.limiter = limiter or RateLimiter()
+        self.retry = retry or RetryPolicy()
+        self.metrics = metrics or Metrics()
+
+    async def call(self, operation: str, *args: Any, **kwargs: Any) -> Any:
+        """Call an AsyncPiglet method by name.
+
+        Args:
+            operation: Dotted method path on AsyncPiglet (e.g. ``"dns.list"``).
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            The method's result.
+        """
+        attempt = partial(self._request, operation, args, kwargs)
+        retrying = partial(self.retry.run, attempt, operation in RETRYABLE_OPERATIONS)
+        key = _call_key(operation, args, kwargs) if operation in READ_OPERATIONS else None
+        try:
+            if key is None:
+                result, attempts = await retrying()
+            else:
+                result, attempts = await self.flight.do(key, retrying)
+        except Exception as e:
+            record_attempts(getattr(e, "attempts", 1))
+            raise
+        record_attempts(attempts)
+        return result
+
+    async def _request(self, operation: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        with span(f"piglet.{operation}", method=operation) as s:
+            piglet = self.piglet
+            if isinstance(piglet, LazyPiglet):
+                piglet = await piglet.get()
+            method = attrgetter(operation)(piglet)
+            bucket = endpoint_class(operation)
+            metrics = self.metrics
+            try:
+                waited = await self.limiter.acquire(bucket)
+            except Exception as e:
+                metrics.upstream_errors.inc(operation, error_category(e))
+                raise
+            metrics.rate_limit_wait.observe(waited, bucket)
+            if s is not None:
+                s.attributes["rate_limit_wait"] = waited
+
+            metrics.upstream_in_flight.inc(operation)
+            start = time.perf_counter()
+            try:
+                result = await method(*args, **kwargs)
+            except Exception as e:
+                self.limiter.record(bucket, e)
+                metrics.upstream_errors.inc(operation, error_category(e))
+                raise
+            finally:
+                metrics.upstream_duration.observe(time.perf_counter() - start, operation)
+                metrics.upstream_in_flight.dec(operation)
+            self.limiter.record(bucket, None)
+            return result
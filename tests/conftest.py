@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Coroutine
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -21,6 +22,14 @@ async def get_tool_fn(mcp: FastMCP, name: str) -> Callable[..., Coroutine[Any, A
     return tool.fn
 
 
+@pytest.fixture(autouse=True)
+def schema_cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Give servers created by tests a schema cache of their own."""
+    path = tmp_path / "schemas.json"
+    monkeypatch.setenv("PORKBUN_SCHEMA_CACHE_PATH", str(path))
+    return path
+
+
 @pytest.fixture
 def mock_piglet() -> AsyncMock:
     """Mock AsyncPiglet client."""
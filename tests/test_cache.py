@@ -0,0 +1,148 @@
+"""Tests for the DNS zone cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+from conftest import make_mock_dns_record
+
+from porkbun_mcp.cache import ZoneCache, estimate_zone_size
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestZoneCache:
+    """Tests for ZoneCache."""
+
+    async def test_second_read_is_a_hit(self) -> None:
+        """A fresh zone is served without a second fetch."""
+        fetch = AsyncMock(return_value=[make_mock_dns_record()])
+        cache = ZoneCache(ttl=60)
+
+        await cache.get_zone("example.com", fetch)
+        records = await cache.get_zone("EXAMPLE.com", fetch)
+
+        assert len(records) == 1
+        fetch.assert_awaited_once_with("example.com")
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    async def test_expired_zone_is_refetched(self) -> None:
+        """Zones older than the TTL are fetched again."""
+        clock = FakeClock()
+        fetch = AsyncMock(return_value=[])
+        cache = ZoneCache(ttl=10, clock=clock)
+
+        await cache.get_zone("example.com", fetch)
+        clock.now = 11
+        await cache.get_zone("example.com", fetch)
+
+        assert fetch.await_count == 2
+        assert cache.stats.misses == 2
+
+    async def test_disabled_cache_always_fetches(self) -> None:
+        """A zero TTL disables caching and counters."""
+        fetch = AsyncMock(return_value=[])
+        cache = ZoneCache()
+
+        await cache.get_zone("example.com", fetch)
+        await cache.get_zone("example.com", fetch)
+
+        assert not cache.enabled
+        assert fetch.await_count == 2
+        assert cache.stats.misses == 0
+        assert len(cache) == 0
+
+    async def test_invalidate_drops_zone(self) -> None:
+        """Invalidated zones are fetched again on the next read."""
+        fetch = AsyncMock(return_value=[])
+        cache = ZoneCache(ttl=60)
+
+        await cache.get_zone("example.com", fetch)
+        cache.invalidate("example.com")
+        await cache.get_zone("example.com", fetch)
+
+        assert fetch.await_count == 2
+        assert cache.stats.invalidations == 1
+
+    async def test_write_during_fetch_is_not_cached(self) -> None:
+        """A fetch that races with a write does not populate the cache."""
+        cache = ZoneCache(ttl=60)
+
+        async def fetch(domain: str) -> list[object]:
+            cache.invalidate(domain)
+            return []
+
+        await cache.get_zone("example.com", fetch)
+
+        assert cache.peek("example.com") is None
+
+    async def test_byte_budget_evicts_least_recently_used(self) -> None:
+        """Zones beyond the byte budget evict the oldest entries."""
+        records = [make_mock_dns_record()]
+        zone_size = estimate_zone_size(records)
+        fetch = AsyncMock(return_value=records)
+        cache = ZoneCache(ttl=60, max_bytes=zone_size * 2)
+
+        await cache.get_zone("a.com", fetch)
+        await cache.get_zone("b.com", fetch)
+        await cache.get_zone("a.com", fetch)
+        await cache.get_zone("c.com", fetch)
+
+        assert cache.peek("a.com") is not None
+        assert cache.peek("b.com") is None
+        assert cache.stats.evictions == 1
+        assert cache.size == zone_size * 2
+
+    async def test_listeners_follow_stores_and_drops(self) -> None:
+        """Listeners see each stored zone and each invalidation or eviction."""
+        events: list[tuple[str, int | None]] = []
+        cache = ZoneCache(ttl=60)
+        cache.add_listener(lambda d, r: events.append((d, None if r is None else len(r))))
+        fetch = AsyncMock(return_value=[make_mock_dns_record()])
+
+        await cache.get_zone("Example.com", fetch)
+        cache.invalidate("example.com")
+
+        assert events == [("example.com", 1), ("example.com", None)]
+
+    async def test_expired_zones_are_released(self) -> None:
+        """Expired zones are dropped on lookup and when other zones are stored."""
+        clock = FakeClock()
+        records = [make_mock_dns_record()]
+        fetch = AsyncMock(return_value=records)
+        cache = ZoneCache(ttl=10, clock=clock)
+        dropped: list[str] = []
+        cache.add_listener(lambda d, r: dropped.append(d) if r is None else None)
+
+        await cache.get_zone("a.com", fetch)
+        await cache.get_zone("b.com", fetch)
+        clock.now = 11
+        assert cache.peek("a.com") is None
+        await cache.get_zone("c.com", fetch)
+
+        assert dropped == ["a.com", "b.com"]
+        assert len(cache) == 1
+        assert cache.size == estimate_zone_size(records)
+
+    async def test_write_counters_do_not_accumulate(self) -> None:
+        """Invalidations outside a fetch leave no per-domain state behind."""
+        cache = ZoneCache(ttl=60)
+
+        for i in range(100):
+            cache.invalidate(f"domain{i}.com")
+
+        async def fetch(domain: str) -> list[object]:
+            cache.invalidate(domain)
+            return []
+
+        await cache.get_zone("example.com", fetch)
+
+        assert cache._generations == {}
+        assert cache._fetching == {}
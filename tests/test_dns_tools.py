@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from conftest import get_tool_fn, make_mock_dns_record
+from conftest import get_tool_fn, make_mock_dns_record, make_mock_domain
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
-
-from porkbun_mcp.models import DNSRecord, DNSRecordCreated, DNSRecordDeleted
+from oinker import NotFoundError
+
+from porkbun_mcp.cache import ZoneCache
+from porkbun_mcp.models import (
+    DNSBulkResult,
+    DNSDesiredRecord,
+    DNSListManyResult,
+    DNSOperation,
+    DNSRecord,
+    DNSRecordCreated,
+    DNSRecordDeleted,
+    DNSSearchResult,
+    DNSSyncResult,
+    Page,
+    PartialDNSRecord,
+    Table,
+)
+from porkbun_mcp.server import AppContext
 from porkbun_mcp.tools.dns import register_dns_tools
 
 
@@ -50,6 +67,325 @@ class TestDNSList:
         assert result == []
 
 
+class TestDNSListTable:
+    """Tests for dns_list table output."""
+
+    @pytest.fixture
+    def zone(self, mock_piglet: AsyncMock) -> None:
+        mock_piglet.dns.list.return_value = [
+            make_mock_dns_record(id="1", priority=0, notes=""),
+            make_mock_dns_record(
+                id="2", record_type="MX", name="example.com", content="mx.example.com", priority=10
+            ),
+            make_mock_dns_record(id="3", name="api.example.com", priority=0, notes=""),
+        ]
+
+    @pytest.mark.usefixtures("zone")
+    async def test_leaves_out_empty_columns(self, mock_context: MagicMock) -> None:
+        """Priority is kept because one record has one; notes are empty everywhere."""
+        tool_fn = await get_tool_fn(_register_dns(), "dns_list")
+
+        result = await tool_fn(mock_context, domain="example.com", format="table")
+
+        assert isinstance(result, Table)
+        assert result.columns == ["id", "type", "name", "content", "ttl", "priority"]
+        assert result.rows[1] == ["2", "MX", "example.com", "mx.example.com", 600, 10]
+        assert result.total == 3
+
+    @pytest.mark.usefixtures("zone")
+    async def test_fields_and_pages(self, mock_context: MagicMock) -> None:
+        """Requested fields keep the model's order, and pages come from the snapshot."""
+        tool_fn = await get_tool_fn(_register_dns(), "dns_list")
+
+        first = await tool_fn(
+            mock_context, domain="example.com", fields=["name", "id"], page_size=2, format="table"
+        )
+        second = await tool_fn(
+            mock_context,
+            domain="example.com",
+            fields=["name", "id"],
+            cursor=first.next_cursor,
+            format="table",
+        )
+
+        assert first.columns == ["id", "name"]
+        assert first.rows == [["1", "www.example.com"], ["2", "example.com"]]
+        assert second.rows == [["3", "api.example.com"]]
+        assert second.next_cursor is None
+
+
+class TestDNSListFiltering:
+    """Tests for dns_list filters and field projection."""
+
+    @pytest.fixture
+    def zone(self, mock_piglet: AsyncMock) -> None:
+        mock_piglet.dns.list.return_value = [
+            make_mock_dns_record(id="1", name="www.example.com"),
+            make_mock_dns_record(
+                id="2", record_type="TXT", name="_dmarc.example.com", content="v=DMARC1; p=none"
+            ),
+            make_mock_dns_record(
+                id="3", record_type="TXT", name="example.com", content="v=spf1 -all"
+            ),
+        ]
+
+    @pytest.mark.usefixtures("zone")
+    async def test_type_and_name_glob(self, mock_context: MagicMock) -> None:
+        """Type and name glob filters combine."""
+        tool_fn = await get_tool_fn(_register_dns(), "dns_list")
+
+        result = await tool_fn(
+            mock_context, domain="example.com", record_type="txt", name="_dmarc.*"
+        )
+
+        assert [r.id for r in result] == ["2"]
+
+    @pytest.mark.usefixtures("zone")
+    async def test_name_regex_and_content(self, mock_context: MagicMock) -> None:
+        """Regex and content substring filters combine."""
+        tool_fn = await get_tool_fn(_register_dns(), "dns_list")
+
+        result = await tool_fn(
+            mock_context,
+            domain="example.com",
+            name_regex=r"^example\.com$",
+            content_contains="SPF1",
+        )
+
+        assert [r.id for r in result] == ["3"]
+
+    @pytest.mark.usefixtures("zone")
+    async def test_fields_projection_omits_other_fields(self, mock_context: MagicMock) -> None:
+        """Projected records serialize only the requested fields."""
+        tool_fn = await get_tool_fn(_register_dns(), "dns_list")
+
+        result = await tool_fn(
+            mock_context, domain="example.com", record_type="TXT", fields=["name", "content"]
+        )
+
+        assert all(isinstance(r, PartialDNSRecord) for r in result)
+        assert result[0].model_dump(mode="json") == {
+            "name": "_dmarc.example.com",
+            "content": "v=DMARC1; p=none",
+        }
+
+    async def test_invalid_regex(self, mock_context: MagicMock, mock_piglet: AsyncMock) -> None:
+        """An invalid regex is rejected before the zone is fetched."""
+        tool_fn = await get_tool_fn(_register_dns(), "dns_list")
+
+        with pytest.raises(ToolError, match="Invalid name_regex"):
+            await tool_fn(mock_context, domain="example.com", name_regex="(")
+
+        mock_piglet.dns.list.assert_not_called()
+
+    async def test_get_by_name_type_projection(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """dns_get_by_name_type supports content filtering and projection."""
+        mock_piglet.dns.get_by_name_type.return_value = [
+            make_mock_dns_record(id="1", content="192.0.2.1"),
+            make_mock_dns_record(id="2", content="198.51.100.1"),
+        ]
+        tool_fn = await get_tool_fn(_register_dns(), "dns_get_by_name_type")
+
+        result = await tool_fn(
+            mock_context,
+            domain="example.com",
+            record_type="A",
+            subdomain="www",
+            content_contains="198.51",
+            fields=["id"],
+        )
+
+        assert [r.model_dump() for r in result] == [{"id": "2"}]
+
+
+class TestDNSListPagination:
+    """Tests for dns_list pagination."""
+
+    async def test_pages_are_consistent_across_writes(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Later pages come from the first page's snapshot, not a new fetch."""
+        mock_piglet.dns.list.return_value = [
+            make_mock_dns_record(id=str(i), name=f"h{i}.example.com") for i in range(3)
+        ]
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_list")
+
+        first = await tool_fn(mock_context, domain="example.com", page_size=2)
+        delete = await get_tool_fn(mcp, "dns_delete")
+        await delete(mock_context, domain="example.com", record_id="0")
+        mock_piglet.dns.list.return_value = []
+        second = await tool_fn(mock_context, domain="example.com", cursor=first.next_cursor)
+
+        assert isinstance(first, Page)
+        assert [r.id for r in first.items] == ["0", "1"]
+        assert [r.id for r in second.items] == ["2"]
+        assert second.next_cursor is None
+        mock_piglet.dns.list.assert_awaited_once()
+
+    async def test_cursor_bound_to_domain(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """A cursor for one domain is rejected for another."""
+        mock_piglet.dns.list.return_value = [
+            make_mock_dns_record(id="1"),
+            make_mock_dns_record(id="2"),
+        ]
+        tool_fn = await get_tool_fn(_register_dns(), "dns_list")
+
+        first = await tool_fn(mock_context, domain="example.com", page_size=1)
+
+        with pytest.raises(ToolError, match="does not belong"):
+            await tool_fn(mock_context, domain="other.com", cursor=first.next_cursor)
+
+
+class TestDNSListMany:
+    """Tests for dns_list_many tool."""
+
+    async def test_lists_each_domain(self, mock_context: MagicMock, mock_piglet: AsyncMock) -> None:
+        """Records are returned per domain, in request order, once per domain."""
+        mock_piglet.dns.list.side_effect = lambda domain: [
+            make_mock_dns_record(name=f"www.{domain}")
+        ]
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_list_many")
+
+        result = await tool_fn(mock_context, domains=["b.com", "a.com", "B.com"])
+
+        assert isinstance(result, DNSListManyResult)
+        assert [d.domain for d in result.domains] == ["b.com", "a.com"]
+        assert result.domains[1].records[0].name == "www.a.com"
+        assert result.succeeded == 2
+        assert mock_piglet.dns.list.await_count == 2
+
+    async def test_failed_domain_reported_inline(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """A domain that fails carries its error while others succeed."""
+
+        async def zone(domain: str) -> list:
+            if domain == "bad.com":
+                raise NotFoundError("Domain not found")
+            return [make_mock_dns_record()]
+
+        mock_piglet.dns.list.side_effect = zone
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_list_many")
+
+        result = await tool_fn(mock_context, domains=["bad.com", "good.com"], concurrency=1)
+
+        assert result.failed == 1
+        assert result.domains[0].records is None
+        assert "Not found" in result.domains[0].error
+        assert len(result.domains[1].records) == 1
+
+
+class TestDNSSearch:
+    """Tests for dns_search tool."""
+
+    async def test_finds_address_across_account(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """'all' domains are searched and matches carry their domain."""
+        mock_piglet.domains.list.return_value = [
+            make_mock_domain(domain="a.com"),
+            make_mock_domain(domain="b.com"),
+        ]
+        mock_piglet.dns.list.side_effect = lambda domain: [
+            make_mock_dns_record(id=f"{domain}-1", name=f"www.{domain}", content="203.0.113.5"),
+            make_mock_dns_record(id=f"{domain}-2", name=f"api.{domain}", content="192.0.2.1"),
+        ]
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_search")
+
+        result = await tool_fn(mock_context, content="203.0.113.5")
+
+        assert isinstance(result, DNSSearchResult)
+        assert result.domains_searched == 2
+        assert [(m.domain, m.name) for m in result.records] == [
+            ("a.com", "www.a.com"),
+            ("b.com", "www.b.com"),
+        ]
+
+    async def test_account_domains_are_listed_once(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Repeat searches of 'all' reuse the domain list instead of listing it again."""
+        mock_piglet.domains.list.return_value = [make_mock_domain(domain="a.com")]
+        mock_piglet.dns.list.return_value = [make_mock_dns_record(content="203.0.113.5")]
+        search = await get_tool_fn(_register_dns(), "dns_search")
+
+        await search(mock_context, content="203.0.113.5")
+        result = await search(mock_context, cidr="203.0.113.0/24")
+
+        assert result.domains_searched == 1
+        mock_piglet.domains.list.assert_awaited_once()
+
+    async def test_uncached_zones_are_not_kept_in_index(
+        self,
+        mock_context: MagicMock,
+        mock_lifespan_context: AppContext,
+        mock_piglet: AsyncMock,
+    ) -> None:
+        """With zone caching off, the index is emptied after each search."""
+        mock_piglet.dns.list.return_value = [make_mock_dns_record(content="203.0.113.5")]
+        mcp = _register_dns()
+        search = await get_tool_fn(mcp, "dns_search")
+
+        result = await search(mock_context, content="203.0.113.5", domains=["example.com"])
+
+        assert result.total == 1
+        assert not mock_lifespan_context.zone_cache.enabled
+        assert len(mock_lifespan_context.search_index) == 0
+
+    async def test_cached_zones_answer_repeat_searches(
+        self, cached_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """A second search is served from the cache and index, and writes refresh it."""
+        mock_piglet.dns.list.return_value = [make_mock_dns_record(content="203.0.113.5")]
+        mcp = _register_dns()
+        search = await get_tool_fn(mcp, "dns_search")
+
+        await search(cached_context, cidr="203.0.113.0/24", domains=["example.com"])
+        result = await search(cached_context, cidr="203.0.113.0/24", domains=["example.com"])
+        assert result.total == 1
+        assert mock_piglet.dns.list.await_count == 1
+
+        delete = await get_tool_fn(mcp, "dns_delete")
+        await delete(cached_context, domain="example.com", record_id="12345")
+        mock_piglet.dns.list.return_value = []
+        result = await search(cached_context, cidr="203.0.113.0/24", domains=["example.com"])
+        assert result.total == 0
+
+    async def test_limit_and_errors(self, mock_context: MagicMock, mock_piglet: AsyncMock) -> None:
+        """Results are capped by limit and failed domains are listed."""
+
+        async def zone(domain: str) -> list:
+            if domain == "bad.com":
+                raise NotFoundError("Domain not found")
+            return [make_mock_dns_record(id=str(i), name=f"h{i}.{domain}") for i in range(3)]
+
+        mock_piglet.dns.list.side_effect = zone
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_search")
+
+        result = await tool_fn(mock_context, record_type="A", domains=["a.com", "bad.com"], limit=2)
+
+        assert result.total == 3
+        assert len(result.records) == 2
+        assert result.errors[0].startswith("bad.com:")
+
+    async def test_invalid_cidr(self, mock_context: MagicMock) -> None:
+        """A malformed CIDR range is rejected."""
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_search")
+
+        with pytest.raises(ToolError, match="Invalid CIDR"):
+            await tool_fn(mock_context, cidr="nope")
+
+
 class TestDNSGet:
     """Tests for dns_get tool."""
 
@@ -220,3 +556,360 @@ class TestDNSDeleteByNameType:
         assert isinstance(result, DNSRecordDeleted)
         assert result.status == "deleted"
         mock_piglet.dns.delete_by_name_type.assert_called_once_with("example.com", "A", "www")
+
+
+@pytest.fixture
+def cached_context(mock_context: MagicMock) -> MagicMock:
+    """Mock context with the zone cache enabled."""
+    mock_context.request_context.lifespan_context.zone_cache = ZoneCache(ttl=60)
+    return mock_context
+
+
+class TestDNSZoneCache:
+    """Tests for DNS reads served from the zone cache."""
+
+    async def test_reads_share_one_zone_fetch(
+        self, cached_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """dns_list, dns_get and dns_get_by_name_type reuse one dns.list call."""
+        mock_piglet.dns.list.return_value = [
+            make_mock_dns_record(id="1", name="www.example.com"),
+            make_mock_dns_record(id="2", name="example.com"),
+        ]
+        mcp = _register_dns()
+
+        listed = await (await get_tool_fn(mcp, "dns_list"))(cached_context, domain="example.com")
+        got = await (await get_tool_fn(mcp, "dns_get"))(
+            cached_context, domain="example.com", record_id="2"
+        )
+        by_name = await (await get_tool_fn(mcp, "dns_get_by_name_type"))(
+            cached_context, domain="example.com", record_type="a", subdomain="www"
+        )
+
+        assert len(listed) == 2
+        assert got.id == "2"
+        assert [r.id for r in by_name] == ["1"]
+        mock_piglet.dns.list.assert_awaited_once_with("example.com")
+        mock_piglet.dns.get.assert_not_called()
+        mock_piglet.dns.get_by_name_type.assert_not_called()
+
+    async def test_dns_get_falls_back_when_record_not_cached(
+        self, cached_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """dns_get asks upstream for IDs missing from the cached zone."""
+        mock_piglet.dns.list.return_value = []
+        mock_piglet.dns.get.return_value = make_mock_dns_record(id="9")
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_get")
+
+        result = await tool_fn(cached_context, domain="example.com", record_id="9")
+
+        assert result.id == "9"
+        mock_piglet.dns.get.assert_awaited_once_with("example.com", "9")
+
+    async def test_write_invalidates_zone(
+        self, cached_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """A write forces the next read to fetch the zone again."""
+        mock_piglet.dns.list.return_value = []
+        mcp = _register_dns()
+        dns_list = await get_tool_fn(mcp, "dns_list")
+        dns_delete = await get_tool_fn(mcp, "dns_delete")
+
+        await dns_list(cached_context, domain="example.com")
+        await dns_delete(cached_context, domain="example.com", record_id="1")
+        await dns_list(cached_context, domain="example.com")
+
+        assert mock_piglet.dns.list.await_count == 2
+
+
+class TestDNSBulkApply:
+    """Tests for dns_bulk_apply tool."""
+
+    async def test_applies_mixed_operations(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Creates, edits and deletes are applied and reported in order."""
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_bulk_apply")
+
+        result = await tool_fn(
+            mock_context,
+            operations=[
+                DNSOperation(action="create", domain="a.com", record_type="A", content="192.0.2.1"),
+                DNSOperation(
+                    action="edit",
+                    domain="b.com",
+                    record_id="7",
+                    record_type="TXT",
+                    content="hello",
+                ),
+                DNSOperation(action="delete", domain="a.com", record_id="8"),
+            ],
+        )
+
+        assert isinstance(result, DNSBulkResult)
+        assert result.succeeded == 3
+        assert [r.status for r in result.results] == ["created", "updated", "deleted"]
+        assert result.results[0].record_id == "12345"
+        mock_piglet.dns.delete.assert_awaited_once_with("a.com", "8")
+
+    async def test_invalid_operation_applies_nothing(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Any invalid operation rejects the whole batch before sending."""
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_bulk_apply")
+
+        with pytest.raises(ToolError, match="operation 1") as exc_info:
+            await tool_fn(
+                mock_context,
+                operations=[
+                    DNSOperation(
+                        action="create", domain="a.com", record_type="A", content="1.2.3.4"
+                    ),
+                    DNSOperation(action="create", domain="a.com", record_type="A", content="nope"),
+                    DNSOperation(action="delete", domain="a.com"),
+                ],
+            )
+
+        assert "operation 2" in str(exc_info.value)
+        mock_piglet.dns.create.assert_not_called()
+
+    async def test_continue_mode_reports_failures_inline(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Failed operations are reported without stopping the others."""
+        mock_piglet.dns.delete.side_effect = [NotFoundError("no such record"), None]
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_bulk_apply")
+
+        result = await tool_fn(
+            mock_context,
+            operations=[
+                DNSOperation(action="delete", domain="a.com", record_id="1"),
+                DNSOperation(action="delete", domain="a.com", record_id="2"),
+            ],
+            concurrency=1,
+        )
+
+        assert (result.succeeded, result.failed) == (1, 1)
+        assert "no such record" in result.results[0].error
+
+    async def test_stop_on_error_skips_remaining(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """With stop_on_error, operations after a failure are skipped."""
+        mock_piglet.dns.delete.side_effect = NotFoundError("no such record")
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_bulk_apply")
+
+        result = await tool_fn(
+            mock_context,
+            operations=[
+                DNSOperation(action="delete", domain="a.com", record_id=str(i)) for i in range(3)
+            ],
+            stop_on_error=True,
+            concurrency=1,
+        )
+
+        assert [r.status for r in result.results] == ["failed", "skipped", "skipped"]
+        assert mock_piglet.dns.delete.await_count == 1
+
+
+class TestDNSBulkApplyResume:
+    """Tests for journaled, resumable dns_bulk_apply."""
+
+    @pytest.fixture
+    def journal_context(
+        self, mock_context: MagicMock, mock_lifespan_context: AppContext, tmp_path: Path
+    ) -> MagicMock:
+        mock_lifespan_context.journal_dir = tmp_path
+        return mock_context
+
+    async def test_resume_skips_finished_operations(
+        self, journal_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Resuming re-sends only what did not finish, then clears the journal."""
+        operations = [
+            DNSOperation(action="create", domain="a.com", record_type="A", content="192.0.2.1"),
+            DNSOperation(action="create", domain="a.com", record_type="A", content="192.0.2.2"),
+        ]
+        mock_piglet.dns.create.side_effect = ["1", RuntimeError("connection reset")]
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_bulk_apply")
+
+        first = await tool_fn(journal_context, operations=operations, concurrency=1)
+        assert (first.succeeded, first.failed) == (1, 1)
+        assert first.batch_id is not None
+
+        mock_piglet.dns.create.side_effect = ["2"]
+        second = await tool_fn(journal_context, resume=first.batch_id)
+
+        assert (second.succeeded, second.failed, second.resumed) == (2, 0, 1)
+        assert [r.record_id for r in second.results] == ["1", "2"]
+        assert second.batch_id is None
+        assert mock_piglet.dns.create.await_count == 3
+        with pytest.raises(ToolError, match="No interrupted batch"):
+            await tool_fn(journal_context, resume=first.batch_id)
+
+    async def test_resume_uses_journaled_operations(
+        self, journal_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Resuming replays the journal's operations; the caller cannot pass others."""
+        operations = [DNSOperation(action="delete", domain="a.com", record_id="1")]
+        mock_piglet.dns.delete.side_effect = RuntimeError("connection reset")
+        tool_fn = await get_tool_fn(_register_dns(), "dns_bulk_apply")
+        first = await tool_fn(journal_context, operations=operations)
+
+        with pytest.raises(ToolError, match="either operations or resume"):
+            await tool_fn(
+                journal_context,
+                operations=[DNSOperation(action="delete", domain="b.com", record_id="2")],
+                resume=first.batch_id,
+            )
+        mock_piglet.dns.delete.side_effect = None
+        second = await tool_fn(journal_context, resume=first.batch_id)
+
+        assert second.succeeded == 1
+        mock_piglet.dns.delete.assert_awaited_with("a.com", "1")
+
+    async def test_resubmitting_interrupted_batch_requires_resume(
+        self, journal_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Sending an unfinished batch again does not wipe its journal or repeat creates."""
+        operations = [
+            DNSOperation(action="create", domain="a.com", record_type="A", content="192.0.2.1"),
+            DNSOperation(action="create", domain="a.com", record_type="A", content="192.0.2.2"),
+        ]
+        mock_piglet.dns.create.side_effect = ["1", RuntimeError("connection reset")]
+        tool_fn = await get_tool_fn(_register_dns(), "dns_bulk_apply")
+        first = await tool_fn(journal_context, operations=operations, concurrency=1)
+
+        with pytest.raises(ToolError, match=f"resume='{first.batch_id}'"):
+            await tool_fn(journal_context, operations=operations)
+
+        assert mock_piglet.dns.create.await_count == 2
+        mock_piglet.dns.create.side_effect = ["2"]
+        resumed = await tool_fn(journal_context, resume=first.batch_id)
+        assert resumed.resumed == 1
+
+    async def test_resume_unknown_batch(self, journal_context: MagicMock) -> None:
+        """Resuming needs the journal of an earlier call."""
+        tool_fn = await get_tool_fn(_register_dns(), "dns_bulk_apply")
+
+        with pytest.raises(ToolError, match="No interrupted batch"):
+            await tool_fn(journal_context, resume="0123456789abcdef")
+
+    async def test_journal_disabled(self, mock_context: MagicMock, mock_piglet: AsyncMock) -> None:
+        """Without a journal directory nothing is written and nothing can be resumed."""
+        mock_piglet.dns.delete.side_effect = RuntimeError("connection reset")
+        tool_fn = await get_tool_fn(_register_dns(), "dns_bulk_apply")
+
+        result = await tool_fn(
+            mock_context, operations=[DNSOperation(action="delete", domain="a.com", record_id="1")]
+        )
+
+        assert result.failed == 1
+        assert result.batch_id is None
+        with pytest.raises(ToolError, match="journal is disabled"):
+            await tool_fn(mock_context, resume="0123456789abcdef")
+
+
+class TestDNSSync:
+    """Tests for dns_sync tool."""
+
+    async def test_dry_run_plans_without_writing(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """A dry run returns the plan and sends no changes."""
+        mock_piglet.dns.list.return_value = [
+            make_mock_dns_record(id="1", content="192.0.2.1"),
+            make_mock_dns_record(id="2", record_type="TXT", name="example.com", content="old"),
+        ]
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_sync")
+
+        result = await tool_fn(
+            mock_context,
+            domain="example.com",
+            records=[
+                DNSDesiredRecord(record_type="A", name="www", content="192.0.2.1"),
+                DNSDesiredRecord(record_type="MX", content="mx.example.com"),
+            ],
+        )
+
+        assert isinstance(result, DNSSyncResult)
+        assert result.dry_run is True
+        assert result.unchanged == 1
+        assert [op.action for op in result.operations] == ["delete", "create"]
+        assert result.operations[1].priority == 10
+        assert result.applied is None
+        mock_piglet.dns.create.assert_not_called()
+        mock_piglet.dns.delete.assert_not_called()
+
+    async def test_apply_runs_deletes_before_writes(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Applying sends deletes first, then edits and creates."""
+        mock_piglet.dns.list.return_value = [
+            make_mock_dns_record(id="1", record_type="CNAME", name="www.example.com"),
+            make_mock_dns_record(id="2", record_type="A", name="api.example.com"),
+        ]
+        calls: list[str] = []
+        mock_piglet.dns.delete.side_effect = lambda *a: calls.append("delete")
+        mock_piglet.dns.edit.side_effect = lambda *a: calls.append("edit")
+        mock_piglet.dns.create.side_effect = lambda *a: calls.append("create") or "99"
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_sync")
+
+        result = await tool_fn(
+            mock_context,
+            domain="example.com",
+            records=[
+                DNSDesiredRecord(record_type="A", name="www", content="192.0.2.5"),
+                DNSDesiredRecord(record_type="A", name="api", content="192.0.2.6"),
+            ],
+            dry_run=False,
+        )
+
+        assert calls[0] == "delete"
+        assert sorted(calls[1:]) == ["create", "edit"]
+        assert result.applied is not None
+        assert result.applied.succeeded == 3
+
+    async def test_stop_on_error_skips_writes_after_failed_delete(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """A failed delete skips the writes when stop_on_error is set."""
+        mock_piglet.dns.list.return_value = [make_mock_dns_record(id="1", record_type="TXT")]
+        mock_piglet.dns.delete.side_effect = NotFoundError("gone")
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_sync")
+
+        result = await tool_fn(
+            mock_context,
+            domain="example.com",
+            records=[DNSDesiredRecord(record_type="A", content="192.0.2.1")],
+            dry_run=False,
+            stop_on_error=True,
+        )
+
+        assert [r.status for r in result.applied.results] == ["failed", "skipped"]
+        mock_piglet.dns.create.assert_not_called()
+
+    async def test_invalid_record_rejected(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Invalid desired records are reported before the zone is read."""
+        mcp = _register_dns()
+        tool_fn = await get_tool_fn(mcp, "dns_sync")
+
+        with pytest.raises(ToolError, match="record 0"):
+            await tool_fn(
+                mock_context,
+                domain="example.com",
+                records=[DNSDesiredRecord(record_type="A", content="not-an-ip")],
+            )
+
+        mock_piglet.dns.list.assert_not_called()
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from conftest import get_tool_fn, make_mock_domain
 from fastmcp import FastMCP
+from oinker import NotFoundError
 
 from porkbun_mcp.models import (
     DomainAvailability,
     DomainInfo,
+    DomainInventory,
     GlueRecord,
     GlueRecordCreated,
     Nameservers,
+    Page,
     URLForward,
     URLForwardCreated,
 )
@@ -43,6 +48,148 @@ class TestDomainsList:
         assert result[0].domain == "example.com"
         assert result[0].status == "ACTIVE"
 
+    async def test_domains_list_reports_progress_per_page(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Every listAll page is fetched and reported as progress."""
+        domains = [make_mock_domain(domain=f"d{i}.com") for i in range(1500)]
+        mock_piglet.domains.list.side_effect = lambda start=0: domains[start : start + 1000]
+        tool_fn = await get_tool_fn(_register_domains(), "domains_list")
+
+        result = await tool_fn(mock_context)
+
+        assert len(result) == 1500
+        progress = [c.args[0] for c in mock_context.report_progress.await_args_list]
+        assert progress == [1000, 1500, 1500]
+
+    async def test_domains_list_table_reports_progress_per_page(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Tables report the same per-page progress as objects."""
+        domains = [make_mock_domain(domain=f"d{i}.com") for i in range(1500)]
+        mock_piglet.domains.list.side_effect = lambda start=0: domains[start : start + 1000]
+        tool_fn = await get_tool_fn(_register_domains(), "domains_list")
+
+        await tool_fn(mock_context, format="table")
+
+        progress = [c.args[0] for c in mock_context.report_progress.await_args_list]
+        assert progress == [1000, 1500, 1500]
+
+    async def test_domains_list_progress_failure_is_not_mapped(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """A failing progress notification is not reported as a Porkbun error."""
+        mock_piglet.domains.list.side_effect = [[make_mock_domain()], []]
+        mock_context.report_progress.side_effect = RuntimeError("client went away")
+        tool_fn = await get_tool_fn(_register_domains(), "domains_list")
+
+        with pytest.raises(RuntimeError, match="client went away"):
+            await tool_fn(mock_context)
+
+
+class TestDomainsListPagination:
+    """Tests for domains_list pagination."""
+
+    async def test_pages_through_snapshot(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Pages cover every domain with a single upstream call."""
+        mock_piglet.domains.list.return_value = [
+            make_mock_domain(domain=f"d{i}.com") for i in range(5)
+        ]
+        tool_fn = await get_tool_fn(_register_domains(), "domains_list")
+
+        seen: list[str] = []
+        page = await tool_fn(mock_context, page_size=2)
+        while True:
+            assert isinstance(page, Page)
+            seen += [d.domain for d in page.items]
+            if page.next_cursor is None:
+                break
+            page = await tool_fn(mock_context, cursor=page.next_cursor)
+
+        assert seen == [f"d{i}.com" for i in range(5)]
+        mock_piglet.domains.list.assert_awaited_once()
+
+    async def test_table_pages(self, mock_context: MagicMock, mock_piglet: AsyncMock) -> None:
+        """Table pages leave out dates no domain has."""
+        mock_piglet.domains.list.return_value = [
+            make_mock_domain(domain=f"d{i}.com", auto_renew=False) for i in range(3)
+        ]
+        tool_fn = await get_tool_fn(_register_domains(), "domains_list")
+
+        first = await tool_fn(mock_context, page_size=2, format="table")
+        second = await tool_fn(mock_context, cursor=first.next_cursor, format="table")
+
+        assert first.columns == [
+            "domain",
+            "status",
+            "tld",
+            "security_lock",
+            "whois_privacy",
+            "auto_renew",
+        ]
+        assert first.rows[0] == ["d0.com", "ACTIVE", "com", True, True, False]
+        assert [r[0] for r in second.rows] == ["d2.com"]
+        assert second.total == 3
+
+
+class TestDomainsInventory:
+    """Tests for domains_inventory tool."""
+
+    async def test_inventory_for_all_domains(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """'all' expands to the account's domains and fetches each one."""
+        mock_piglet.domains.list.return_value = [
+            make_mock_domain(domain="a.com"),
+            make_mock_domain(domain="b.com"),
+        ]
+        mock_piglet.domains.get_nameservers.return_value = ["ns1.porkbun.com"]
+        mcp = _register_domains()
+        tool_fn = await get_tool_fn(mcp, "domains_inventory")
+
+        result = await tool_fn(mock_context, domains="all")
+
+        assert isinstance(result, DomainInventory)
+        assert [d.domain for d in result.domains] == ["a.com", "b.com"]
+        assert result.domains[0].nameservers == ["ns1.porkbun.com"]
+        assert result.domains[0].url_forwards == []
+        assert result.failed == 0
+
+    async def test_errors_reported_per_domain(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """One failing domain is reported inline without failing the call."""
+
+        async def nameservers(domain: str) -> list[str]:
+            if domain == "bad.com":
+                raise NotFoundError("Domain not found")
+            return ["ns1.porkbun.com"]
+
+        mock_piglet.domains.get_nameservers.side_effect = nameservers
+        mcp = _register_domains()
+        tool_fn = await get_tool_fn(mcp, "domains_inventory")
+
+        result = await tool_fn(mock_context, domains=["good.com", "bad.com"])
+
+        assert result.failed == 1
+        good, bad = result.domains
+        assert good.errors == []
+        assert bad.nameservers is None
+        assert bad.url_forwards == []
+        assert "Not found" in bad.errors[0]
+
+    async def test_cancellation_is_not_a_domain_error(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """A cancelled lookup cancels the call instead of being reported as data."""
+        mock_piglet.domains.get_url_forwards.side_effect = asyncio.CancelledError
+        tool_fn = await get_tool_fn(_register_domains(), "domains_inventory")
+
+        with pytest.raises(asyncio.CancelledError):
+            await tool_fn(mock_context, domains=["a.com"])
+
 
 class TestDomainsGetNameservers:
     """Tests for domains_get_nameservers tool."""
@@ -133,6 +280,11 @@ class TestDomainsGetUrlForwards:
         assert isinstance(result[0], URLForward)
         assert result[0].location == "https://example.org"
 
+        table = await tool_fn(mock_context, domain="example.com", format="table")
+
+        assert table.columns == ["id", "subdomain", "location", "type", "include_path", "wildcard"]
+        assert table.rows == [["123", "www", "https://example.org", "temporary", False, False]]
+
 
 class TestDomainsAddUrlForward:
     """Tests for domains_add_url_forward tool."""
@@ -0,0 +1,89 @@
+"""Tests for multi-domain fan-out helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from porkbun_mcp.fanout import DOMAIN_PAGE_SIZE, domain_pages, fan_out, resolve_domains
+from porkbun_mcp.upstream import Upstream
+
+
+def _account(total: int) -> AsyncMock:
+    """AsyncPiglet whose listAll serves ``total`` domains in 1000-domain chunks."""
+    domains = [SimpleNamespace(domain=f"d{i}.com") for i in range(total)]
+
+    async def list_page(start: int = 0) -> list[SimpleNamespace]:
+        await asyncio.sleep(0)
+        return domains[start : start + DOMAIN_PAGE_SIZE]
+
+    piglet = AsyncMock()
+    piglet.domains.list = AsyncMock(side_effect=list_page)
+    return piglet
+
+
+class TestDomainPages:
+    """Tests for domain_pages."""
+
+    async def test_follows_every_page_in_order(self) -> None:
+        """Pages continue until a short page and arrive in order."""
+        piglet = _account(2500)
+
+        pages = [page async for page in domain_pages(Upstream(piglet))]
+
+        assert [len(p) for p in pages] == [1000, 1000, 500]
+        assert pages[2][0].domain == "d2000.com"
+
+    async def test_exact_multiple_ends_on_empty_page(self) -> None:
+        """An empty page after full ones ends the listing without being yielded."""
+        piglet = _account(2000)
+
+        pages = [page async for page in domain_pages(Upstream(piglet), prefetch=1)]
+
+        assert [len(p) for p in pages] == [1000, 1000]
+        starts = [c.kwargs["start"] for c in piglet.domains.list.await_args_list]
+        assert starts == [0, 1000, 2000]
+
+    async def test_prefetches_before_yielding(self) -> None:
+        """Following pages are already requested when a full page is handed over."""
+        piglet = _account(5000)
+        pages = domain_pages(Upstream(piglet), prefetch=2)
+
+        await anext(pages)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert piglet.domains.list.await_count == 3
+        await pages.aclose()
+
+    async def test_resolve_all_reads_every_page(self) -> None:
+        """'all' includes domains beyond the first 1000."""
+        names = await resolve_domains(Upstream(_account(1001)), "all")
+
+        assert len(names) == 1001
+
+
+class TestFanOut:
+    """Tests for fan_out."""
+
+    async def test_limits_concurrency_and_keeps_order(self) -> None:
+        """No more than the limit run at once; results keep input order."""
+        running = peak = 0
+
+        async def fetch(domain: str) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            if domain == "bad":
+                raise ValueError(domain)
+            return domain.upper()
+
+        results = await fan_out(["a", "bad", "c", "d"], fetch, concurrency=2)
+
+        assert peak == 2
+        assert results[0] == "A"
+        assert isinstance(results[1], ValueError)
+        assert results[2:] == ["C", "D"]
@@ -0,0 +1,166 @@
+"""Tests for background jobs and the job tools."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from conftest import get_tool_fn
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+
+from porkbun_mcp.jobs import JobManager, Progress
+from porkbun_mcp.models import DNSOperation, JobInfo, JobResult
+from porkbun_mcp.tools.dns import register_dns_tools
+from porkbun_mcp.tools.jobs import register_job_tools
+
+
+async def _wait(manager: JobManager, job_id: str) -> None:
+    job = manager.get(job_id)
+    if job is not None and job.task is not None:
+        await asyncio.wait([job.task])
+
+
+class TestJobManager:
+    """Tests for JobManager."""
+
+    async def test_result_and_progress(self) -> None:
+        """A job records its progress and result."""
+        manager = JobManager()
+
+        async def work(progress: Progress) -> str:
+            progress.total = 2
+            progress.advance(2)
+            return "ok"
+
+        job = manager.submit("t", work)
+        assert job.state == "running"
+        await _wait(manager, job.id)
+
+        assert (job.state, job.result, job.progress.done) == ("succeeded", "ok", 2)
+        assert job.finished_at is not None
+
+    async def test_failure_is_formatted(self) -> None:
+        """Exceptions become failed jobs with a formatted error."""
+        manager = JobManager()
+
+        async def work(progress: Progress) -> None:
+            raise ValueError("boom")
+
+        job = manager.submit("t", work, format_error=lambda e: f"failed: {e}")
+        await _wait(manager, job.id)
+
+        assert (job.state, job.error) == ("failed", "failed: boom")
+
+    async def test_cancel(self) -> None:
+        """Cancelling stops a running job."""
+        manager = JobManager()
+        job = manager.submit("t", lambda progress: asyncio.sleep(60))
+
+        await manager.cancel(job.id)
+
+        assert job.state == "cancelled"
+
+    async def test_finished_jobs_evicted_lru(self) -> None:
+        """Only max_finished finished jobs are kept, least recently used first out."""
+        manager = JobManager(max_finished=2)
+
+        async def work(progress: Progress) -> None:
+            return None
+
+        ids = []
+        for _ in range(2):
+            job = manager.submit("t", work)
+            await _wait(manager, job.id)
+            ids.append(job.id)
+        manager.get(ids[0])
+        job = manager.submit("t", work)
+        await _wait(manager, job.id)
+
+        assert manager.get(ids[0]) is not None
+        assert manager.get(ids[1]) is None
+        assert len(manager) == 2
+
+    async def test_shutdown_cancels_running_jobs(self) -> None:
+        """Shutdown stops every running job."""
+        manager = JobManager()
+        job = manager.submit("t", lambda progress: asyncio.sleep(60))
+
+        await manager.shutdown()
+
+        assert job.state == "cancelled"
+
+
+class TestJobTools:
+    """Tests for background tool calls and the job tools."""
+
+    @pytest.fixture
+    def mcp(self) -> FastMCP:
+        mcp = FastMCP("test")
+        register_dns_tools(mcp)
+        register_job_tools(mcp)
+        return mcp
+
+    async def test_background_bulk_apply(
+        self, mcp: FastMCP, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """A background call returns a job whose result is the tool's result."""
+        release = asyncio.Event()
+
+        async def create(domain: str, record: object) -> str:
+            await release.wait()
+            return "99"
+
+        mock_piglet.dns.create.side_effect = create
+        bulk = await get_tool_fn(mcp, "dns_bulk_apply")
+        status = await get_tool_fn(mcp, "job_status")
+        result_fn = await get_tool_fn(mcp, "job_result")
+
+        job = await bulk(
+            mock_context,
+            operations=[
+                DNSOperation(action="create", domain="a.com", record_type="A", content="192.0.2.1")
+            ],
+            background=True,
+        )
+        assert isinstance(job, JobInfo)
+        running = await result_fn(mock_context, job_id=job.job_id)
+        assert (running.job.state, running.result) == ("running", None)
+
+        release.set()
+        await _wait(mock_context.request_context.lifespan_context.jobs, job.job_id)
+
+        info = await status(mock_context, job_id=job.job_id)
+        assert (info.state, info.done, info.total) == ("succeeded", 1, 1)
+        done = await result_fn(mock_context, job_id=job.job_id)
+        assert isinstance(done, JobResult)
+        assert done.result["succeeded"] == 1
+        assert done.result["results"][0]["record_id"] == "99"
+
+    async def test_failed_job_reports_tool_error(
+        self, mcp: FastMCP, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Errors in background work are reported like foreground tool errors."""
+        mock_piglet.domains.list.side_effect = RuntimeError("down")
+        list_many = await get_tool_fn(mcp, "dns_list_many")
+        status = await get_tool_fn(mcp, "job_status")
+
+        job = await list_many(mock_context, domains="all", background=True)
+        await _wait(mock_context.request_context.lifespan_context.jobs, job.job_id)
+
+        info = await status(mock_context, job_id=job.job_id)
+        assert info.state == "failed"
+        assert info.error == "Error during list domains: down"
+
+    async def test_cancel_and_unknown_job(self, mcp: FastMCP, mock_context: MagicMock) -> None:
+        """job_cancel stops a job; unknown IDs are rejected."""
+        jobs = mock_context.request_context.lifespan_context.jobs
+        job = jobs.submit("t", lambda progress: asyncio.sleep(60))
+        cancel = await get_tool_fn(mcp, "job_cancel")
+
+        info = await cancel(mock_context, job_id=job.id)
+
+        assert info.state == "cancelled"
+        with pytest.raises(ToolError, match="Unknown job"):
+            await cancel(mock_context, job_id="nope")
@@ -0,0 +1,175 @@
+"""Tests for the batch journal and resuming interrupted batches."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Literal
+from unittest.mock import AsyncMock
+
+import pytest
+from conftest import make_mock_dns_record
+from oinker import ARecord
+
+from porkbun_mcp.bulk import PlannedChange, settle_interrupted
+from porkbun_mcp.journal import BatchJournal, JournalState, batch_id
+from porkbun_mcp.models import DNSOperationResult
+from porkbun_mcp.upstream import Upstream
+
+OPERATIONS = [
+    {"action": "delete", "domain": "example.com", "record_id": "1"},
+    {"action": "delete", "domain": "example.com", "record_id": "2"},
+]
+
+
+def _result(
+    index: int, status: Literal["created", "failed"] = "created", record_id: str = "1"
+) -> DNSOperationResult:
+    return DNSOperationResult(
+        index=index, action="create", domain="example.com", status=status, record_id=record_id
+    )
+
+
+class TestBatchJournal:
+    """Tests for BatchJournal."""
+
+    def test_batch_id_is_stable(self) -> None:
+        """The same operations map to the same ID regardless of key order."""
+        assert batch_id([{"a": 1, "b": 2}]) == batch_id([{"b": 2, "a": 1}])
+        assert batch_id([{"a": 1}]) != batch_id([{"a": 2}])
+
+    async def test_replays_operations_started_and_done(self, tmp_path: Path) -> None:
+        """Loading returns the planned operations, started indexes and last results."""
+        journal = BatchJournal(tmp_path / "journal", "abc")
+        await journal.begin(OPERATIONS)
+        await journal.started(0)
+        await journal.done(_result(0, status="failed", record_id=""))
+        await journal.started(0)
+        await journal.done(_result(0))
+        await journal.started(1)
+        journal.close()
+
+        state = await BatchJournal(tmp_path / "journal", "abc").load()
+
+        assert state is not None
+        assert state.operations == OPERATIONS
+        assert state.started == {0, 1}
+        assert state.results[0].status == "created"
+        assert 1 not in state.results
+
+    async def test_begin_keeps_unfinished_run(self, tmp_path: Path) -> None:
+        """A batch whose journal is still there cannot start over."""
+        journal = BatchJournal(tmp_path, "abc")
+        await journal.begin(OPERATIONS)
+        await journal.started(0)
+        journal.close()
+
+        with pytest.raises(FileExistsError):
+            await BatchJournal(tmp_path, "abc").begin(OPERATIONS)
+
+        state = await journal.load()
+        assert state is not None
+        assert state.started == {0}
+
+    async def test_keeps_one_handle_open(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The file is opened once per batch, not once per entry."""
+        journal = BatchJournal(tmp_path, "abc")
+        opened: list[str] = []
+        open_file = Path.open
+
+        def tracking_open(self: Path, *args: Any, **kwargs: Any) -> Any:
+            opened.append(self.name)
+            return open_file(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "open", tracking_open)
+        await journal.begin(OPERATIONS)
+        for index in range(3):
+            await journal.started(index)
+            await journal.done(_result(index))
+
+        assert opened == ["abc.jsonl"]
+
+    async def test_torn_line_is_ignored(self, tmp_path: Path) -> None:
+        """A partial line left by a crash does not break replay."""
+        journal = BatchJournal(tmp_path, "abc")
+        await journal.begin(OPERATIONS)
+        await journal.started(0)
+        journal.close()
+        with journal.path.open("a") as f:
+            f.write('{"event": "done", "res')
+
+        state = await journal.load()
+
+        assert state is not None
+        assert state.started == {0}
+        assert state.results == {}
+
+    async def test_malformed_lines_are_ignored(self, tmp_path: Path) -> None:
+        """Entries missing fields or holding bad results are skipped like a torn line."""
+        journal = BatchJournal(tmp_path, "abc")
+        await journal.begin(OPERATIONS)
+        await journal.started(1)
+        journal.close()
+        with journal.path.open("a") as f:
+            f.write('{"event": "started"}\n')
+            f.write('{"event": "done", "result": {"index": 0}}\n')
+            f.write('["not", "an", "entry"]\n')
+            f.write('{"event": "started", "index": "zero"}\n')
+
+        state = await journal.load()
+
+        assert state is not None
+        assert state.operations == OPERATIONS
+        assert state.started == {1}
+        assert state.results == {}
+
+    async def test_finish_removes_journal(self, tmp_path: Path) -> None:
+        """A finished batch leaves nothing to resume."""
+        journal = BatchJournal(tmp_path, "abc")
+        await journal.begin(OPERATIONS)
+
+        journal.finish()
+
+        assert await journal.load() is None
+
+
+class TestSettleInterrupted:
+    """Tests for settle_interrupted."""
+
+    async def test_checks_in_doubt_changes_against_zone(self, mock_piglet: AsyncMock) -> None:
+        """In-flight creates and deletes count as done only if the zone shows it."""
+        mock_piglet.dns.list.return_value = [
+            make_mock_dns_record(id="50", name="www.example.com", content="192.0.2.1"),
+            make_mock_dns_record(id="9", name="old.example.com"),
+        ]
+        changes = [
+            PlannedChange(0, "create", "example.com", record=ARecord(content="192.0.2.9")),
+            PlannedChange(
+                1, "create", "example.com", record=ARecord(content="192.0.2.1", name="www")
+            ),
+            PlannedChange(2, "create", "example.com", record=ARecord(content="192.0.2.2")),
+            PlannedChange(3, "delete", "example.com", record_id="8"),
+            PlannedChange(4, "delete", "example.com", record_id="9"),
+            PlannedChange(5, "edit", "example.com", "7", ARecord(content="192.0.2.3")),
+            PlannedChange(6, "create", "example.com", record=ARecord(content="192.0.2.4")),
+        ]
+        state = JournalState(started={0, 1, 2, 3, 4, 5}, results={0: _result(0, record_id="40")})
+
+        settled = await settle_interrupted(Upstream(mock_piglet), changes, state)
+
+        assert {i: (r.status, r.record_id) for i, r in settled.items()} == {
+            0: ("created", "40"),
+            1: ("created", "50"),
+            3: ("deleted", "8"),
+        }
+        mock_piglet.dns.list.assert_awaited_once_with("example.com")
+
+    async def test_nothing_in_doubt_needs_no_lookup(self, mock_piglet: AsyncMock) -> None:
+        """Batches that were interrupted between operations cost no extra calls."""
+        changes = [PlannedChange(0, "delete", "example.com", record_id="8")]
+
+        settled = await settle_interrupted(Upstream(mock_piglet), changes, JournalState())
+
+        assert settled == {}
+        mock_piglet.dns.list.assert_not_called()
@@ -0,0 +1,150 @@
+"""Tests for metrics collection and the /metrics endpoint."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.client.transports import FastMCPTransport
+from fastmcp.exceptions import ToolError
+from oinker import APIError, NotFoundError, RateLimitError
+
+from porkbun_mcp.errors import error_category, handle_oinker_error
+from porkbun_mcp.metrics import Counter, Gauge, Histogram, Metrics
+from porkbun_mcp.middleware import MetricsMiddleware
+from porkbun_mcp.server import AppContext, create_server
+from porkbun_mcp.tools.dns import register_dns_tools
+from porkbun_mcp.upstream import Upstream
+
+
+class TestRender:
+    """Tests for the Prometheus text format."""
+
+    def test_counter_and_gauge(self) -> None:
+        """Samples are rendered with escaped labels after HELP and TYPE."""
+        counter = Counter("c_total", "A counter.", ["tool"])
+        counter.inc('say "hi"')
+        counter.inc('say "hi"', amount=2)
+        gauge = Gauge("g", "A gauge.")
+        gauge.inc()
+        gauge.dec()
+
+        assert counter.render() == [
+            "# HELP c_total A counter.",
+            "# TYPE c_total counter",
+            'c_total{tool="say \\"hi\\""} 3.0',
+        ]
+        assert gauge.render()[-1] == "g 0.0"
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Each bucket counts observations up to its bound, +Inf counts all."""
+        histogram = Histogram("h_seconds", "A histogram.", ["method"], buckets=[0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, "dns.list")
+
+        assert histogram.render()[2:] == [
+            'h_seconds_bucket{method="dns.list",le="0.1"} 2',
+            'h_seconds_bucket{method="dns.list",le="1.0"} 3',
+            'h_seconds_bucket{method="dns.list",le="+Inf"} 4',
+            'h_seconds_sum{method="dns.list"} 3.65',
+            'h_seconds_count{method="dns.list"} 4',
+        ]
+
+    def test_wrong_labels_rejected(self) -> None:
+        """Label values must match the declared label names."""
+        with pytest.raises(ValueError, match="expects labels"):
+            Counter("c_total", "A counter.", ["tool"]).inc()
+
+
+class TestErrorCategory:
+    """Tests for error_category."""
+
+    @pytest.mark.parametrize(
+        ("error", "category"),
+        [
+            (NotFoundError("gone"), "not_found"),
+            (RateLimitError("slow down"), "rate_limited"),
+            (APIError("oops", status_code=500), "api"),
+            (RuntimeError("boom"), "other"),
+            (ToolError("Invalid cursor"), "rejected"),
+        ],
+    )
+    def test_categories(self, error: Exception, category: str) -> None:
+        """Oinker errors map to the cases of handle_oinker_error."""
+        assert error_category(error) == category
+
+    def test_tool_error_uses_cause(self) -> None:
+        """A mapped ToolError is classified by the oinker error behind it."""
+        cause = NotFoundError("gone")
+        try:
+            raise handle_oinker_error(cause, "get DNS record") from cause
+        except ToolError as e:
+            assert error_category(e) == "not_found"
+
+
+class TestUpstreamMetrics:
+    """Tests for per-request upstream metrics."""
+
+    async def test_records_latency_errors_and_waits(self, mock_piglet: AsyncMock) -> None:
+        """Every request is timed and failures are counted by category."""
+        mock_piglet.dns.delete.side_effect = NotFoundError("gone")
+        upstream = Upstream(mock_piglet)
+        metrics = upstream.metrics
+
+        await upstream.call("dns.list", "example.com")
+        with pytest.raises(NotFoundError):
+            await upstream.call("dns.delete", "example.com", "1")
+
+        assert metrics.upstream_duration.count("dns.list") == 1
+        assert metrics.upstream_duration.count("dns.delete") == 1
+        assert metrics.upstream_errors.value("dns.delete", "not_found") == 1
+        assert metrics.upstream_in_flight.value("dns.list") == 0
+        assert metrics.rate_limit_wait.count("general") == 1
+
+
+class TestMetricsMiddleware:
+    """Tests for per-tool metrics."""
+
+    async def test_records_tool_calls(self, mock_piglet: AsyncMock) -> None:
+        """Tool calls are timed and failed calls counted by category."""
+        mock_piglet.dns.get.side_effect = NotFoundError("gone")
+        metrics = Metrics()
+
+        @asynccontextmanager
+        async def lifespan(mcp: FastMCP) -> AsyncIterator[AppContext]:
+            yield AppContext(piglet=mock_piglet, read_only=True, metrics=metrics)
+
+        mcp = FastMCP("test", lifespan=lifespan)
+        register_dns_tools(mcp)
+        mcp.add_middleware(MetricsMiddleware(metrics))
+
+        async with Client(FastMCPTransport(mcp)) as client:
+            await client.call_tool("dns_list", {"domain": "example.com"})
+            with pytest.raises(ToolError):
+                await client.call_tool("dns_get", {"domain": "example.com", "record_id": "1"})
+
+        assert metrics.tool_duration.count("dns_list") == 1
+        assert metrics.tool_errors.value("dns_get", "not_found") == 1
+        assert metrics.tool_in_flight.value("dns_get") == 0
+        assert metrics.upstream_duration.count("dns.get") == 1
+
+
+class TestMetricsEndpoint:
+    """Tests for the /metrics HTTP route."""
+
+    async def test_serves_prometheus_text(self) -> None:
+        """The HTTP app serves metrics next to the MCP endpoint."""
+        app = create_server().http_app()
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE porkbun_mcp_tool_duration_seconds histogram" in response.text
@@ -0,0 +1,43 @@
+"""Tests for converting upstream data to response models."""
+
+from __future__ import annotations
+
+from conftest import make_mock_dns_record
+
+from porkbun_mcp.models import DNSRecord
+from porkbun_mcp.tools.dns import _project, _to_dns_record
+
+
+class TestConverters:
+    """Tests for building response models without revalidation."""
+
+    def test_matches_validated_model(self) -> None:
+        record = make_mock_dns_record(record_type="MX", priority=10, notes="")
+
+        built = _to_dns_record(record)
+        validated = DNSRecord(
+            id="12345",
+            type="MX",
+            name="www.example.com",
+            content="192.0.2.1",
+            ttl=600,
+            priority=10,
+            notes="",
+        )
+
+        assert built == validated
+        assert built.model_dump_json() == validated.model_dump_json()
+        assert built.model_fields_set == validated.model_fields_set
+
+    def test_partial_record_serializes_only_given_fields(self) -> None:
+        [built] = _project([make_mock_dns_record()], ["name", "ttl"])
+
+        assert built.model_dump() == {"name": "www.example.com", "ttl": 600}
+        assert built.content is None
+
+    def test_instances_do_not_share_state(self) -> None:
+        first = _to_dns_record(make_mock_dns_record())
+        second = first.model_copy(update={"name": "mail.example.com"})
+
+        assert first.name == "www.example.com"
+        assert second.name == "mail.example.com"
@@ -0,0 +1,169 @@
+"""Tests for cursor pagination."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from conftest import make_mock_dns_record, make_mock_domain
+from fastmcp import Client, FastMCP
+from fastmcp.client.transports import FastMCPTransport
+from fastmcp.exceptions import ToolError
+
+from porkbun_mcp.pagination import SnapshotStore, decode_cursor, encode_cursor
+from porkbun_mcp.pricing_index import PricingIndex
+from porkbun_mcp.server import AppContext
+from porkbun_mcp.tools import register_tools
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSnapshotStore:
+    """Tests for SnapshotStore."""
+
+    async def test_pages_come_from_one_load(self) -> None:
+        """Later pages are sliced from the first page's snapshot."""
+        store = SnapshotStore()
+        load = AsyncMock(return_value=list(range(5)))
+
+        first = await store.page("t", None, 2, load)
+        second = await store.page("t", first.next_cursor, 2, load)
+        third = await store.page("t", second.next_cursor, 2, load)
+
+        assert [first.items, second.items, third.items] == [[0, 1], [2, 3], [4]]
+        assert first.total == 5
+        assert third.next_cursor is None
+        load.assert_awaited_once()
+
+    async def test_convert_applies_to_one_page(self) -> None:
+        """The snapshot keeps loaded items; only the returned page is converted."""
+        store = SnapshotStore()
+        converted = []
+
+        def convert(items: list[int]) -> list[str]:
+            converted.append(list(items))
+            return [str(i) for i in items]
+
+        first = await store.page("t", None, 2, AsyncMock(return_value=[1, 2, 3]), convert)
+        second = await store.page("t", first.next_cursor, 2, AsyncMock(), convert)
+
+        assert [first.items, second.items] == [["1", "2"], ["3"]]
+        assert converted == [[1, 2], [3]]
+
+    async def test_single_page_is_not_stored(self) -> None:
+        """A result that fits on one page needs no snapshot."""
+        store = SnapshotStore()
+
+        page = await store.page("t", None, 10, AsyncMock(return_value=[1, 2]))
+
+        assert page.next_cursor is None
+        assert len(store) == 0
+
+    async def test_expired_cursor(self) -> None:
+        """Cursors stop working once the snapshot expires."""
+        clock = FakeClock()
+        store = SnapshotStore(ttl=10, clock=clock)
+        first = await store.page("t", None, 1, AsyncMock(return_value=[1, 2]))
+
+        clock.now = 11
+        with pytest.raises(ToolError, match="expired"):
+            await store.page("t", first.next_cursor, 1, AsyncMock())
+
+    async def test_shared_result_is_reused_until_expiry(self) -> None:
+        """A shared result is loaded once per TTL and kept apart from paged snapshots."""
+        clock = FakeClock()
+        store = SnapshotStore(ttl=10, clock=clock)
+        load = AsyncMock(side_effect=[["a.com"], ["a.com", "b.com"]])
+
+        assert await store.shared("names", load) == ["a.com"]
+        assert await store.shared("names", load) == ["a.com"]
+        clock.now = 11
+        assert await store.shared("names", load) == ["a.com", "b.com"]
+        assert load.await_count == 2
+
+        with pytest.raises(ToolError, match="does not belong"):
+            await store.page("t", encode_cursor("shared:names", 0), 1, AsyncMock())
+
+    async def test_cursor_is_bound_to_scope(self) -> None:
+        """A cursor from one tool cannot be used with another."""
+        store = SnapshotStore()
+        first = await store.page("a", None, 1, AsyncMock(return_value=[1, 2]))
+
+        with pytest.raises(ToolError, match="does not belong"):
+            await store.page("b", first.next_cursor, 1, AsyncMock())
+
+    async def test_invalid_cursor(self) -> None:
+        """Garbage cursors are rejected."""
+        store = SnapshotStore()
+
+        with pytest.raises(ToolError, match="Invalid cursor"):
+            await store.page("t", "not a cursor!", 1, AsyncMock())
+
+    async def test_negative_offset_is_invalid(self) -> None:
+        """A crafted cursor cannot index the snapshot from the end."""
+        store = SnapshotStore()
+        first = await store.page("t", None, 2, AsyncMock(return_value=list(range(5))))
+        assert first.next_cursor is not None
+        snapshot_id, _ = decode_cursor(first.next_cursor)
+
+        with pytest.raises(ToolError, match="Invalid cursor"):
+            await store.page("t", encode_cursor(snapshot_id, -2), 2, AsyncMock())
+
+    async def test_oldest_snapshot_dropped_beyond_limit(self) -> None:
+        """Only the newest max_snapshots snapshots are kept."""
+        store = SnapshotStore(max_snapshots=1)
+        first = await store.page("t", None, 1, AsyncMock(return_value=[1, 2]))
+        await store.page("t", None, 1, AsyncMock(return_value=[3, 4]))
+
+        with pytest.raises(ToolError, match="expired"):
+            await store.page("t", first.next_cursor, 1, AsyncMock())
+        assert encode_cursor("x", 1) != encode_cursor("x", 2)
+
+
+class TestPaginatedTools:
+    """Pages returned through an MCP client."""
+
+    @pytest.mark.filterwarnings("error")
+    async def test_pages_serialize_as_declared(self, mock_piglet: AsyncMock) -> None:
+        """Pages are built with the tool's declared item type, so serializing warns nothing."""
+        mock_piglet.dns.list.return_value = [
+            make_mock_dns_record(id=str(i), name=f"h{i}.example.com") for i in range(3)
+        ]
+        mock_piglet.domains.list.side_effect = [
+            [make_mock_domain(f"d{i}.com") for i in range(3)],
+            [],
+        ]
+        prices = SimpleNamespace(registration="9.68", renewal="10.37", transfer="9.68")
+        pricing = PricingIndex(
+            snapshot_path=None, fetch=AsyncMock(return_value={"com": prices, "net": prices})
+        )
+
+        @asynccontextmanager
+        async def lifespan(mcp: FastMCP) -> AsyncIterator[AppContext]:
+            yield AppContext(piglet=mock_piglet, read_only=True, pricing=pricing)
+
+        mcp = FastMCP("test", lifespan=lifespan)
+        register_tools(mcp, ["dns", "domains", "pricing", "jobs"])
+
+        async with Client(FastMCPTransport(mcp)) as client:
+            records = await client.call_tool_mcp(
+                "dns_list", {"domain": "example.com", "page_size": 2}
+            )
+            domains = await client.call_tool_mcp("domains_list", {"page_size": 2})
+            tlds = await client.call_tool_mcp("pricing_get", {"page_size": 1})
+
+        for result, total in ((records, 3), (domains, 3), (tlds, 2)):
+            assert not result.is_error, result.content
+            assert result.structured_content is not None
+            page = result.structured_content["result"]
+            assert page["total"] == total
+            assert page["next_cursor"]
@@ -0,0 +1,261 @@
+"""Tests for the TLD pricing index and pricing tools."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from conftest import get_tool_fn
+from fastmcp import FastMCP
+from oinker import RateLimitError
+
+from porkbun_mcp.models import TLDPricing
+from porkbun_mcp.pricing_index import PricingIndex, _fetch_upstream, pricing_fetcher
+from porkbun_mcp.tools.pricing import register_pricing_tools
+
+PRICING = {
+    "com": SimpleNamespace(registration="9.68", renewal="10.37", transfer="9.68"),
+    "xyz": SimpleNamespace(registration="2.04", renewal="12.98", transfer="12.98"),
+    "top": SimpleNamespace(registration="1.99", renewal="4.99", transfer="4.99"),
+    "click": SimpleNamespace(registration="2.50", renewal="3.00", transfer="3.00"),
+    "weird": SimpleNamespace(registration="", renewal="", transfer=""),
+}
+
+
+def _index(
+    tmp_path: Path | None = None,
+    refresh_interval: float = 86400.0,
+    clock: Callable[[], float] = time.time,
+) -> tuple[PricingIndex, AsyncMock]:
+    fetch = AsyncMock(return_value=PRICING)
+    path = tmp_path / "pricing.json" if tmp_path else None
+    index = PricingIndex(
+        snapshot_path=path, refresh_interval=refresh_interval, fetch=fetch, clock=clock
+    )
+    return index, fetch
+
+
+class TestPricingIndex:
+    """Tests for PricingIndex."""
+
+    async def test_cheapest_renewals_under_limit(self) -> None:
+        """Range, sort and limit on the same price field."""
+        index, _ = _index()
+
+        entries = await index.query(
+            price_field="renewal", max_price=Decimal(5), sort_by="renewal", limit=2
+        )
+
+        assert [e.tld for e in entries] == ["click", "top"]
+
+    async def test_tld_filter_ignores_dots_and_unknowns(self) -> None:
+        """TLD filters accept '.com' and skip unknown TLDs."""
+        index, _ = _index()
+
+        entries = await index.query(tlds=[".com", "XYZ", "nope"], sort_by="registration")
+
+        assert [e.tld for e in entries] == ["xyz", "com"]
+
+    async def test_unparseable_prices_sort_last_and_fail_ranges(self) -> None:
+        """Entries without a numeric price sort last and never match a range."""
+        index, _ = _index()
+
+        by_price = await index.query(sort_by="transfer")
+        ranged = await index.query(min_price=Decimal(0))
+
+        assert by_price[-1].tld == "weird"
+        assert "weird" not in {e.tld for e in ranged}
+
+    async def test_fetches_once_within_refresh_interval(self) -> None:
+        """Repeated queries reuse the loaded pricing."""
+        index, fetch = _index()
+
+        await index.query()
+        await index.query(sort_by="tld")
+
+        fetch.assert_awaited_once()
+
+    async def test_refreshes_after_interval(self) -> None:
+        """Pricing is fetched again once the refresh interval passes."""
+        now = [1000.0]
+        index, fetch = _index(refresh_interval=60, clock=lambda: now[0])
+
+        await index.query()
+        now[0] += 61
+        await index.query()
+
+        assert fetch.await_count == 2
+
+    async def test_serves_stale_pricing_when_refresh_fails(self) -> None:
+        """A failed refresh keeps serving the previous pricing."""
+        now = [1000.0]
+        index, fetch = _index(refresh_interval=60, clock=lambda: now[0])
+        await index.query()
+        fetch.side_effect = RuntimeError("boom")
+        now[0] += 61
+
+        entries = await index.query()
+
+        assert len(entries) == len(PRICING)
+
+    async def test_snapshot_is_shared_between_indexes(self, tmp_path: Path) -> None:
+        """A second index loads the snapshot instead of fetching."""
+        first, _ = _index(tmp_path)
+        await first.query()
+        second, fetch = _index(tmp_path)
+
+        entries = await second.query(tlds=["com"])
+
+        fetch.assert_not_awaited()
+        assert entries[0].renewal_price == Decimal("10.37")
+        assert json.loads((tmp_path / "pricing.json").read_text())["version"] == 1
+
+    async def test_corrupt_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable snapshot falls back to fetching."""
+        (tmp_path / "pricing.json").write_text("{not json")
+        index, fetch = _index(tmp_path)
+
+        await index.query()
+
+        fetch.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "snapshot",
+        [
+            [],
+            {"version": 1},
+            {"version": 1, "pricing": {}},
+            {"version": 1, "fetched_at": 0, "pricing": []},
+            {"version": 1, "fetched_at": 0, "pricing": {"com": "9.73"}},
+            {"version": 1, "fetched_at": "soon", "pricing": {}},
+        ],
+    )
+    async def test_wrong_shape_snapshot_is_ignored(self, tmp_path: Path, snapshot: object) -> None:
+        """Valid JSON in the wrong shape is treated as a missing snapshot and replaced."""
+        (tmp_path / "pricing.json").write_text(json.dumps(snapshot))
+        index, fetch = _index(tmp_path)
+
+        entries = await index.query()
+
+        fetch.assert_awaited_once()
+        assert len(entries) == len(PRICING)
+        assert json.loads((tmp_path / "pricing.json").read_text())["version"] == 1
+
+
+class TestPricingFetcher:
+    """Tests for choosing where pricing is fetched from."""
+
+    def test_default_uses_oinker(self) -> None:
+        assert pricing_fetcher(None) is _fetch_upstream
+
+    async def test_base_url_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An API base URL override also applies to the pricing endpoint."""
+        urls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            urls.append(str(request.url))
+            prices = {"registration": "9.68", "renewal": "10.37", "transfer": "9.68"}
+            return httpx.Response(200, json={"status": "SUCCESS", "pricing": {"com": prices}})
+
+        client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx, "AsyncClient", lambda **kw: client(transport=httpx.MockTransport(handler), **kw)
+        )
+
+        pricing = await pricing_fetcher("http://fake/api/json/v3/")()
+
+        assert urls == ["http://fake/api/json/v3/pricing/get"]
+        assert pricing["com"].renewal == "10.37"
+
+    async def test_base_url_override_maps_errors(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Failures are raised as the same oinker errors as other Porkbun requests."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429, json={"status": "ERROR", "message": "Slow down"})
+
+        client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx, "AsyncClient", lambda **kw: client(transport=httpx.MockTransport(handler), **kw)
+        )
+
+        with pytest.raises(RateLimitError, match="Slow down"):
+            await pricing_fetcher("http://fake/api/json/v3")()
+
+
+class TestPricingGet:
+    """Tests for pricing_get tool."""
+
+    @pytest.fixture
+    def pricing_context(self, mock_context: MagicMock) -> MagicMock:
+        index, _ = _index()
+        mock_context.request_context.lifespan_context.pricing = index
+        return mock_context
+
+    async def test_pricing_get_filters_server_side(self, pricing_context: MagicMock) -> None:
+        """pricing_get returns only the requested rows."""
+        mcp = FastMCP("test")
+        register_pricing_tools(mcp)
+        tool_fn = await get_tool_fn(mcp, "pricing_get")
+
+        result = await tool_fn(
+            pricing_context, price_field="renewal", max_price=5, sort_by="renewal", limit=10
+        )
+
+        assert result == [
+            TLDPricing(tld="click", registration="2.50", renewal="3.00", transfer="3.00"),
+            TLDPricing(tld="top", registration="1.99", renewal="4.99", transfer="4.99"),
+        ]
+
+    async def test_pricing_get_without_filters_returns_everything(
+        self, pricing_context: MagicMock
+    ) -> None:
+        """pricing_get with no arguments keeps the full upstream list."""
+        mcp = FastMCP("test")
+        register_pricing_tools(mcp)
+        tool_fn = await get_tool_fn(mcp, "pricing_get")
+
+        result = await tool_fn(pricing_context)
+
+        assert [p.tld for p in result] == list(PRICING)
+
+    async def test_pricing_get_pages(self, pricing_context: MagicMock) -> None:
+        """page_size returns a page and its cursor yields the rest."""
+        mcp = FastMCP("test")
+        register_pricing_tools(mcp)
+        tool_fn = await get_tool_fn(mcp, "pricing_get")
+
+        first = await tool_fn(pricing_context, sort_by="tld", page_size=3)
+        second = await tool_fn(pricing_context, cursor=first.next_cursor, page_size=3)
+
+        assert first.total == 5
+        assert [p.tld for p in first.items + second.items] == sorted(PRICING)
+        assert second.next_cursor is None
+
+    async def test_pricing_get_table(self, pricing_context: MagicMock) -> None:
+        """format="table" pages rows built straight from the index entries."""
+        mcp = FastMCP("test")
+        register_pricing_tools(mcp)
+        tool_fn = await get_tool_fn(mcp, "pricing_get")
+
+        first = await tool_fn(
+            pricing_context,
+            price_field="renewal",
+            max_price=5,
+            sort_by="renewal",
+            page_size=1,
+            format="table",
+        )
+        second = await tool_fn(pricing_context, cursor=first.next_cursor, format="table")
+
+        assert first.columns == ["tld", "registration", "renewal", "transfer"]
+        assert first.rows + second.rows == [
+            ["click", "2.50", "3.00", "3.00"],
+            ["top", "1.99", "4.99", "4.99"],
+        ]
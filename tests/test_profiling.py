@@ -0,0 +1,84 @@
+"""Tests for per-call tool profiling."""
+
+from __future__ import annotations
+
+import pstats
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from fastmcp import Client, FastMCP
+from fastmcp.client.transports import FastMCPTransport
+
+from porkbun_mcp.middleware import ProfilingMiddleware
+from porkbun_mcp.profiling import ToolProfiler
+from porkbun_mcp.server import AppContext
+from porkbun_mcp.tools.dns import register_dns_tools
+
+
+def _profiled_functions(directory: Path) -> list[str]:
+    (path,) = directory.glob("*-dns_list-*.prof")
+    return [func for _, _, func in pstats.Stats(str(path)).stats]  # ty: ignore[unresolved-attribute]
+
+
+class TestToolProfiler:
+    """Tests for ToolProfiler."""
+
+    def test_selects_tools_and_samples(self, tmp_path: Path) -> None:
+        """Only listed tools are profiled, at the configured rate."""
+        draws = iter([0.7, 0.2])
+        profiler = ToolProfiler(
+            tmp_path, tools=["dns_list"], sample_rate=0.5, random=lambda: next(draws)
+        )
+
+        assert not profiler.should_profile("pricing_get")
+        assert not profiler.should_profile("dns_list")
+        assert profiler.should_profile("dns_list")
+
+    def test_one_profile_at_a_time(self, tmp_path: Path) -> None:
+        """A call is not profiled while another profile is running."""
+        profiler = ToolProfiler(tmp_path)
+
+        with profiler.profile("dns_list"):
+            assert not profiler.should_profile("dns_list")
+
+        assert profiler.should_profile("dns_list")
+
+    def test_writes_pstats_file(self, tmp_path: Path) -> None:
+        """Each profiled call produces a file readable by pstats."""
+        profiler = ToolProfiler(tmp_path / "profiles")
+
+        with profiler.profile("dns_list") as path:
+            sorted(range(1000), key=lambda i: -i)
+
+        assert path.parent == tmp_path / "profiles"
+        assert "<lambda>" in _profiled_functions(tmp_path / "profiles")
+        assert profiler.profiled == 1
+
+
+class TestProfilingMiddleware:
+    """Tests for ProfilingMiddleware."""
+
+    async def test_profiles_selected_tool_calls(
+        self, mock_piglet: AsyncMock, tmp_path: Path
+    ) -> None:
+        """Calls to selected tools are profiled; others run untouched."""
+        profiler = ToolProfiler(tmp_path, tools=["dns_list"])
+
+        @asynccontextmanager
+        async def lifespan(mcp: FastMCP) -> AsyncIterator[AppContext]:
+            yield AppContext(piglet=mock_piglet, read_only=True, profiler=profiler)
+
+        mcp = FastMCP("test", lifespan=lifespan)
+        register_dns_tools(mcp)
+        mcp.add_middleware(ProfilingMiddleware())
+
+        async with Client(FastMCPTransport(mcp)) as client:
+            await client.call_tool("dns_list", {"domain": "example.com"})
+            await client.call_tool(
+                "dns_get_by_name_type", {"domain": "example.com", "record_type": "A"}
+            )
+
+        assert profiler.profiled == 1
+        assert "dns_list" in _profiled_functions(tmp_path)
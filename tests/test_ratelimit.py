@@ -0,0 +1,140 @@
+"""Tests for the client-side rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from oinker import RateLimitError
+
+from porkbun_mcp.ratelimit import RateLimiter, TokenBucket
+from porkbun_mcp.upstream import Upstream, endpoint_class
+
+
+class FakeTime:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _bucket(time: FakeTime, rate: float, burst: float | None = None) -> TokenBucket:
+    return TokenBucket(rate, burst, clock=time.clock, sleep=time.sleep)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    async def test_burst_is_free_then_calls_are_spaced(self) -> None:
+        """Calls within the burst do not wait; later calls wait 1/rate."""
+        time = FakeTime()
+        bucket = _bucket(time, rate=2, burst=2)
+
+        waits = [await bucket.acquire(max_wait=10) for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 0.5, 0.5]
+        assert bucket.waits == 2
+
+    async def test_uncontended_calls_are_not_waits(self) -> None:
+        """Time passing during a call is not a wait when a token was free."""
+        ticks = iter(range(100))
+        bucket = TokenBucket(1000, burst=1000, clock=lambda: next(ticks) * 1e-6)
+
+        for _ in range(10):
+            await bucket.acquire(max_wait=10)
+
+        assert bucket.waits == 0
+        assert bucket.wait_seconds == 0
+
+    async def test_queued_callers_count_as_waits(self) -> None:
+        """A caller blocked behind another is counted even if a token is free."""
+        bucket = TokenBucket(10, burst=10)
+        await bucket._lock.acquire()
+
+        queued = asyncio.create_task(bucket.acquire(max_wait=10))
+        await asyncio.sleep(0)
+        bucket._lock.release()
+        await queued
+
+        assert bucket.waits == 1
+
+    async def test_raises_when_wait_exceeds_max_wait(self) -> None:
+        """A call that would queue too long fails with RateLimitError."""
+        time = FakeTime()
+        bucket = _bucket(time, rate=0.1)
+        await bucket.acquire(max_wait=1)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await bucket.acquire(max_wait=1)
+
+        assert exc_info.value.retry_after == pytest.approx(10)
+
+    async def test_retry_after_pauses_and_slows_bucket(self) -> None:
+        """A 429 halves the rate and pauses for retry_after."""
+        time = FakeTime()
+        bucket = _bucket(time, rate=10)
+
+        bucket.on_rate_limited(retry_after=3)
+        waited = await bucket.acquire(max_wait=10)
+
+        assert bucket.rate == 5
+        assert bucket.throttled == 1
+        assert waited == pytest.approx(3)
+
+    async def test_success_recovers_rate_up_to_maximum(self) -> None:
+        """Successes raise the rate back without exceeding the configured rate."""
+        bucket = TokenBucket(10)
+        bucket.on_rate_limited(retry_after=None)
+
+        for _ in range(50):
+            bucket.on_success()
+
+        assert bucket.rate == 10
+
+    async def test_waiters_are_served_in_order(self) -> None:
+        """Queued callers acquire tokens in FIFO order."""
+        bucket = TokenBucket(100, burst=1)
+        order: list[int] = []
+
+        async def take(i: int) -> None:
+            await bucket.acquire(max_wait=5)
+            order.append(i)
+
+        await asyncio.gather(*(take(i) for i in range(5)))
+
+        assert order == [0, 1, 2, 3, 4]
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter and its use by Upstream."""
+
+    def test_endpoint_classes(self) -> None:
+        """Operations map to check, general and write buckets."""
+        assert endpoint_class("domains.check") == "check"
+        assert endpoint_class("dns.list") == "general"
+        assert endpoint_class("dns.create") == "write"
+
+    def test_zero_rate_disables_bucket(self) -> None:
+        """A zero rate leaves that class unlimited."""
+        limiter = RateLimiter.from_rates({"general": 0, "write": 2}, max_wait=5)
+
+        assert set(limiter.buckets) == {"write"}
+
+    async def test_upstream_feeds_429s_to_bucket(self, mock_piglet: AsyncMock) -> None:
+        """Upstream reports RateLimitError to the bucket of the call."""
+        limiter = RateLimiter.from_rates({"write": 10}, max_wait=5)
+        mock_piglet.dns.create.side_effect = RateLimitError("slow down", retry_after=0)
+        upstream = Upstream(mock_piglet, limiter=limiter)
+
+        with pytest.raises(RateLimitError):
+            await upstream.call("dns.create", "example.com", object())
+
+        assert limiter.buckets["write"].throttled == 1
+        assert limiter.buckets["write"].rate == 5
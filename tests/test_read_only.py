@@ -6,10 +6,11 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from conftest import get_tool_fn
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from fastmcp.exceptions import ToolError
 
 from porkbun_mcp.context import get_read_only, require_writes
+from porkbun_mcp.models import DNSOperation
 from porkbun_mcp.server import AppContext
 from porkbun_mcp.tools.dns import register_dns_tools
 from porkbun_mcp.tools.dnssec import register_dnssec_tools
@@ -19,7 +20,7 @@ from porkbun_mcp.tools.domains import register_domain_tools
 @pytest.fixture
 def read_only_context(mock_piglet: AsyncMock) -> MagicMock:
     """Context in read-only mode."""
-    ctx = MagicMock()
+    ctx = MagicMock(spec=Context)
     ctx.request_context = MagicMock()
     ctx.request_context.lifespan_context = AppContext(piglet=mock_piglet, read_only=True)
     return ctx
@@ -100,6 +101,27 @@ class TestDNSWriteToolsBlocked:
         with pytest.raises(ToolError, match="read-only"):
             await tool_fn(read_only_context, domain="example.com", record_id="123")
 
+    async def test_dns_bulk_apply_blocked(self, read_only_context: MagicMock) -> None:
+        """dns_bulk_apply raises ToolError in read-only mode."""
+        mcp = FastMCP("test")
+        register_dns_tools(mcp)
+        tool_fn = await get_tool_fn(mcp, "dns_bulk_apply")
+
+        with pytest.raises(ToolError, match="read-only"):
+            await tool_fn(
+                read_only_context,
+                operations=[DNSOperation(action="delete", domain="example.com", record_id="1")],
+            )
+
+    async def test_dns_sync_apply_blocked(self, read_only_context: MagicMock) -> None:
+        """dns_sync raises ToolError in read-only mode unless it is a dry run."""
+        mcp = FastMCP("test")
+        register_dns_tools(mcp)
+        tool_fn = await get_tool_fn(mcp, "dns_sync")
+
+        with pytest.raises(ToolError, match="read-only"):
+            await tool_fn(read_only_context, domain="example.com", records=[], dry_run=False)
+
 
 class TestDomainWriteToolsBlocked:
     """Tests that domain write tools are blocked in read-only mode."""
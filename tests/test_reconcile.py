@@ -0,0 +1,107 @@
+"""Tests for the zone reconcile planner."""
+
+from __future__ import annotations
+
+from conftest import make_mock_dns_record
+
+from porkbun_mcp.reconcile import DesiredRecord, plan_sync
+
+
+def _actions(plan) -> list[tuple[str, str | None]]:
+    return [(op.action, op.record_id) for op in plan.operations]
+
+
+class TestPlanSync:
+    """Tests for plan_sync."""
+
+    def test_matching_zone_needs_no_changes(self) -> None:
+        """Records matching on name, type and content are left alone."""
+        current = [make_mock_dns_record(id="1", name="www.example.com", content="192.0.2.1")]
+        desired = [DesiredRecord("www", "A", "192.0.2.1", 600)]
+
+        plan = plan_sync("example.com", current, desired)
+
+        assert plan.operations == []
+        assert plan.unchanged == 1
+
+    def test_creates_and_deletes(self) -> None:
+        """Missing records are created and unlisted records deleted."""
+        current = [make_mock_dns_record(id="1", record_type="TXT", name="example.com")]
+        desired = [DesiredRecord("www", "A", "192.0.2.1", 600)]
+
+        plan = plan_sync("example.com", current, desired)
+
+        assert _actions(plan) == [("delete", "1"), ("create", None)]
+        assert plan.operations[0].name is None
+        assert plan.operations[1].name == "www"
+
+    def test_ttl_change_is_an_edit(self) -> None:
+        """A matching record with a different TTL is edited in place."""
+        current = [make_mock_dns_record(id="1", ttl=600)]
+        desired = [DesiredRecord("www", "A", "192.0.2.1", 3600)]
+
+        plan = plan_sync("example.com", current, desired)
+
+        assert _actions(plan) == [("edit", "1")]
+        assert plan.operations[0].ttl == 3600
+
+    def test_priority_only_compared_when_set(self) -> None:
+        """Priority differences trigger an edit only for types that have one."""
+        current = [
+            make_mock_dns_record(id="1", priority=0),
+            make_mock_dns_record(
+                id="2", record_type="MX", name="example.com", content="mx.example.com", priority=20
+            ),
+        ]
+        desired = [
+            DesiredRecord("www", "A", "192.0.2.1", 600),
+            DesiredRecord(None, "MX", "mx.example.com", 600, priority=10),
+        ]
+
+        plan = plan_sync("example.com", current, desired)
+
+        assert _actions(plan) == [("edit", "2")]
+        assert plan.unchanged == 1
+
+    def test_content_change_pairs_into_edit(self) -> None:
+        """A replaced record with the same name and type becomes one edit."""
+        current = [make_mock_dns_record(id="1", content="192.0.2.1")]
+        desired = [DesiredRecord("www", "A", "192.0.2.9", 600)]
+
+        plan = plan_sync("example.com", current, desired)
+
+        assert _actions(plan) == [("edit", "1")]
+        assert plan.operations[0].content == "192.0.2.9"
+
+    def test_names_compared_case_insensitively(self) -> None:
+        """Porkbun's record names match desired names regardless of case."""
+        current = [make_mock_dns_record(id="1", name="WWW.Example.com")]
+        desired = [DesiredRecord("www", "A", "192.0.2.1", 600)]
+
+        assert plan_sync("example.com", current, desired).operations == []
+
+    def test_duplicates_are_collapsed_and_extra_copies_deleted(self) -> None:
+        """Repeated desired records count once; duplicate live records are removed."""
+        current = [make_mock_dns_record(id="1"), make_mock_dns_record(id="2")]
+        desired = [DesiredRecord("www", "A", "192.0.2.1", 600)] * 2
+
+        plan = plan_sync("example.com", current, desired)
+
+        assert [op.action for op in plan.operations] == ["delete"]
+        assert plan.unchanged == 1
+
+    def test_apex_ns_records_are_ignored(self) -> None:
+        """Porkbun-managed apex NS records are never deleted."""
+        current = [
+            make_mock_dns_record(
+                id="1", record_type="NS", name="example.com", content="curitiba.ns.porkbun.com"
+            ),
+            make_mock_dns_record(
+                id="2", record_type="NS", name="sub.example.com", content="ns1.other.net"
+            ),
+        ]
+
+        plan = plan_sync("example.com", current, [])
+
+        assert _actions(plan) == [("delete", "2")]
+        assert plan.ignored == 1
@@ -0,0 +1,46 @@
+"""Tests for compact zone records."""
+
+from __future__ import annotations
+
+from conftest import make_mock_dns_record
+
+from porkbun_mcp.records import ZoneRecord, compact_zone
+
+
+class TestCompactZone:
+    """Tests for compact_zone."""
+
+    def test_keeps_every_field(self) -> None:
+        record = make_mock_dns_record(priority=10, notes="note", record_type="MX")
+
+        (compact,) = compact_zone([record])
+
+        assert compact == ZoneRecord(
+            id="12345",
+            name="www.example.com",
+            record_type="MX",
+            content="192.0.2.1",
+            ttl=600,
+            priority=10,
+            notes="note",
+        )
+
+    def test_repeated_values_are_shared(self) -> None:
+        """Equal names, types and TTLs across records are one object."""
+        records = [
+            make_mock_dns_record(
+                id=str(i),
+                name="".join(["_acme-challenge.", "example.com"]),
+                record_type="".join(["T", "XT"]),
+                content=f"token{i}",
+                ttl=int("3600"),
+            )
+            for i in range(2)
+        ]
+        assert records[0].name is not records[1].name
+
+        first, second = compact_zone(records)
+
+        assert first.name is second.name
+        assert first.record_type is second.record_type
+        assert first.ttl is second.ttl
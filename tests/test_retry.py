@@ -0,0 +1,200 @@
+"""Tests for retrying transient Porkbun API failures."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.client.transports import FastMCPTransport
+from oinker import APIError, NotFoundError, RateLimitError
+
+from porkbun_mcp.middleware import AttemptsMiddleware
+from porkbun_mcp.retry import RetryPolicy, is_transient
+from porkbun_mcp.server import AppContext, lifespan
+from porkbun_mcp.tools.dns import register_dns_tools
+from porkbun_mcp.upstream import LazyPiglet, Upstream
+
+
+async def _no_sleep(seconds: float) -> None:
+    pass
+
+
+def _policy(deadline: float = 30.0) -> RetryPolicy:
+    return RetryPolicy(max_attempts=3, deadline=deadline, sleep=_no_sleep)
+
+
+def _connection_error() -> APIError:
+    try:
+        raise APIError("Request failed after 4 attempts") from httpx.ConnectError("refused")
+    except APIError as e:
+        return e
+
+
+class TestIsTransient:
+    """Tests for is_transient."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            RateLimitError("slow down"),
+            APIError("bad gateway", status_code=502),
+            _connection_error(),
+            httpx.ReadTimeout("timed out"),
+        ],
+    )
+    def test_transient_errors(self, error: Exception) -> None:
+        """Rate limits, 5xx and connection errors are retried."""
+        assert is_transient(error)
+
+    @pytest.mark.parametrize(
+        "error",
+        [NotFoundError("gone"), APIError("bad request", status_code=400), ValueError("x")],
+    )
+    def test_permanent_errors(self, error: Exception) -> None:
+        """Client errors are not retried."""
+        assert not is_transient(error)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    async def test_retries_until_success(self) -> None:
+        """Transient failures are retried and the attempt count is returned."""
+        fn = AsyncMock(side_effect=[APIError("oops", status_code=503), "ok"])
+
+        result, attempts = await _policy().run(fn, retryable=True)
+
+        assert result == "ok"
+        assert attempts == 2
+
+    async def test_gives_up_after_max_attempts(self) -> None:
+        """The last error is raised once attempts run out."""
+        fn = AsyncMock(side_effect=APIError("oops", status_code=503))
+
+        with pytest.raises(APIError) as exc_info:
+            await _policy().run(fn, retryable=True)
+
+        assert fn.await_count == 3
+        assert getattr(exc_info.value, "attempts", None) == 3
+
+    async def test_not_retryable_runs_once(self) -> None:
+        """Non-idempotent calls are attempted exactly once."""
+        fn = AsyncMock(side_effect=APIError("oops", status_code=503))
+
+        with pytest.raises(APIError):
+            await _policy().run(fn, retryable=False)
+
+        assert fn.await_count == 1
+
+    async def test_deadline_stops_retries(self) -> None:
+        """No retry starts if its delay would pass the deadline."""
+        fn = AsyncMock(side_effect=RateLimitError("slow", retry_after=60))
+
+        with pytest.raises(RateLimitError):
+            await _policy(deadline=10).run(fn, retryable=True)
+
+        assert fn.await_count == 1
+
+    async def test_deadline_cuts_attempt_short(self) -> None:
+        """An attempt still running at the deadline is cancelled."""
+
+        async def hang() -> None:
+            await asyncio.sleep(10)
+
+        with pytest.raises(TimeoutError, match="deadline") as exc_info:
+            await _policy(deadline=0.05).run(hang, retryable=True)
+
+        assert getattr(exc_info.value, "attempts", None) == 1
+
+    async def test_slow_retries_share_the_deadline(self) -> None:
+        """Retries do not get a fresh deadline each; the whole call is bounded."""
+        calls = 0
+
+        async def slow_failure() -> None:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.03)
+            raise APIError("oops", status_code=503)
+
+        policy = RetryPolicy(max_attempts=3, base_delay=0, deadline=0.05, sleep=_no_sleep)
+        with pytest.raises(TimeoutError):
+            await policy.run(slow_failure, retryable=True)
+
+        assert calls == 2
+
+    def test_backoff_is_exponential_and_capped(self) -> None:
+        """Without jitter, delays double up to max_delay."""
+        policy = RetryPolicy(base_delay=1, max_delay=5, jitter=0)
+
+        assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+
+class TestLifespan:
+    """Tests for the client the server opens."""
+
+    async def test_oinker_does_not_retry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Retries are left to RetryPolicy, so oinker makes one request per attempt."""
+        monkeypatch.setenv("PORKBUN_API_KEY", "pk1_test")
+        monkeypatch.setenv("PORKBUN_SECRET_KEY", "sk1_test")
+        piglets: list[LazyPiglet] = []
+
+        def record(**options: object) -> LazyPiglet:
+            piglets.append(LazyPiglet(**options))
+            return piglets[-1]
+
+        monkeypatch.setattr("porkbun_mcp.server.LazyPiglet", record)
+
+        async with lifespan(FastMCP("test")):
+            pass
+
+        assert piglets[0]._options["max_retries"] == 0
+
+
+class TestUpstreamRetries:
+    """Tests for which operations Upstream retries."""
+
+    async def test_dns_create_is_never_retried(self, mock_piglet: AsyncMock) -> None:
+        """dns.create is attempted once even on a transient error."""
+        mock_piglet.dns.create.side_effect = APIError("oops", status_code=500)
+        upstream = Upstream(mock_piglet, retry=_policy())
+
+        with pytest.raises(APIError):
+            await upstream.call("dns.create", "example.com", object())
+
+        assert mock_piglet.dns.create.await_count == 1
+
+    async def test_dns_edit_is_retried(self, mock_piglet: AsyncMock) -> None:
+        """dns.edit is idempotent and retried."""
+        mock_piglet.dns.edit.side_effect = [APIError("oops", status_code=500), None]
+        upstream = Upstream(mock_piglet, retry=_policy())
+
+        await upstream.call("dns.edit", "example.com", "1", object())
+
+        assert mock_piglet.dns.edit.await_count == 2
+
+
+class TestAttemptsMiddleware:
+    """Tests for attempt counts in tool results."""
+
+    async def test_result_meta_reports_attempts(self, mock_piglet: AsyncMock) -> None:
+        """A retried read reports its attempts in the result metadata."""
+        mock_piglet.dns.list.side_effect = [APIError("oops", status_code=502), []]
+
+        @asynccontextmanager
+        async def lifespan(mcp: FastMCP) -> AsyncIterator[AppContext]:
+            yield AppContext(piglet=mock_piglet, read_only=True, retry=_policy())
+
+        mcp = FastMCP("test", lifespan=lifespan)
+        register_dns_tools(mcp)
+        mcp.add_middleware(AttemptsMiddleware())
+
+        async with Client(FastMCPTransport(mcp)) as client:
+            result = await client.call_tool("dns_list", {"domain": "example.com"})
+
+        assert result.meta is not None
+        assert result.meta["porkbun"] == {"attempts": 2, "upstream_calls": 1}
@@ -0,0 +1,235 @@
+"""Tests for the tool and prompt schema cache."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.client.transports import FastMCPTransport
+from fastmcp.tools import Tool
+
+from porkbun_mcp.config import PorkbunMCPSettings
+from porkbun_mcp.prompts import register_prompts
+from porkbun_mcp.schema_cache import SchemaCache, cache_key
+from porkbun_mcp.server import create_server
+from porkbun_mcp.tools import TOOL_GROUPS, register_tools
+
+
+def _register(cache: SchemaCache, groups: list[str] | None = None) -> FastMCP:
+    mcp = FastMCP("test")
+    register_tools(cache.registry(mcp), groups)
+    register_prompts(cache.registry(mcp), groups)
+    cache.save()
+    return mcp
+
+
+async def _definitions(mcp: FastMCP) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Tools and prompts of a server, as compared between registration paths."""
+    tools = {
+        t.name: (t.model_dump(exclude={"fn"}), t.return_type, t.to_mcp_tool().model_dump())
+        for t in await mcp.list_tools()
+    }
+    prompts = {
+        p.name: (p.model_dump(exclude={"fn"}), p.to_mcp_prompt().model_dump())
+        for p in await mcp.list_prompts()
+    }
+    return tools, prompts
+
+
+def _fresh() -> FastMCP:
+    """A server registered straight through FastMCP's decorators."""
+    mcp = FastMCP("live")
+    register_tools(mcp)
+    register_prompts(mcp)
+    return mcp
+
+
+def _tools(mcp: FastMCP) -> dict[str, Tool]:
+    return {t.name: t for t in asyncio.run(mcp.list_tools())}
+
+
+TOOL_NAMES = sorted(_tools(_fresh()))
+
+
+@pytest.fixture
+def path(schema_cache_path: Path) -> Path:
+    return schema_cache_path
+
+
+@pytest.fixture(scope="module")
+def tool_pairs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, tuple[Tool, Tool]]:
+    """Each tool as built from a warm cache, next to a fresh registration of it."""
+    path = tmp_path_factory.mktemp("schemas") / "schemas.json"
+    key = cache_key(list(TOOL_GROUPS))
+    _register(SchemaCache(path, key))
+    cache = SchemaCache(path, key)
+    cached = _tools(_register(cache))
+    assert cache.misses == 0
+    fresh = _tools(_fresh())
+    return {name: (cached[name], fresh[name]) for name in fresh}
+
+
+@pytest.fixture
+async def live() -> tuple[dict[str, Any], dict[str, Any]]:
+    """Definitions registered straight through FastMCP's decorators."""
+    return await _definitions(_fresh())
+
+
+class TestSchemaCache:
+    """Tests for SchemaCache."""
+
+    def test_generates_then_reuses(self, path: Path) -> None:
+        key = cache_key(list(TOOL_GROUPS))
+
+        first = SchemaCache(path, key)
+        _register(first)
+        second = SchemaCache(path, key)
+        _register(second)
+
+        assert first.hits == 0
+        assert first.misses > 0
+        assert second.hits == first.misses
+        assert second.misses == 0
+
+    async def test_matches_live_definitions(
+        self, path: Path, live: tuple[dict[str, Any], dict[str, Any]]
+    ) -> None:
+        """Generated and cached registrations equal FastMCP's own."""
+        key = cache_key(list(TOOL_GROUPS))
+
+        generated = await _definitions(_register(SchemaCache(path, key)))
+        cached = await _definitions(_register(SchemaCache(path, key)))
+
+        assert generated == live
+        assert cached == live
+
+    @pytest.mark.parametrize("name", TOOL_NAMES)
+    def test_cached_tool_schemas_match_fresh(
+        self, tool_pairs: dict[str, tuple[Tool, Tool]], name: str
+    ) -> None:
+        """Every cached tool has the input and output schema FastMCP generates."""
+        cached, fresh = tool_pairs[name]
+
+        assert cached.parameters == fresh.parameters
+        assert cached.output_schema == fresh.output_schema
+
+    @pytest.mark.parametrize(
+        ("target", "warm"),
+        [
+            ("ToolMeta", False),
+            ("PromptMeta", False),
+            ("FunctionTool", True),
+            ("FunctionPrompt", True),
+            ("TaskConfig", True),
+        ],
+    )
+    async def test_changed_internals_fall_back(
+        self,
+        path: Path,
+        live: tuple[dict[str, Any], dict[str, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+        target: str,
+        warm: bool,
+    ) -> None:
+        """If FastMCP internals no longer fit, tools register through FastMCP as usual."""
+        key = cache_key(list(TOOL_GROUPS))
+        if warm:
+            _register(SchemaCache(path, key))
+
+        def changed(*args: Any, **kwargs: Any) -> Any:
+            raise TypeError("unexpected keyword argument")
+
+        monkeypatch.setattr(f"porkbun_mcp.schema_cache.{target}", changed)
+        cache = SchemaCache(path, key)
+        registered = await _definitions(_register(cache))
+
+        assert registered == live
+        assert cache.path is None
+
+    async def test_missing_internals_fall_back(
+        self,
+        path: Path,
+        live: tuple[dict[str, Any], dict[str, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A FastMCP release without the internals disables the cache up front."""
+        monkeypatch.setattr(
+            "porkbun_mcp.schema_cache._INTERNALS_ERROR", ImportError("cannot import ToolMeta")
+        )
+
+        cache = SchemaCache(path, cache_key(list(TOOL_GROUPS)))
+        registered = await _definitions(_register(cache))
+
+        assert registered == live
+        assert cache.hits == 0
+        assert cache.path is None
+
+    async def test_cached_tools_validate_and_run(self) -> None:
+        """Tools built from the cache still validate arguments and run."""
+        create_server()
+        server = create_server()
+
+        async with Client(FastMCPTransport(server)) as client:
+            invalid = await client.call_tool_mcp(
+                "dns_list", {"domain": "example.com", "format": "xml"}
+            )
+            blocked = await client.call_tool_mcp(
+                "dns_create", {"domain": "example.com", "record_type": "A", "content": "192.0.2.1"}
+            )
+            prompt = await client.get_prompt(
+                "dns_setup", {"domain": "example.com", "server_ip": "192.0.2.1"}
+            )
+
+        assert invalid.is_error
+        assert "validation error" in str(invalid.content[0].text).lower()
+        assert blocked.is_error
+        assert "read-only" in str(blocked.content[0].text).lower()
+        assert "example.com" in str(prompt.messages[0].content.text)
+
+    def test_key_mismatch_regenerates(self, path: Path) -> None:
+        _register(SchemaCache(path, cache_key(["ping"])), ["ping"])
+
+        cache = SchemaCache(path, cache_key(["ping", "ssl"]))
+        _register(cache, ["ping", "ssl"])
+
+        assert cache.hits == 0
+        assert cache.misses == 2
+        assert json.loads(path.read_text())["key"]["groups"] == ["ping", "ssl"]
+
+    def test_unreadable_file_is_ignored(self, path: Path) -> None:
+        path.write_text("{not json")
+
+        cache = SchemaCache(path, cache_key(["ping"]))
+        _register(cache, ["ping"])
+
+        assert cache.misses == 1
+        assert "ping" in json.loads(path.read_text())["tools"]
+
+    def test_disabled_without_path(self, path: Path) -> None:
+        cache = SchemaCache(None, cache_key(["ping"]))
+        _register(cache, ["ping"])
+
+        assert cache.misses == 1
+        assert not path.exists()
+
+    def test_off_unless_configured(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Servers write no schema cache unless a path is configured."""
+        monkeypatch.delenv("PORKBUN_SCHEMA_CACHE_PATH")
+
+        assert PorkbunMCPSettings(_env_file=None).schema_cache_path is None
+
+    def test_key_tracks_sources(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Editing the package in a checkout invalidates the cache."""
+        package = tmp_path / "porkbun_mcp"
+        package.mkdir()
+        (package / "tools.py").write_text("A = 1\n")
+        monkeypatch.setattr("porkbun_mcp.schema_cache._PACKAGE_DIR", package)
+        before = cache_key(["ping"])
+
+        (package / "tools.py").write_text("A = 22\n")
+
+        assert cache_key(["ping"]) != before
@@ -0,0 +1,88 @@
+"""Tests for the DNS record search index."""
+
+from __future__ import annotations
+
+import ipaddress
+
+from conftest import make_mock_dns_record
+
+from porkbun_mcp.search_index import RecordIndex
+
+
+def _index() -> RecordIndex:
+    index = RecordIndex()
+    index.sync(
+        "example.com",
+        [
+            make_mock_dns_record(id="1", name="www.example.com", content="203.0.113.5"),
+            make_mock_dns_record(id="2", name="api.example.com", content="198.51.100.7", ttl=3600),
+            make_mock_dns_record(
+                id="3", record_type="AAAA", name="www.example.com", content="2001:db8::1"
+            ),
+            make_mock_dns_record(
+                id="4", record_type="CNAME", name="blog.example.com", content="Host.Example.NET"
+            ),
+        ],
+    )
+    index.sync(
+        "example.org",
+        [make_mock_dns_record(id="9", name="example.org", content="203.0.113.5")],
+    )
+    return index
+
+
+def _ids(matches) -> list[str]:
+    return [r.id for _, r in matches]
+
+
+class TestRecordIndex:
+    """Tests for RecordIndex."""
+
+    def test_exact_content_across_domains(self) -> None:
+        """Content lookups find the address in every domain."""
+        assert _ids(_index().search(content="203.0.113.5")) == ["1", "9"]
+
+    def test_content_is_normalised(self) -> None:
+        """IPv6 and hostnames match regardless of notation and case."""
+        index = _index()
+        assert _ids(index.search(content="2001:DB8:0::1")) == ["3"]
+        assert _ids(index.search(content="host.example.net")) == ["4"]
+
+    def test_cidr_range(self) -> None:
+        """CIDR lookups return addresses inside the range only."""
+        index = _index()
+        net = ipaddress.ip_network("203.0.113.0/24")
+        assert _ids(index.search(cidr=net)) == ["1", "9"]
+        assert _ids(index.search(cidr=ipaddress.ip_network("2001:db8::/32"))) == ["3"]
+
+    def test_name_glob_uses_suffix(self) -> None:
+        """Name globs match full names, with or without a literal suffix."""
+        index = _index()
+        assert _ids(index.search(name="*.example.com")) == ["2", "4", "1", "3"]
+        assert _ids(index.search(name="www.*")) == ["1", "3"]
+        assert _ids(index.search(name="example.org")) == ["9"]
+
+    def test_criteria_combine(self) -> None:
+        """Type, TTL and domain filters all have to match."""
+        index = _index()
+        assert _ids(index.search(record_type="a", min_ttl=1000)) == ["2"]
+        assert _ids(index.search(content="203.0.113.5", domains=["EXAMPLE.org"])) == ["9"]
+
+    def test_resync_replaces_domain(self) -> None:
+        """A refreshed zone replaces the domain's old records in every index."""
+        index = _index()
+        index.sync("example.com", [make_mock_dns_record(id="5", content="192.0.2.1")])
+
+        assert _ids(index.search(content="203.0.113.5")) == ["9"]
+        assert _ids(index.search(cidr=ipaddress.ip_network("192.0.2.0/24"))) == ["5"]
+        assert index.search(name="api.example.com") == []
+        assert len(index) == 2
+
+    def test_remove_drops_domain(self) -> None:
+        """Removing a domain drops all its records."""
+        index = _index()
+        index.remove("example.com")
+
+        assert index.domains == 1
+        assert _ids(index.search()) == ["9"]
+        assert _ids(index.search(cidr=ipaddress.ip_network("203.0.113.0/24"))) == ["9"]
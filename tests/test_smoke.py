@@ -6,11 +6,18 @@ requests. They use FastMCPTransport for in-memory testing without network IO.
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 from fastmcp import Client
 from fastmcp.client.transports import FastMCPTransport
 
 from porkbun_mcp.server import create_server
+from porkbun_mcp.tools import TOOL_GROUPS, select_tool_groups
+
+DNS_PROMPTS = {"dns_setup", "dns_audit", "email_dns_setup", "update_server_ip", "subdomain_setup"}
+JOB_TOOLS = {"job_status", "job_result", "job_cancel"}
 
 
 class TestServerInitialization:
@@ -36,6 +43,85 @@ class TestServerInitialization:
             assert "domains_list" in tool_names
             assert "pricing_get" in tool_names
 
+    def test_listing_tools_does_not_load_http_client(self) -> None:
+        """Startup and tool listing leave oinker and httpx unimported."""
+        script = """
+import asyncio, sys
+from fastmcp import Client
+from fastmcp.client.transports import FastMCPTransport
+from porkbun_mcp.server import create_server
+
+async def main():
+    async with Client(FastMCPTransport(create_server())) as client:
+        await client.list_tools()
+
+asyncio.run(main())
+print(",".join(m for m in ("oinker", "httpx") if m in sys.modules))
+"""
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
+
+
+class TestToolGroups:
+    """Smoke tests for serving a subset of tool groups."""
+
+    async def _listing(self, tools: str | list[str] | None = None) -> tuple[set[str], set[str]]:
+        async with Client(FastMCPTransport(create_server(tools=tools))) as client:
+            names = {t.name for t in await client.list_tools()}
+            prompts = {p.name for p in await client.list_prompts()}
+        return names, prompts
+
+    async def test_dns_only(self) -> None:
+        """Only DNS tools, the job tools they need and the DNS prompts are listed."""
+        tools, prompts = await self._listing(tools="dns")
+
+        assert tools - JOB_TOOLS
+        assert all(name.startswith("dns_") for name in tools - JOB_TOOLS)
+        assert tools >= JOB_TOOLS
+        assert prompts == DNS_PROMPTS
+
+    async def test_pricing_only(self) -> None:
+        """A group without prompts or jobs lists only its own tools."""
+        tools, prompts = await self._listing(tools="pricing")
+
+        assert tools == {"pricing_get"}
+        assert prompts == set()
+
+    async def test_combined_groups(self) -> None:
+        """Selected groups are combined."""
+        tools, _ = await self._listing(tools=["ping", "ssl", "stats"])
+
+        assert tools == {"ping", "ssl_retrieve", "server_stats"}
+
+    async def test_setting_selects_groups(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """PORKBUN_TOOLS applies when no groups are passed."""
+        monkeypatch.setenv("PORKBUN_TOOLS", "ping")
+
+        tools, _ = await self._listing()
+
+        assert tools == {"ping"}
+
+    async def test_default_lists_every_group(self) -> None:
+        """An empty selection serves everything."""
+        everything, _ = await self._listing()
+        selected, _ = await self._listing(tools="")
+
+        assert selected == everything
+        assert {"ping", "dns_list", "domains_list", "dnssec_list", "server_stats"} <= everything
+
+    def test_unknown_group(self) -> None:
+        """Unknown groups are rejected with the known ones."""
+        with pytest.raises(ValueError, match="Unknown tool groups: bogus. Choose from: ping"):
+            create_server(tools="dns,bogus")
+
+    def test_selection_order_and_requirements(self) -> None:
+        """Groups come back in registration order with their requirements."""
+        assert select_tool_groups(" pricing, domains ") == ["domains", "pricing", "jobs"]
+        assert select_tool_groups(None) == list(TOOL_GROUPS)
+
 
 class TestReadOnlyModeIntegration:
     """Smoke tests for read-only mode via MCP protocol."""
@@ -0,0 +1,60 @@
+"""Tests for tabular list results."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from porkbun_mcp.table import Column, column, to_table
+
+COLUMNS = [column("id"), column("label", "name"), column("notes", default="")]
+
+
+class TestToTable:
+    """Tests for to_table."""
+
+    def test_rows_follow_column_order(self) -> None:
+        """Each row holds the values in column order."""
+        items = [
+            SimpleNamespace(id="1", name="a", notes="x"),
+            SimpleNamespace(id="2", name="b", notes=""),
+        ]
+
+        table = to_table(items, COLUMNS)
+
+        assert table.columns == ["id", "label", "notes"]
+        assert table.rows == [["1", "a", "x"], ["2", "b", ""]]
+        assert table.total == 2
+        assert table.next_cursor is None
+
+    def test_columns_without_data_are_left_out(self) -> None:
+        """Columns holding only None or the default are dropped."""
+        items = [
+            SimpleNamespace(id="1", name=None, notes=""),
+            SimpleNamespace(id="2", name=None, notes=""),
+        ]
+
+        table = to_table(items, COLUMNS)
+
+        assert table.columns == ["id"]
+        assert table.rows == [["1"], ["2"]]
+
+    def test_computed_column(self) -> None:
+        """Columns can compute their value."""
+        table = to_table([SimpleNamespace(n=2)], [Column("double", lambda item: item.n * 2)])
+
+        assert table.rows == [[4]]
+
+    def test_page_of_a_larger_result(self) -> None:
+        """Total and cursor describe the whole result."""
+        table = to_table([SimpleNamespace(id="3", name="c", notes="")], COLUMNS, 10, "next")
+
+        assert table.total == 10
+        assert table.next_cursor == "next"
+
+    def test_empty(self) -> None:
+        """No items give no columns."""
+        table = to_table([], COLUMNS)
+
+        assert table.columns == []
+        assert table.rows == []
+        assert table.model_dump() == {"columns": [], "rows": [], "total": 0, "next_cursor": None}
@@ -0,0 +1,133 @@
+"""Tests for tool call tracing."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from conftest import make_mock_dns_record
+from fastmcp import Client, FastMCP
+from fastmcp.client.transports import FastMCPTransport
+
+from porkbun_mcp.middleware import TracingMiddleware
+from porkbun_mcp.server import AppContext
+from porkbun_mcp.tools.dns import register_dns_tools
+from porkbun_mcp.tracing import InMemoryExporter, JsonlExporter, Tracer, span
+
+
+class TestTracer:
+    """Tests for Tracer and span."""
+
+    def test_span_is_noop_outside_a_trace(self) -> None:
+        """Without an active trace, span records nothing."""
+        with span("convert") as s:
+            assert s is None
+
+    def test_nested_spans_share_trace(self) -> None:
+        """Child spans point at their parent and carry errors."""
+        exporter = InMemoryExporter()
+        tracer = Tracer(exporter)
+
+        with tracer.start("tool dns_list", tool="dns_list") as root:
+            with span("piglet.dns.list", method="dns.list"):
+                pass
+            with pytest.raises(ValueError), span("convert"):
+                raise ValueError("bad record")
+
+        child, failed, parent = exporter.spans
+        assert parent is root
+        assert (child.parent_id, failed.parent_id) == (root.span_id, root.span_id)
+        assert {child.trace_id, failed.trace_id} == {root.trace_id}
+        assert (failed.status, failed.error) == ("error", "ValueError: bad record")
+        assert child.attributes == {"method": "dns.list"}
+        assert root.duration is not None
+
+    def test_jsonl_exporter(self, tmp_path: Path) -> None:
+        """Each span is appended as one JSON line."""
+        exporter = JsonlExporter(tmp_path / "traces" / "trace.jsonl")
+        tracer = Tracer(exporter)
+
+        with tracer.start("tool ping"), span("piglet.ping"):
+            pass
+        exporter.close()
+
+        lines = [json.loads(line) for line in exporter.path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["piglet.ping", "tool ping"]
+        assert lines[0]["parent_id"] == lines[1]["span_id"]
+
+    def test_jsonl_exporter_writes_off_the_caller(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Exporting only queues the span; the file is opened and written by another thread."""
+        writers: list[str] = []
+        open_file = Path.open
+
+        def record_open(path: Path, *args: Any, **kwargs: Any) -> Any:
+            writers.append(threading.current_thread().name)
+            return open_file(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "open", record_open)
+        exporter = JsonlExporter(tmp_path / "trace.jsonl")
+
+        with Tracer(exporter).start("tool ping"):
+            pass
+        exporter.close()
+
+        assert writers == ["porkbun-trace-writer"]
+        assert json.loads(exporter.path.read_text())["name"] == "tool ping"
+
+    def test_jsonl_exporter_unwritable_path(self, tmp_path: Path) -> None:
+        """An unwritable trace file is logged, not raised into tool calls."""
+        (tmp_path / "traces").write_text("not a directory")
+        exporter = JsonlExporter(tmp_path / "traces" / "trace.jsonl")
+
+        with Tracer(exporter).start("tool ping"):
+            pass
+        exporter.close()
+
+
+class TestTracingMiddleware:
+    """Tests for traced tool calls."""
+
+    @staticmethod
+    def _server(mock_piglet: AsyncMock, tracer: Tracer) -> FastMCP:
+        @asynccontextmanager
+        async def lifespan(mcp: FastMCP) -> AsyncIterator[AppContext]:
+            yield AppContext(piglet=mock_piglet, read_only=True, tracer=tracer)
+
+        mcp = FastMCP("test", lifespan=lifespan)
+        register_dns_tools(mcp)
+        mcp.add_middleware(TracingMiddleware())
+        return mcp
+
+    async def test_tool_call_contains_upstream_calls(self, mock_piglet: AsyncMock) -> None:
+        """Porkbun requests and conversions are spans inside the tool call's span."""
+        mock_piglet.dns.list.return_value = [make_mock_dns_record()]
+        exporter = InMemoryExporter()
+        mcp = self._server(mock_piglet, Tracer(exporter))
+
+        async with Client(FastMCPTransport(mcp)) as client:
+            await client.call_tool("dns_list", {"domain": "example.com"})
+
+        spans = {s.name: s for s in exporter.spans}
+        root = spans["tool dns_list"]
+        assert spans["piglet.dns.list"].parent_id == root.span_id
+        assert spans["convert"].parent_id == root.span_id
+        assert spans["convert"].attributes == {"model": "DNSRecord", "count": 1}
+        assert {s.trace_id for s in exporter.spans} == {root.trace_id}
+
+    async def test_disabled_tracer_records_nothing(self, mock_piglet: AsyncMock) -> None:
+        """With tracing off, calls pass straight through and no span is created."""
+        mcp = self._server(mock_piglet, Tracer())
+
+        with patch("porkbun_mcp.tracing.Tracer.start") as start:
+            async with Client(FastMCPTransport(mcp)) as client:
+                await client.call_tool("dns_list", {"domain": "example.com"})
+
+        start.assert_not_called()
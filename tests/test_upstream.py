@@ -0,0 +1,177 @@
+"""Tests for the shared upstream call path."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from conftest import get_tool_fn
+from fastmcp import FastMCP
+
+from porkbun_mcp.tools.domains import register_domain_tools
+from porkbun_mcp.upstream import LazyPiglet, SingleFlight, Upstream
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    async def test_concurrent_identical_calls_share_one_request(self) -> None:
+        """Callers with the same key get one shared result."""
+        flight = SingleFlight()
+        started = 0
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            nonlocal started
+            started += 1
+            await release.wait()
+            return "zone"
+
+        tasks = [asyncio.create_task(flight.do("k", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["zone"] * 5
+        assert started == 1
+        assert flight.calls == 5
+        assert flight.coalesced == 4
+        assert flight.in_flight == 0
+
+    async def test_errors_reach_every_caller(self) -> None:
+        """All coalesced callers see the shared call's exception."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fail() -> None:
+            await release.wait()
+            raise RuntimeError("upstream down")
+
+        tasks = [asyncio.create_task(flight.do("k", fail)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        """Cancelling one waiter leaves the shared call running."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> int:
+            await release.wait()
+            return 1
+
+        first = asyncio.create_task(flight.do("k", fetch))
+        second = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == 1
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_sequential_calls_are_not_cached(self) -> None:
+        """A finished call is not reused by later callers."""
+        flight = SingleFlight()
+        fetch = AsyncMock(return_value=1)
+
+        await flight.do("k", fetch)
+        await flight.do("k", fetch)
+
+        assert fetch.await_count == 2
+        assert flight.coalesced == 0
+
+
+class TestLazyPiglet:
+    """Tests for LazyPiglet."""
+
+    @pytest.fixture
+    def opened(self, monkeypatch: pytest.MonkeyPatch) -> list[MagicMock]:
+        """Replace oinker's AsyncPiglet, recording every client created."""
+        created: list[MagicMock] = []
+
+        def factory(**options: object) -> MagicMock:
+            piglet = MagicMock()
+            piglet.options = options
+            piglet.__aenter__ = AsyncMock(return_value=piglet)
+            piglet.__aexit__ = AsyncMock(return_value=None)
+            piglet.ping = AsyncMock(return_value="203.0.113.1")
+            created.append(piglet)
+            return piglet
+
+        monkeypatch.setattr("oinker.AsyncPiglet", factory)
+        return created
+
+    async def test_opens_once_on_first_request(self, opened: list[MagicMock]) -> None:
+        """The client is created by the first request and reused after it."""
+        lazy = LazyPiglet(api_key="pk1_test")
+        upstream = Upstream(lazy)
+        assert opened == []
+
+        await upstream.call("ping")
+        await upstream.call("ping")
+
+        assert len(opened) == 1
+        assert opened[0].options == {"api_key": "pk1_test"}
+        opened[0].__aenter__.assert_awaited_once()
+        assert opened[0].ping.await_count == 2
+
+    async def test_aclose(self, opened: list[MagicMock]) -> None:
+        """Closing exits an opened client and is a no-op otherwise."""
+        lazy = LazyPiglet()
+        await lazy.aclose()
+
+        await lazy.get()
+        await lazy.aclose()
+        await lazy.aclose()
+
+        opened[0].__aexit__.assert_awaited_once_with(None, None, None)
+        assert len(opened) == 1
+
+
+class TestUpstream:
+    """Tests for Upstream."""
+
+    async def test_reads_are_coalesced_by_arguments(self, mock_piglet: AsyncMock) -> None:
+        """Concurrent reads with equal arguments hit the API once."""
+        upstream = Upstream(mock_piglet)
+
+        await asyncio.gather(
+            upstream.call("dns.list", "example.com"),
+            upstream.call("dns.list", "example.com"),
+            upstream.call("dns.list", "example.org"),
+        )
+
+        assert mock_piglet.dns.list.await_count == 2
+        assert upstream.flight.coalesced == 1
+
+    async def test_writes_are_never_coalesced(self, mock_piglet: AsyncMock) -> None:
+        """Concurrent identical writes each reach the API."""
+        upstream = Upstream(mock_piglet)
+
+        await asyncio.gather(
+            upstream.call("dns.delete", "example.com", "1"),
+            upstream.call("dns.delete", "example.com", "1"),
+        )
+
+        assert mock_piglet.dns.delete.await_count == 2
+        assert upstream.flight.calls == 0
+
+    async def test_tools_share_in_flight_reads(
+        self, mock_context: MagicMock, mock_piglet: AsyncMock
+    ) -> None:
+        """Concurrent domains_get_nameservers calls share one request."""
+        mock_piglet.domains.get_nameservers.return_value = ["ns1.example.net"]
+        mcp = FastMCP("test")
+        register_domain_tools(mcp)
+        tool_fn = await get_tool_fn(mcp, "domains_get_nameservers")
+
+        results = await asyncio.gather(
+            *(tool_fn(mock_context, domain="example.com") for _ in range(3))
+        )
+
+        assert all(r.nameservers == ["ns1.example.net"] for r in results)
+        mock_piglet.domains.get_nameservers.assert_awaited_once_with("example.com")